@@ -25,10 +25,27 @@ TODO: Customize tools for your specific graph schema
 """
 
 import os
+import re
+import time
+import asyncio
+import functools
+import hashlib
+import json
 import logging
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from fastmcp import FastMCP
-from neo4j import AsyncGraphDatabase, AsyncDriver
+from neo4j import AsyncGraphDatabase, AsyncDriver, AsyncSession, READ_ACCESS, WRITE_ACCESS
+from neo4j.graph import Node, Relationship, Path
+from neo4j.time import DateTime, Date, Time
+
+try:
+    import orjson  # Optional: C-speed JSON encoding for execute_cypher_json
+except ImportError:
+    orjson = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -43,9 +60,37 @@ NEO4J_USERNAME = os.getenv("NEO4J_USERNAME", "neo4j")
 NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD", "")
 NEO4J_DATABASE = os.getenv("NEO4J_DATABASE", "neo4j")
 
+# Connection pool tuning (defaults sized for concurrent MCP tool calls)
+NEO4J_POOL_SIZE = int(os.getenv("NEO4J_POOL_SIZE", "50"))
+NEO4J_ACQUISITION_TIMEOUT = float(os.getenv("NEO4J_ACQUISITION_TIMEOUT", "30"))
+NEO4J_MAX_CONNECTION_LIFETIME = float(os.getenv("NEO4J_MAX_CONNECTION_LIFETIME", "3600"))
+NEO4J_CONNECTION_TIMEOUT = float(os.getenv("NEO4J_CONNECTION_TIMEOUT", "10"))
+
+# Reject (instead of warn about) literal values spliced into query text
+STRICT_PARAMS = os.getenv("STRICT_PARAMS", "0") == "1"
+
+# Unlabeled `MATCH (n) RETURN n` without LIMIT: cap at MAX_UNBOUND_LIMIT, or reject if strict
+MAX_UNBOUND_LIMIT = int(os.getenv("MAX_UNBOUND_LIMIT", "1000"))
+STRICT_UNBOUNDED = os.getenv("STRICT_UNBOUNDED", "0") == "1"
+
+# Results larger than this are serialized off the event loop, one batch at a time
+SERIALIZE_BATCH_SIZE = int(os.getenv("SERIALIZE_BATCH_SIZE", "1000"))
+_serialize_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="serialize")
+
+# Labels that get a guid uniqueness constraint (+ backing index) at startup
+INDEXED_LABELS = tuple(
+    label.strip() for label in os.getenv("INDEXED_LABELS", "Customer,User,Project").split(",")
+    if label.strip()
+)
+
 # Global driver with lazy initialization
 driver: Optional[AsyncDriver] = None
 
+# Read-tool result cache: key -> (timestamp, ttl, key_labels, result)
+_SCHEMA_TTL = float(os.getenv("MCP_SCHEMA_CACHE_TTL", "60"))
+_TOOL_CACHE_MAXSIZE = 1024
+_tool_cache: Dict[Tuple, Tuple[float, float, Tuple[str, ...], Dict]] = {}
+
 
 async def get_driver() -> AsyncDriver:
     """Get or create Neo4j async driver"""
@@ -53,123 +98,681 @@ async def get_driver() -> AsyncDriver:
     if driver is None:
         driver = AsyncGraphDatabase.driver(
             NEO4J_URI,
-            auth=(NEO4J_USERNAME, NEO4J_PASSWORD)
+            auth=(NEO4J_USERNAME, NEO4J_PASSWORD),
+            max_connection_pool_size=NEO4J_POOL_SIZE,
+            connection_acquisition_timeout=NEO4J_ACQUISITION_TIMEOUT,
+            max_connection_lifetime=NEO4J_MAX_CONNECTION_LIFETIME,
+            connection_timeout=NEO4J_CONNECTION_TIMEOUT,
+            keep_alive=True
         )
         await driver.verify_connectivity()
-        logger.info("Connected to Neo4j")
+        logger.info(f"Connected to Neo4j (pool size: {NEO4J_POOL_SIZE})")
     return driver
 
 
+# Session shared by all queries within one tool call (see tool_with_session)
+_request_session: ContextVar[Optional[AsyncSession]] = ContextVar("_request_session", default=None)
+
+
+@asynccontextmanager
+async def scoped_session(access_mode: str = WRITE_ACCESS):
+    """
+    Yield the current tool call's session, opening one if none is active
+
+    Preferred way to get a session: nested helpers (execute_cypher, batch_write)
+    reuse the caller's session instead of paying per-session setup.
+    A session runs one transaction at a time - don't share it across asyncio.gather.
+
+    Args:
+        access_mode: READ_ACCESS routes to cluster followers, WRITE_ACCESS to the leader
+            (only applies when a new session is opened)
+    """
+    session = _request_session.get()
+    if session is not None:
+        yield session
+        return
+
+    driver = await get_driver()
+    async with driver.session(database=NEO4J_DATABASE, default_access_mode=access_mode) as session:
+        token = _request_session.set(session)
+        try:
+            yield session
+        finally:
+            _request_session.reset(token)
+
+
+def tool_with_session(fn):
+    """Run a tool inside one scoped_session shared by every query it issues"""
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        async with scoped_session():
+            return await fn(*args, **kwargs)
+    return wrapper
+
+
+def _freeze(value: Any) -> Any:
+    """Make tool arguments hashable for cache keys (lists -> tuples, dicts -> sorted items)"""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def cached_tool(ttl: float = 30, key_labels: Tuple[str, ...] = ()):
+    """
+    Cache successful read-tool results in-process for `ttl` seconds
+
+    Entries are keyed by tool name + arguments. invalidate(label) drops entries
+    whose key_labels include label; entries without key_labels (e.g. schema)
+    are dropped by every invalidate() call.
+
+    Usage (decorator goes below @app.tool()):
+        @app.tool()
+        @cached_tool(ttl=30, key_labels=("Customer", "Project"))
+        async def get_dashboard_metrics() -> Dict: ...
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            key = (fn.__name__, _freeze(args), _freeze(kwargs))
+            cached = _tool_cache.get(key)
+            if cached and time.monotonic() - cached[0] < cached[1]:
+                return cached[3]
+
+            result = await fn(*args, **kwargs)
+            if result.get("success"):
+                if len(_tool_cache) >= _TOOL_CACHE_MAXSIZE:
+                    _tool_cache.pop(next(iter(_tool_cache)))
+                _tool_cache[key] = (time.monotonic(), ttl, key_labels, result)
+            return result
+        return wrapper
+    return decorator
+
+
+def invalidate(label: Optional[str] = None):
+    """
+    Drop cached read-tool results (call from write tools after successful writes)
+
+    Args:
+        label: Node label written; None drops every entry
+    """
+    for key, (_, _, key_labels, _) in list(_tool_cache.items()):
+        if label is None or not key_labels or label in key_labels:
+            del _tool_cache[key]
+
+
+# Exact leaf types returned as-is (bulk of property values); type() lookup, no MRO walk
+_PRIMITIVE_TYPES = frozenset({int, float, str, bool, bytes, type(None)})
+
+
+# Serializer handlers: (value, stack) -> converted value. Containers are
+# copied in C (dict()/list()), which already leaves primitive children in place;
+# only composite children are pushed as (child, container, slot) for the main loop.
+
+
+def _push_composites(stack: list, container: Any, items: Any):
+    stack.extend((v, container, k) for k, v in items if type(v) not in _PRIMITIVE_TYPES)
+
+
+def _ser_node(value: Node, stack: list) -> Dict:
+    props = dict(value.items())
+    _push_composites(stack, props, props.items())
+    return {
+        "id": value.element_id,
+        "labels": list(value.labels),
+        "properties": props
+    }
+
+
+def _ser_rel(value: Relationship, stack: list) -> Dict:
+    props = dict(value.items())
+    _push_composites(stack, props, props.items())
+    return {
+        "id": value.element_id,
+        "type": value.type,
+        "start": value.start_node.element_id,
+        "end": value.end_node.element_id,
+        "properties": props
+    }
+
+
+def _ser_path(value: Path, stack: list) -> Dict:
+    nodes = [None] * len(value.nodes)
+    relationships = [None] * len(value.relationships)
+    stack.extend((n, nodes, i) for i, n in enumerate(value.nodes))
+    stack.extend((r, relationships, i) for i, r in enumerate(value.relationships))
+    return {"nodes": nodes, "relationships": relationships}
+
+
+@functools.lru_cache(maxsize=4096)
+def _iso_cached(value: Any, tzinfo: Any) -> str:
+    return value.isoformat()
+
+
+def _iso(value: Any) -> str:
+    """
+    isoformat() memoized: synced batches share many identical timestamps
+
+    tzinfo is part of the cache key: 12:00+00:00 and 13:00+01:00 are the same
+    instant (equal, same hash) but must not share a string.
+    """
+    return _iso_cached(value, getattr(value, "tzinfo", None))
+
+
+def _ser_temporal(value: Any, stack: list) -> str:
+    return _iso(value)
+
+
+def _ser_dict(value: Dict, stack: list) -> Dict:
+    out = dict(value)
+    _push_composites(stack, out, out.items())
+    return out
+
+
+def _ser_list(value: Any, stack: list) -> List:
+    out = list(value)
+    _push_composites(stack, out, enumerate(out))
+    return out
+
+
+def _ser_leaf(value: Any, stack: list) -> Any:
+    return value
+
+
+# Exact-type dispatch: one dict lookup instead of an isinstance chain.
+# Subclasses resolve via isinstance once, then are cached here.
+_DISPATCH: Dict[type, Callable[[Any, list], Any]] = {
+    Node: _ser_node,
+    Relationship: _ser_rel,
+    Path: _ser_path,
+    DateTime: _ser_temporal,
+    Date: _ser_temporal,
+    Time: _ser_temporal,
+    dict: _ser_dict,
+    list: _ser_list,
+    tuple: _ser_list,
+}
+
+
+def _resolve_handler(value_type: type) -> Callable[[Any, list], Any]:
+    """Find handler for a type not in _DISPATCH (subclass or unknown) and cache it"""
+    handler = _ser_leaf
+    for base, base_handler in list(_DISPATCH.items()):
+        if issubclass(value_type, base):
+            handler = base_handler
+            break
+    _DISPATCH[value_type] = handler
+    return handler
+
+
 def serialize_neo4j_value(value: Any) -> Any:
-    """Convert Neo4j objects to JSON-safe Python types"""
-    from neo4j.graph import Node, Relationship, Path
-    from neo4j.time import DateTime, Date, Time
+    """
+    Convert Neo4j objects to JSON-safe Python types
+
+    Iterative (explicit stack) rather than recursive: no call frame per nested
+    value and no RecursionError on deep paths. Each stack entry is
+    (value, parent container, slot) and the converted value is written into
+    the parent slot. Containers are pre-sized / pre-keyed so order is kept.
+    """
+    if type(value) in _PRIMITIVE_TYPES:
+        return value
+
+    root = [None]
+    stack = [(value, root, 0)]
+
+    while stack:
+        value, parent, slot = stack.pop()
+        value_type = type(value)
+
+        if value_type in _PRIMITIVE_TYPES:
+            parent[slot] = value
+            continue
+
+        handler = _DISPATCH.get(value_type) or _resolve_handler(value_type)
+        parent[slot] = handler(value, stack)
+
+    return root[0]
+
+
+def _serialize_records(records: List[Any]) -> List[Dict]:
+    """Serialize a batch of Neo4j records to JSON-safe dicts"""
+    return [{k: serialize_neo4j_value(v) for k, v in record.items()} for record in records]
+
 
+def _record_dicts(records: List[Any]) -> List[Dict]:
+    """Records as plain dicts with raw Neo4j values (converted by _json_default)"""
+    return [dict(record.items()) for record in records]
+
+
+def _json_default(value: Any) -> Any:
+    """JSON encoder hook for Neo4j types (same shapes as serialize_neo4j_value)"""
     if isinstance(value, Node):
         return {
             "id": value.element_id,
             "labels": list(value.labels),
-            "properties": {k: serialize_neo4j_value(v) for k, v in value.items()}
+            "properties": dict(value.items())
         }
-    elif isinstance(value, Relationship):
+    if isinstance(value, Relationship):
         return {
             "id": value.element_id,
             "type": value.type,
             "start": value.start_node.element_id,
             "end": value.end_node.element_id,
-            "properties": {k: serialize_neo4j_value(v) for k, v in value.items()}
-        }
-    elif isinstance(value, Path):
-        return {
-            "nodes": [serialize_neo4j_value(n) for n in value.nodes],
-            "relationships": [serialize_neo4j_value(r) for r in value.relationships]
+            "properties": dict(value.items())
         }
-    elif isinstance(value, (DateTime, Date, Time)):
-        return value.isoformat()
-    elif isinstance(value, dict):
-        return {k: serialize_neo4j_value(v) for k, v in value.items()}
-    elif isinstance(value, (list, tuple)):
-        return [serialize_neo4j_value(item) for item in value]
-    else:
-        return value
+    if isinstance(value, Path):
+        return {"nodes": list(value.nodes), "relationships": list(value.relationships)}
+    if isinstance(value, (DateTime, Date, Time)):
+        return _iso(value)
+    raise TypeError(f"Type {type(value).__name__} is not JSON serializable")
+
+
+def _dumps(value: Any) -> str:
+    """Encode to JSON in a single traversal (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(value, default=_json_default).decode()
+    return json.dumps(value, default=_json_default)
+
+
+# =============================================================================
+# QUERIES - Built once at import, byte-identical across calls
+# =============================================================================
+# Every tool references its Cypher here: no f-strings, filters go through
+# $parameters, so Neo4j's plan cache gets a hit on every call after the first.
+# Read-only mapping so query text can't drift at runtime.
+
+_QUERIES = MappingProxyType({
+    # Labels, relationship types and property keys in one round trip / one cached plan.
+    # Each collect() sits in its own ungrouped subquery, so empty lists still yield a row.
+    "get_schema": """
+CALL { CALL db.labels() YIELD label RETURN collect(label) AS labels }
+CALL { CALL db.relationshipTypes() YIELD relationshipType
+       RETURN collect(relationshipType) AS relationshipTypes }
+CALL { CALL db.propertyKeys() YIELD propertyKey RETURN collect(propertyKey) AS propertyKeys }
+RETURN labels, relationshipTypes, propertyKeys
+""",
+
+    # TODO: Add queries for your custom tools, e.g.:
+    # "get_dashboard_metrics": """
+    # MATCH (n:YourEntity)
+    # WHERE $status IS NULL OR n.status = $status
+    # RETURN count(n) as total
+    # """,
+})
 
 
 # =============================================================================
 # READ TOOLS - General Query Operations
 # =============================================================================
 
+# Literal compared/assigned in WHERE/SET/MATCH, e.g. WHERE c.guid = 'abc'
+_RE_LITERAL_IN_WHERE = re.compile(r"\b(?:WHERE|SET|MATCH)\b[^=]*=\s*(?:\d|['\"])", re.I)
+
+
+# Conservative write detection: any of these routes the query to the leader
+_WRITE_RE = re.compile(r"\b(?:CREATE|MERGE|DELETE|SET|REMOVE|DROP|FOREACH|LOAD\s+CSV|CALL)\b", re.I)
+
+_UNBOUNDED_RE = re.compile(r"MATCH\s*\(\s*\w*\s*\)\s*RETURN", re.I)
+_LIMIT_RE = re.compile(r"\bLIMIT\s+(?:\d+|\$\w+)", re.I)
+
+
+def _guard_unbounded(query: str, allow_unbounded: bool) -> Tuple[Optional[str], str]:
+    """
+    Bound full-graph scans (unlabeled MATCH ... RETURN without LIMIT)
+
+    Returns:
+        (error message or None, query to run - with LIMIT appended if capped)
+    """
+    if allow_unbounded or not _UNBOUNDED_RE.search(query) or _LIMIT_RE.search(query):
+        return None, query
+
+    if STRICT_UNBOUNDED:
+        return "Unlabeled full-graph MATCH requires LIMIT (or allow_unbounded=True)", query
+    logger.warning(f"Unbounded full scan, appending LIMIT {MAX_UNBOUND_LIMIT}")
+    # New line: a trailing // comment would otherwise swallow the LIMIT
+    return None, f"{query.rstrip().rstrip(';')}\nLIMIT {MAX_UNBOUND_LIMIT}"
+
+
+def _check_parameterized(query: str, parameters: Optional[Dict[str, Any]]) -> Optional[str]:
+    """
+    Detect literal values in query text when no $parameters are given
+
+    Literals make every call a distinct query string, defeating Neo4j's plan cache.
+
+    Returns:
+        Error message if STRICT_PARAMS=1 and literals found, otherwise None
+    """
+    if parameters or not _RE_LITERAL_IN_WHERE.search(query):
+        return None
+
+    message = "Literal values in query without $parameters defeat the plan cache"
+    if STRICT_PARAMS:
+        return message
+    logger.warning(f"{message}: {query[:200]}")
+    return None
+
+
+def _precheck(
+    query: str,
+    parameters: Optional[Dict[str, Any]],
+    allow_unbounded: bool
+) -> Tuple[Optional[Dict], str]:
+    """
+    Run query guards before dispatch
+
+    Returns:
+        (error response or None, query to run)
+    """
+    error = _check_parameterized(query, parameters)
+    if error:
+        return {"success": False, "error": error, "error_type": "LiteralInQuery"}, query
+
+    error, query = _guard_unbounded(query, allow_unbounded)
+    if error:
+        return {"success": False, "error": error, "error_type": "UnboundedQuery"}, query
+
+    return None, query
+
+
+async def _run_query(
+    query: str,
+    parameters: Optional[Dict[str, Any]],
+    timeout: int,
+    convert: Callable[[List[Any]], List[Any]],
+    access_mode: str = WRITE_ACCESS
+) -> Tuple[List[Any], Any]:
+    """
+    Run query in a timed transaction, converting streamed records in batches
+
+    Timeout is enforced server-side: Neo4j terminates the transaction.
+    Full batches are converted in the thread pool as they arrive, keeping the
+    event loop free; small tails are converted inline.
+
+    Returns:
+        (converted records, result summary)
+    """
+    async with scoped_session(access_mode) as session:
+        async with await session.begin_transaction(timeout=timeout) as tx:
+            result = await tx.run(query, parameters or {})
+
+            loop = asyncio.get_running_loop()
+            records, pending = [], []
+            async for record in result:
+                pending.append(record)
+                if len(pending) >= SERIALIZE_BATCH_SIZE:
+                    records.extend(
+                        await loop.run_in_executor(_serialize_executor, convert, pending)
+                    )
+                    pending = []
+            records.extend(convert(pending))
+            summary = await result.consume()
+            await tx.commit()
+
+    return records, summary
+
+
+def _error_response(e: Exception, timeout: int) -> Dict:
+    """Build the error shape shared by query tools"""
+    if "TransactionTimedOut" in (getattr(e, "code", None) or ""):
+        logger.warning(f"Query exceeded {timeout}s timeout")
+        return {
+            "success": False,
+            "error": f"Query exceeded {timeout}s timeout",
+            "error_type": "Timeout"
+        }
+    logger.error(f"Query execution failed: {e}")
+    return {
+        "success": False,
+        "error": str(e),
+        "error_type": type(e).__name__
+    }
+
+
+async def _execute(
+    query: str,
+    parameters: Optional[Dict[str, Any]],
+    timeout: int,
+    allow_unbounded: bool,
+    access_mode: str
+) -> Dict:
+    """Shared body of the execute_cypher* tools"""
+    error, query = _precheck(query, parameters, allow_unbounded)
+    if error:
+        return error
+
+    try:
+        records, summary = await _run_query(
+            query, parameters, timeout, _serialize_records, access_mode
+        )
+        if access_mode == WRITE_ACCESS:
+            invalidate()
+        return {
+            "success": True,
+            "records": records,
+            "count": len(records),
+            "summary": {
+                "query_type": summary.query_type,
+                "counters": dict(summary.counters)
+            }
+        }
+    except Exception as e:
+        return _error_response(e, timeout)
+
+
 @app.tool()
-async def execute_cypher(query: str, parameters: Optional[Dict[str, Any]] = None, timeout: int = 30) -> Dict:
+async def execute_cypher(
+    query: str,
+    parameters: Optional[Dict[str, Any]] = None,
+    timeout: int = 30,
+    allow_unbounded: bool = False
+) -> Dict:
     """
     Execute a Cypher query against the Neo4j database.
 
+    Routed as read or write based on the query text; prefer execute_cypher_read /
+    execute_cypher_write when the intent is known.
+
+    Use $parameters for values (e.g. "WHERE c.guid = $guid") rather than
+    literals in the query text. Always add a label and/or LIMIT: unlabeled
+    `MATCH (n) RETURN n` without LIMIT is capped (or rejected in strict mode).
+
     Args:
         query: Cypher query string
         parameters: Optional query parameters as dictionary
-        timeout: Query timeout in seconds (default: 30)
+        timeout: Query timeout in seconds, enforced by Neo4j (default: 30)
+        allow_unbounded: Allow unlabeled full-graph MATCH ... RETURN without LIMIT
 
     Returns:
         Dictionary with results and metadata
     """
-    try:
-        driver = await get_driver()
-        async with driver.session(database=NEO4J_DATABASE) as session:
-            result = await session.run(query, parameters or {})
-            records = await result.data()
-            summary = await result.consume()
+    access_mode = WRITE_ACCESS if _WRITE_RE.search(query) else READ_ACCESS
+    return await _execute(query, parameters, timeout, allow_unbounded, access_mode)
+
 
-            return {
-                "success": True,
-                "records": [serialize_neo4j_value(r) for r in records],
-                "count": len(records),
-                "summary": {
-                    "query_type": summary.query_type,
-                    "counters": dict(summary.counters)
-                }
+@app.tool()
+async def execute_cypher_read(
+    query: str,
+    parameters: Optional[Dict[str, Any]] = None,
+    timeout: int = 30,
+    allow_unbounded: bool = False
+) -> Dict:
+    """
+    Execute a read-only Cypher query (routed to cluster followers).
+
+    Same arguments and response as execute_cypher. Writes are rejected by Neo4j.
+
+    Returns:
+        Dictionary with results and metadata
+    """
+    return await _execute(query, parameters, timeout, allow_unbounded, READ_ACCESS)
+
+
+@app.tool()
+async def execute_cypher_write(
+    query: str,
+    parameters: Optional[Dict[str, Any]] = None,
+    timeout: int = 30
+) -> Dict:
+    """
+    Execute a write Cypher query (routed to the cluster leader).
+
+    Same arguments and response as execute_cypher. Invalidates cached read results.
+
+    Returns:
+        Dictionary with results and metadata
+    """
+    return await _execute(query, parameters, timeout, True, WRITE_ACCESS)
+
+
+@app.tool()
+async def execute_cypher_json(
+    query: str,
+    parameters: Optional[Dict[str, Any]] = None,
+    timeout: int = 30,
+    allow_unbounded: bool = False
+) -> str:
+    """
+    Execute a Cypher query and return the response as JSON text.
+
+    Same arguments and response shape as execute_cypher, but encoded in one
+    pass (orjson if installed) instead of building dicts the MCP layer
+    re-encodes. Prefer for large result sets.
+
+    Returns:
+        JSON string with results and metadata
+    """
+    error, query = _precheck(query, parameters, allow_unbounded)
+    if error:
+        return _dumps(error)
+
+    access_mode = WRITE_ACCESS if _WRITE_RE.search(query) else READ_ACCESS
+    try:
+        records, summary = await _run_query(query, parameters, timeout, _record_dicts, access_mode)
+        if access_mode == WRITE_ACCESS:
+            invalidate()
+        response = {
+            "success": True,
+            "records": records,
+            "count": len(records),
+            "summary": {
+                "query_type": summary.query_type,
+                "counters": dict(summary.counters)
             }
-    except Exception as e:
-        logger.error(f"Query execution failed: {e}")
-        return {
-            "success": False,
-            "error": str(e),
-            "error_type": type(e).__name__
         }
+        if len(records) >= SERIALIZE_BATCH_SIZE:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(_serialize_executor, _dumps, response)
+        return _dumps(response)
+    except Exception as e:
+        return _dumps(_error_response(e, timeout))
 
 
 @app.tool()
+@cached_tool(ttl=_SCHEMA_TTL)
 async def get_schema() -> Dict:
     """
     Get comprehensive graph schema information.
 
+    Results are cached for MCP_SCHEMA_CACHE_TTL seconds (default: 60).
+
     Returns:
         Dictionary with node labels, relationship types, and property keys
     """
     try:
-        driver = await get_driver()
-        async with driver.session(database=NEO4J_DATABASE) as session:
-            # Get all node labels
-            labels_result = await session.run("CALL db.labels()")
-            labels = [record["label"] async for record in labels_result]
-
-            # Get all relationship types
-            rels_result = await session.run("CALL db.relationshipTypes()")
-            relationship_types = [record["relationshipType"] async for record in rels_result]
-
-            # Get all property keys
-            props_result = await session.run("CALL db.propertyKeys()")
-            property_keys = [record["propertyKey"] async for record in props_result]
-
-            return {
-                "success": True,
-                "node_labels": labels,
-                "relationship_types": relationship_types,
-                "property_keys": property_keys
-            }
+        async with scoped_session(READ_ACCESS) as session:
+            result = await session.run(_QUERIES["get_schema"])
+            record = await result.single()
+
+        return {
+            "success": True,
+            "node_labels": record["labels"],
+            "relationship_types": record["relationshipTypes"],
+            "property_keys": record["propertyKeys"]
+        }
     except Exception as e:
         logger.error(f"Schema retrieval failed: {e}")
         return {"success": False, "error": str(e)}
 
 
+# =============================================================================
+# WRITE TOOLS - Batched Writes
+# =============================================================================
+
+_COUNTER_FIELDS = (
+    "nodes_created", "nodes_deleted",
+    "relationships_created", "relationships_deleted",
+    "properties_set", "labels_added", "labels_removed"
+)
+
+
+async def batch_write(template: str, rows: List[Dict[str, Any]], chunk_size: int = 1000) -> Dict:
+    """
+    Write many rows with one UNWIND query per chunk (single transaction)
+
+    Use for any custom write tool instead of one session.run per row.
+
+    Example:
+        await batch_write(
+            "MERGE (c:Customer {guid: row.guid}) SET c.name = row.name",
+            [{"guid": "c-1", "name": "Acme"}, {"guid": "c-2", "name": "Globex"}]
+        )
+
+    Args:
+        template: Cypher fragment referencing each row as `row`
+        rows: List of parameter maps
+        chunk_size: Rows per UNWIND (default: 1000)
+
+    Returns:
+        Dictionary with rows written and aggregated counters
+    """
+    query = f"UNWIND $rows AS row {template}"
+    counters = dict.fromkeys(_COUNTER_FIELDS, 0)
+
+    async with scoped_session() as session:
+        async with await session.begin_transaction() as tx:
+            for i in range(0, len(rows), chunk_size):
+                result = await tx.run(query, {"rows": rows[i:i + chunk_size]})
+                summary = await result.consume()
+                for field in _COUNTER_FIELDS:
+                    counters[field] += getattr(summary.counters, field)
+            await tx.commit()
+
+    # Write-through: cached reads (incl. schema) may now be stale
+    invalidate()
+
+    return {"rows": len(rows), "counters": counters}
+
+
+@app.tool()
+async def batch_execute_cypher(
+    query: str, rows: List[Dict[str, Any]], chunk_size: int = 1000
+) -> Dict:
+    """
+    Execute a write query once per row using UNWIND batching.
+
+    The query is prefixed with `UNWIND $rows AS row`, so reference row values
+    as `row.<field>` (e.g. "MERGE (c:Customer {guid: row.guid}) SET c.name = row.name").
+
+    Args:
+        query: Cypher fragment using `row`
+        rows: List of parameter maps, one per row
+        chunk_size: Rows per UNWIND batch (default: 1000)
+
+    Returns:
+        Dictionary with rows written and aggregated counters
+    """
+    try:
+        return {"success": True, **await batch_write(query, rows, chunk_size)}
+    except Exception as e:
+        logger.error(f"Batch write failed: {e}")
+        return {
+            "success": False,
+            "error": str(e),
+            "error_type": type(e).__name__
+        }
+
+
 # =============================================================================
 # TODO: Add your custom tools here
 # =============================================================================
@@ -182,9 +785,11 @@ async def get_schema() -> Dict:
 # - find_paths() - Path finding between entities
 # - search_{entity}() - Search entities by properties
 
-# TODO: Implement custom tools following this pattern:
+# TODO: Implement custom tools following this pattern
+# (@tool_with_session: all execute_cypher calls inside share one session):
 #
 # @app.tool()
+# @tool_with_session
 # async def get_dashboard_metrics(filters: Optional[Dict] = None) -> Dict:
 #     """
 #     Get dashboard KPIs for {PROJECT_NAME}.
@@ -195,22 +800,43 @@ async def get_schema() -> Dict:
 #     Returns:
 #         Dictionary with dashboard metrics
 #     """
-#     query = """
-#     // TODO: Write your Cypher query here
-#     MATCH (n:YourEntity)
-#     RETURN count(n) as total
-#     """
-#     return await execute_cypher(query)
+#     # Query text lives in _QUERIES; pass filters as parameters
+#     params = {"status": (filters or {}).get("status")}
+#     return await execute_cypher(_QUERIES["get_dashboard_metrics"], params)
 
 
 # =============================================================================
 # LIFECYCLE HOOKS
 # =============================================================================
 
+async def _ensure_guid_constraints():
+    """
+    Create guid uniqueness constraints for INDEXED_LABELS (idempotent)
+
+    A uniqueness constraint builds its own index, so MATCH by guid is an index
+    seek instead of a label scan. Names match migration_001 so both stay no-ops.
+    """
+    async with scoped_session() as session:
+        for label in INDEXED_LABELS:
+            try:
+                result = await session.run(
+                    f"CREATE CONSTRAINT {label}_guid_unique IF NOT EXISTS "
+                    f"FOR (n:{label}) REQUIRE n.guid IS UNIQUE"
+                )
+                await result.consume()
+            except Exception as e:
+                logger.warning(f"Could not ensure {label}.guid constraint: {e}")
+
+
 @app.on_startup()
 async def startup():
     """Initialize on server startup"""
     await get_driver()
+    await _ensure_guid_constraints()
+    query_hashes = ", ".join(
+        f"{name}={hashlib.sha1(query.encode()).hexdigest()[:8]}" for name, query in _QUERIES.items()
+    )
+    logger.info(f"Prepared queries (plan cache keys stable): {query_hashes}")
     logger.info("{PROJECT_NAME} MCP server started")
 
 
@@ -221,3 +847,4 @@ async def shutdown():
     if driver:
         await driver.close()
         logger.info("Neo4j connection closed")
+    _serialize_executor.shutdown(wait=False)
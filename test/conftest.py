@@ -20,7 +20,7 @@ from unittest.mock import Mock, MagicMock
 from neo4j import GraphDatabase
 
 # TODO: Update import paths to match your project structure
-from {project}_sync.config import {API}Config, Neo4jConfig, SyncConfig
+from {project}_sync.config import {API}Config, Neo4jConfig, SyncConfig, _clear_env_cache
 from {project}_sync.{api}_client import {API}Client
 
 
@@ -28,16 +28,16 @@ from {project}_sync.{api}_client import {API}Client
 # Configuration Fixtures
 # =============================================================================
 
-@pytest.fixture
-def api_config():
-    """
-    Fixture providing API configuration
+@pytest.fixture(autouse=True)
+def _reset_env_cache():
+    """Clear memoized env lookups so monkeypatch.setenv takes effect per test"""
+    _clear_env_cache()
+    yield
+    _clear_env_cache()
 
-    TODO: Customize for your API authentication method
 
-    Returns:
-        {API}Config: Configured API settings
-    """
+def _build_api_config():
+    """Build API config from environment with test defaults"""
     return {API}Config(
         api_url=os.getenv("{API_NAME}_URL", "https://api.example.com/v1"),
         client_id=os.getenv("{API_NAME}_CLIENT_ID", "test_client_id"),
@@ -48,6 +48,42 @@ def api_config():
     )
 
 
+def _build_neo4j_config():
+    """Build Neo4j config from environment with test defaults"""
+    return Neo4jConfig(
+        uri=os.getenv("NEO4J_URI", "bolt://localhost:7687"),
+        username=os.getenv("NEO4J_USERNAME", "neo4j"),
+        password=os.getenv("NEO4J_PASSWORD", "password"),
+        database=os.getenv("NEO4J_DATABASE", "neo4j")
+    )
+
+
+def _build_sync_config():
+    """Build sync config with test defaults"""
+    return SyncConfig(
+        default_days_back=365,
+        enable_metrics=True,
+        enable_analytics=True,
+        create_indexes=True
+    )
+
+
+@pytest.fixture
+def api_config():
+    """
+    Fixture providing API configuration
+
+    Function-scoped: use when the test (or client under test) mutates config.
+    For read-only checks use api_config_readonly.
+
+    TODO: Customize for your API authentication method
+
+    Returns:
+        {API}Config: Configured API settings
+    """
+    return _build_api_config()
+
+
 @pytest.fixture
 def neo4j_config():
     """
@@ -56,12 +92,7 @@ def neo4j_config():
     Returns:
         Neo4jConfig: Configured Neo4j settings
     """
-    return Neo4jConfig(
-        uri=os.getenv("NEO4J_URI", "bolt://localhost:7687"),
-        username=os.getenv("NEO4J_USERNAME", "neo4j"),
-        password=os.getenv("NEO4J_PASSWORD", "password"),
-        database=os.getenv("NEO4J_DATABASE", "neo4j")
-    )
+    return _build_neo4j_config()
 
 
 @pytest.fixture
@@ -72,12 +103,29 @@ def sync_config():
     Returns:
         SyncConfig: Configured sync settings
     """
-    return SyncConfig(
-        default_days_back=365,
-        enable_metrics=True,
-        enable_analytics=True,
-        create_indexes=True
-    )
+    return _build_sync_config()
+
+
+@pytest.fixture(scope="session")
+def api_config_readonly():
+    """
+    Session-scoped API configuration (built once per run)
+
+    DO NOT mutate - shared across tests. Use api_config for mutating tests.
+    """
+    return _build_api_config()
+
+
+@pytest.fixture(scope="session")
+def neo4j_config_readonly():
+    """Session-scoped Neo4j configuration (built once per run, do not mutate)"""
+    return _build_neo4j_config()
+
+
+@pytest.fixture(scope="session")
+def sync_config_readonly():
+    """Session-scoped sync configuration (built once per run, do not mutate)"""
+    return _build_sync_config()
 
 
 # =============================================================================
@@ -359,3 +407,22 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "slow: tests that take significant time to run"
     )
+    config.addinivalue_line(
+        "markers", "serial: tests that must share one xdist worker (live Neo4j state)"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Assign xdist groups for --dist=loadgroup
+
+    - serial-marked tests: one shared "serial" group (single worker)
+    - everything else: grouped by class/module (loadscope behavior), so
+      monkeypatch env changes and class-level state stay on one worker
+    """
+    for item in items:
+        if item.get_closest_marker("serial"):
+            group = "serial"
+        else:
+            group = item.nodeid.rsplit("::", 1)[0]
+        item.add_marker(pytest.mark.xdist_group(group))
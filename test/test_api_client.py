@@ -9,13 +9,16 @@ Run:
 TODO: Customize for your specific API behavior and authentication method
 """
 
+from dataclasses import replace
+
 import pytest
-import time
+import threading
 from unittest.mock import Mock, patch, MagicMock
 import requests
 
 # TODO: Update import paths to match your project
-from {project}_sync.{api}_client import {API}Client
+from {project}_sync.{api}_client import {API}Client, CircuitBreaker, CircuitOpen, TokenBucket
+from {project}_sync.cache import ReferenceCache, stale_while_revalidate
 from {project}_sync.config import {API}Config
 
 
@@ -39,10 +42,26 @@ class TestAuthentication:
         result = client.authenticate()
 
         assert result is True
-        assert client.config.token == "test_token_12345"
+        assert client.auth.token == "test_token_12345"
         assert "Authorization" in client.session.headers
         assert client.session.headers["Authorization"] == "Bearer test_token_12345"
 
+    @patch('requests.Session.post')
+    def test_authenticate_posts_form_encoded_credentials(self, mock_post, api_config):
+        """Test the token request is form-encoded and sent without the API session's headers"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"access_token": "test_token_12345"}
+        mock_post.return_value = mock_response
+
+        client = {API}Client(api_config)
+        client.authenticate()
+
+        kwargs = mock_post.call_args.kwargs
+        assert kwargs["data"]["grant_type"] == "client_credentials"
+        assert kwargs["headers"]["Content-Type"] == "application/x-www-form-urlencoded"
+        assert "Authorization" not in client._auth_session.headers
+
     @patch('requests.Session.post')
     def test_authenticate_failure(self, mock_post, api_config):
         """Test authentication failure handling"""
@@ -56,7 +75,7 @@ class TestAuthentication:
         result = client.authenticate()
 
         assert result is False
-        assert client.config.token is None
+        assert client.auth.token is None
 
     @patch('requests.Session.post')
     def test_authenticate_network_error(self, mock_post, api_config):
@@ -69,6 +88,22 @@ class TestAuthentication:
 
         assert result is False
 
+    @patch('requests.Session.post')
+    def test_token_cache_reused_across_clients(self, mock_post, api_config, tmp_path):
+        """Test a persisted unexpired token is loaded without another OAuth call"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"access_token": "cached_token", "expires_in": 3600}
+        mock_post.return_value = mock_response
+        config = replace(api_config, token_cache_path=str(tmp_path / "token.json"))
+
+        {API}Client(config).authenticate()
+        client = {API}Client(config)
+
+        assert client.ensure_authenticated() is True
+        assert client.session.headers["Authorization"] == "Bearer cached_token"
+        assert mock_post.call_count == 1
+
     # TODO: Add tests for other authentication methods if your API uses them
     # def test_authenticate_api_key(self):
     #     """Test API key authentication"""
@@ -142,6 +177,37 @@ class TestPagination:
 
         assert len(result) == 0
 
+    @patch.object({API}Client, '_make_single_request')
+    def test_iter_items_fetches_pages_lazily(self, mock_request, api_config):
+        """Test the item iterator requests the next page only when it is needed"""
+        mock_request.side_effect = [
+            ({"items": [{"id": 1}, {"id": 2}]}, "page2_token"),
+            ({"items": [{"id": 3}]}, None)
+        ]
+
+        client = {API}Client(api_config)
+        items = client._iter_items("/test-endpoint")
+
+        assert next(items) == {"id": 1}
+        assert next(items) == {"id": 2}
+        assert mock_request.call_count == 1
+        assert list(items) == [{"id": 3}]
+        assert mock_request.call_count == 2
+
+    @patch.object({API}Client, '_make_single_request')
+    def test_parallel_pagination_keeps_page_order(self, mock_request, api_config):
+        """Test concurrent page fetches return all items in page order"""
+        def page_response(url, params):
+            page = params["page"]
+            return {"items": [{"id": page}], "totalCount": 4}, None
+
+        mock_request.side_effect = page_response
+        client = {API}Client(replace(api_config, batch_size=1))
+        result = client._make_request_parallel("/test-endpoint")
+
+        assert [item["id"] for item in result] == [1, 2, 3, 4]
+        assert mock_request.call_count == 4
+
     # TODO: Add tests for your specific pagination method
     # def test_pagination_offset_based(self):
     #     """Test offset-based pagination"""
@@ -166,6 +232,7 @@ class TestRetryLogic:
         success_response = Mock()
         success_response.status_code = 200
         success_response.json.return_value = {"items": []}
+        success_response.content = b'{"items": []}'
         success_response.headers = {}
 
         mock_get.side_effect = [
@@ -192,6 +259,7 @@ class TestRetryLogic:
         success_response = Mock()
         success_response.status_code = 200
         success_response.json.return_value = {"items": []}
+        success_response.content = b'{"items": []}'
         success_response.headers = {}
 
         mock_get.side_effect = [rate_limit_response, success_response]
@@ -203,6 +271,79 @@ class TestRetryLogic:
         assert mock_get.call_count == 2
         mock_sleep.assert_called_once()  # Verify backoff occurred
 
+    @patch('requests.Session.get')
+    @patch('time.sleep')
+    def test_rate_limit_honors_retry_after(self, mock_sleep, mock_get, api_config):
+        """Test a 429 waits the server's Retry-After instead of the backoff"""
+        rate_limit_response = Mock()
+        rate_limit_response.status_code = 429
+        rate_limit_response.headers = {"Retry-After": "7"}
+        rate_limit_response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            response=rate_limit_response
+        )
+
+        success_response = Mock()
+        success_response.status_code = 200
+        success_response.json.return_value = {"items": []}
+        success_response.content = b'{"items": []}'
+        success_response.headers = {}
+
+        mock_get.side_effect = [rate_limit_response, success_response]
+
+        client = {API}Client(api_config)
+        client._make_single_request("https://api.example.com/test", {})
+
+        mock_sleep.assert_called_once_with(7.0)
+
+    def test_backoff_is_jittered_and_capped(self):
+        """Test backoff stays within [0, min(2 ** attempt, cap)] for any attempt"""
+        from {project}_sync.{api}_client import BACKOFF_CAP, _backoff
+
+        assert all(0 <= _backoff(2) <= 4 for _ in range(100))
+        assert all(0 <= _backoff(1000) <= BACKOFF_CAP for _ in range(100))
+
+    @pytest.mark.parametrize("header", ["86400", "inf", "nan", "-5"])
+    def test_retry_after_is_bounded(self, header):
+        """Test huge, non-finite or negative Retry-After values stay within [0, cap]"""
+        from {project}_sync.{api}_client import BACKOFF_CAP, _retry_after
+
+        wait_time = _retry_after(Mock(headers={"Retry-After": header}), attempt=1)
+
+        assert 0.0 <= wait_time <= BACKOFF_CAP
+
+    @patch('time.sleep')
+    def test_token_bucket_allows_burst_then_paces(self, mock_sleep):
+        """Test requests within the burst pass immediately and the next one waits"""
+        bucket = TokenBucket(rate=10, capacity=3)
+
+        for _ in range(3):
+            bucket.acquire()
+        mock_sleep.assert_not_called()
+
+        bucket.acquire()
+        mock_sleep.assert_called_once()
+        assert 0 < mock_sleep.call_args[0][0] <= 0.1
+
+    @patch('time.monotonic')
+    def test_circuit_breaker_opens_then_probes(self, mock_monotonic):
+        """Test the circuit fails fast after the threshold and lets one probe through later"""
+        mock_monotonic.return_value = 100.0
+        breaker = CircuitBreaker(fail_threshold=2, reset_seconds=30)
+
+        breaker.record_failure()
+        breaker.before_request()  # Below threshold: still closed
+        breaker.record_failure()
+        with pytest.raises(CircuitOpen):
+            breaker.before_request()
+
+        mock_monotonic.return_value = 131.0
+        breaker.before_request()  # Probe allowed
+        with pytest.raises(CircuitOpen):
+            breaker.before_request()  # Others keep failing fast during the probe
+
+        breaker.record_success()
+        breaker.before_request()
+
     @patch('requests.Session.get')
     def test_retry_on_401_with_reauth(self, mock_get, api_config):
         """Test retry on 401 with re-authentication"""
@@ -214,6 +355,7 @@ class TestRetryLogic:
         success_response = Mock()
         success_response.status_code = 200
         success_response.json.return_value = {"items": []}
+        success_response.content = b'{"items": []}'
         success_response.headers = {}
 
         mock_get.side_effect = [unauth_response, success_response]
@@ -236,8 +378,7 @@ class TestRetryLogic:
         error_response.raise_for_status.side_effect = requests.exceptions.HTTPError()
         mock_get.return_value = error_response
 
-        client = {API}Client(api_config)
-        client.config.max_retries = 3
+        client = {API}Client(replace(api_config, max_retries=3))
 
         with pytest.raises(Exception, match="Max retries.*exceeded"):
             client._make_single_request("https://api.example.com/test", {})
@@ -260,16 +401,81 @@ class TestRetryLogic:
 
         assert mock_get.call_count == 1  # No retries
 
+    @patch('requests.Session.get')
+    def test_non_retryable_probe_closes_circuit(self, mock_get, api_config):
+        """Test a half-open probe answered with a 4xx closes the circuit"""
+        error_response = Mock()
+        error_response.status_code = 404
+        error_response.raise_for_status.side_effect = requests.exceptions.HTTPError()
+        mock_get.return_value = error_response
+
+        client = {API}Client(api_config)
+        breaker = client.circuit_breaker
+        for _ in range(breaker.fail_threshold):
+            breaker.record_failure()
+        breaker.opened_at -= breaker.reset_seconds + 1  # reset period over: next call probes
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            client._make_single_request("https://api.example.com/test", {})
+
+        assert breaker.opened_at is None
+        breaker.before_request()
+
+    @patch('time.sleep')
+    def test_status_handlers_decide_retry(self, mock_sleep, api_config):
+        """Test handlers return a wait for retryable statuses and None to give up"""
+        client = {API}Client(api_config)
+        response = Mock(status_code=503, headers={"Retry-After": "2"})
+
+        assert client._status_handlers[503](response, 0) == 2.0
+        assert 400 not in client._status_handlers
+        with patch.object(client, "authenticate", return_value=False):
+            assert client._status_handlers[401](response, 0) is None
+        mock_sleep.assert_not_called()  # Handlers only decide; the request loop sleeps
+
 
 class TestRequestMethods:
     """Tests for request helper methods"""
 
+    @patch.object({API}Client, '_make_request')
+    def test_fetch_all_returns_items_per_endpoint(self, mock_make_request, api_config):
+        """Test concurrent endpoint fetches are keyed by endpoint"""
+        mock_make_request.side_effect = lambda endpoint, params: [{"endpoint": endpoint}]
+
+        client = {API}Client(api_config)
+        result = client.fetch_all([("/customers", None), ("/users", {"active": "true"})])
+
+        assert result == {
+            "/customers": [{"endpoint": "/customers"}],
+            "/users": [{"endpoint": "/users"}],
+        }
+
+    @patch('requests.Session.get')
+    def test_conditional_request_uses_stored_body_on_304(self, mock_get, api_config, tmp_path):
+        """Test a 304 reply is served from the stored body after sending If-None-Match"""
+        first_response = Mock()
+        first_response.status_code = 200
+        first_response.content = b'{"items": [{"id": 1}]}'
+        first_response.json.return_value = {"items": [{"id": 1}]}
+        first_response.headers = {"ETag": '"v1"'}
+
+        not_modified = Mock()
+        not_modified.status_code = 304
+
+        mock_get.side_effect = [first_response, not_modified]
+        client = {API}Client(replace(api_config, etag_cache_path=str(tmp_path / "http.sqlite")))
+
+        assert client._make_request("/test", conditional=True) == [{"id": 1}]
+        assert client._make_request("/test", conditional=True) == [{"id": 1}]
+        assert mock_get.call_args[1]["headers"] == {"If-None-Match": '"v1"'}
+
     @patch('requests.Session.get')
     def test_make_request_with_params(self, mock_get, api_config):
         """Test request with query parameters"""
         success_response = Mock()
         success_response.status_code = 200
         success_response.json.return_value = {"items": [{"id": 1}]}
+        success_response.content = b'{"items": [{"id": 1}]}'
         success_response.headers = {}
         mock_get.return_value = success_response
 
@@ -287,17 +493,98 @@ class TestRequestMethods:
         success_response = Mock()
         success_response.status_code = 200
         success_response.json.return_value = {"items": []}
+        success_response.content = b'{"items": []}'
         success_response.headers = {}
         mock_get.return_value = success_response
 
-        api_config.request_timeout = 120
-        client = {API}Client(api_config)
+        client = {API}Client(replace(api_config, request_timeout=120))
         client._make_single_request("https://api.example.com/test", {})
 
         # Verify timeout was passed
         call_kwargs = mock_get.call_args[1]
         assert call_kwargs["timeout"] == 120
 
+    @patch.object({API}Client, '_iter_items')
+    def test_cacheable_request_fetched_once(self, mock_iter_items, api_config):
+        """Test repeated cacheable requests hit memory until clear_cache()"""
+        mock_iter_items.side_effect = lambda *args: iter([{"guid": "u1"}])
+
+        client = {API}Client(api_config)
+        first = client._make_request("/users", {"active": True}, cacheable=True)
+        first.append({"guid": "extra"})  # Callers get their own list
+        second = client._make_request("/users", {"active": True}, cacheable=True)
+
+        assert second == [{"guid": "u1"}]
+        assert mock_iter_items.call_count == 1
+
+        client.clear_cache()
+        client._make_request("/users", {"active": True}, cacheable=True)
+        assert mock_iter_items.call_count == 2
+
+
+class TestReferenceCache:
+    """Tests for stale-while-revalidate caching of reference data"""
+
+    def _client(self, cache, ttl, stale_ttl):
+        class Client:
+            calls = 0
+
+            def __init__(self, config="default"):
+                self.config = config
+
+            @stale_while_revalidate(ttl=ttl, stale_ttl=stale_ttl, cache=cache)
+            def get_categories(self):
+                Client.calls += 1
+                return [f"v{Client.calls}"]
+
+        return Client
+
+    @staticmethod
+    def _join_refreshes():
+        for thread in threading.enumerate():
+            if thread.name == "reference-refresh":
+                thread.join(timeout=2)
+
+    def test_fresh_value_served_from_cache(self):
+        """Test a second call within ttl does not hit the API, across instances"""
+        Client = self._client(ReferenceCache(), ttl=3600, stale_ttl=86400)
+
+        assert Client().get_categories() == ["v1"]
+        assert Client().get_categories() == ["v1"]
+        assert Client.calls == 1
+
+    def test_clients_with_different_configs_do_not_share(self):
+        """Test the entry is keyed per client config, not shared process-wide"""
+        Client = self._client(ReferenceCache(), ttl=3600, stale_ttl=86400)
+
+        assert Client("account-a").get_categories() == ["v1"]
+        assert Client("account-b").get_categories() == ["v2"]
+        assert Client("account-a").get_categories() == ["v1"]
+
+    def test_stale_value_served_while_refreshing(self):
+        """Test a stale value is returned immediately and refreshed in the background"""
+        now = [0.0]
+        Client = self._client(ReferenceCache(clock=lambda: now[0]), ttl=10, stale_ttl=100)
+        client = Client()
+
+        assert client.get_categories() == ["v1"]
+        now[0] = 50.0
+        assert client.get_categories() == ["v1"]  # stale, refresh started
+        self._join_refreshes()
+
+        assert Client.calls == 2
+        assert client.get_categories() == ["v2"]
+
+    def test_expired_value_fetched_synchronously(self):
+        """Test a value older than stale_ttl is reloaded before returning"""
+        now = [0.0]
+        Client = self._client(ReferenceCache(clock=lambda: now[0]), ttl=10, stale_ttl=100)
+        client = Client()
+
+        assert client.get_categories() == ["v1"]
+        now[0] = 150.0
+        assert client.get_categories() == ["v2"]
+
 
 # =============================================================================
 # Integration Tests
@@ -322,7 +609,7 @@ class TestAPIClientIntegration:
         result = api_client.authenticate()
 
         assert result is True
-        assert api_client.config.token is not None
+        assert api_client.auth.token is not None
 
     # TODO: Add integration tests for your specific endpoints
     # def test_fetch_customers(self, api_client):
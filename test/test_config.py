@@ -11,23 +11,53 @@ TODO: Customize for your specific API configuration requirements
 
 import pytest
 import os
+from types import MappingProxyType
 from unittest.mock import patch
 
+try:
+    import dotenv
+except ImportError:  # python-dotenv is a core dependency, but keep the rest of the module runnable
+    dotenv = None
+
 # TODO: Update import paths to match your project
 from {project}_sync.config import {API}Config, Neo4jConfig, SyncConfig
 
 
+# Boolean env string formats (env_value, expected) - built once at import
+_ENV_BOOL_CASES = (
+    ("true", True),
+    ("True", True),
+    ("TRUE", True),
+    ("false", False),
+    ("False", False),
+    ("FALSE", False),
+    ("anything_else", False),
+)
+_ENV_BOOL_IDS = (
+    "lower_true", "cap_true", "upper_true",
+    "lower_false", "cap_false", "upper_false",
+    "other",
+)
+
+# Env overrides shared by patch.dict (read-only, allocated once)
+_CUSTOM_TIMEOUT_ENV = MappingProxyType({
+    "SYNC_MAX_RETRIES": "5",
+    "SYNC_REQUEST_TIMEOUT": "120",
+})
+
+
 class TestAPIConfig:
     """Tests for {API_NAME} API configuration"""
 
-    def test_api_config_from_env(self, monkeypatch):
+    def test_api_config_from_env(self):
         """Test loading API config from environment variables"""
         # TODO: Adjust for your API authentication method
-        monkeypatch.setenv("{API_NAME}_URL", "https://test.api.com")
-        monkeypatch.setenv("{API_NAME}_CLIENT_ID", "test_client")
-        monkeypatch.setenv("{API_NAME}_CLIENT_SECRET", "test_secret")
-
-        config = {API}Config()
+        with patch.dict(os.environ, {
+            "{API_NAME}_URL": "https://test.api.com",
+            "{API_NAME}_CLIENT_ID": "test_client",
+            "{API_NAME}_CLIENT_SECRET": "test_secret",
+        }):
+            config = {API}Config()
 
         assert config.api_url == "https://test.api.com"
         assert config.client_id == "test_client"
@@ -41,9 +71,9 @@ class TestAPIConfig:
         assert config.batch_size == 100
         assert config.request_timeout == 60
 
-    def test_api_config_validation_success(self, api_config):
+    def test_api_config_validation_success(self, api_config_readonly):
         """Test validation passes with valid config"""
-        assert api_config.validate() is True
+        assert api_config_readonly.validate() is True
 
     def test_api_config_validation_missing_url(self):
         """Test validation fails without API URL"""
@@ -89,12 +119,10 @@ class TestAPIConfig:
 
         assert config.validate() is True
 
-    def test_api_config_custom_timeouts(self, monkeypatch):
+    def test_api_config_custom_timeouts(self):
         """Test custom timeout and retry settings"""
-        monkeypatch.setenv("SYNC_MAX_RETRIES", "5")
-        monkeypatch.setenv("SYNC_REQUEST_TIMEOUT", "120")
-
-        config = {API}Config()
+        with patch.dict(os.environ, _CUSTOM_TIMEOUT_ENV):
+            config = {API}Config()
 
         assert config.max_retries == 5
         assert config.request_timeout == 120
@@ -103,14 +131,15 @@ class TestAPIConfig:
 class TestNeo4jConfig:
     """Tests for Neo4j configuration"""
 
-    def test_neo4j_config_from_env(self, monkeypatch):
+    def test_neo4j_config_from_env(self):
         """Test loading Neo4j config from environment variables"""
-        monkeypatch.setenv("NEO4J_URI", "bolt://test:7687")
-        monkeypatch.setenv("NEO4J_USERNAME", "test_user")
-        monkeypatch.setenv("NEO4J_PASSWORD", "test_pass")
-        monkeypatch.setenv("NEO4J_DATABASE", "test_db")
-
-        config = Neo4jConfig()
+        with patch.dict(os.environ, {
+            "NEO4J_URI": "bolt://test:7687",
+            "NEO4J_USERNAME": "test_user",
+            "NEO4J_PASSWORD": "test_pass",
+            "NEO4J_DATABASE": "test_db",
+        }):
+            config = Neo4jConfig()
 
         assert config.uri == "bolt://test:7687"
         assert config.username == "test_user"
@@ -123,9 +152,9 @@ class TestNeo4jConfig:
 
         assert config.database == "neo4j"
 
-    def test_neo4j_config_validation_success(self, neo4j_config):
+    def test_neo4j_config_validation_success(self, neo4j_config_readonly):
         """Test validation passes with valid config"""
-        assert neo4j_config.validate() is True
+        assert neo4j_config_readonly.validate() is True
 
     def test_neo4j_config_validation_missing_uri(self):
         """Test validation fails without URI"""
@@ -173,14 +202,15 @@ class TestSyncConfig:
         assert config.enable_analytics is True
         assert config.create_indexes is True
 
-    def test_sync_config_from_env(self, monkeypatch):
+    def test_sync_config_from_env(self):
         """Test loading sync config from environment variables"""
-        monkeypatch.setenv("SYNC_DEFAULT_DAYS_BACK", "730")
-        monkeypatch.setenv("SYNC_ENABLE_METRICS", "false")
-        monkeypatch.setenv("SYNC_ENABLE_ANALYTICS", "false")
-        monkeypatch.setenv("SYNC_CREATE_INDEXES", "false")
-
-        config = SyncConfig()
+        with patch.dict(os.environ, {
+            "SYNC_DEFAULT_DAYS_BACK": "730",
+            "SYNC_ENABLE_METRICS": "false",
+            "SYNC_ENABLE_ANALYTICS": "false",
+            "SYNC_CREATE_INDEXES": "false",
+        }):
+            config = SyncConfig()
 
         assert config.default_days_back == 730
         assert config.enable_metrics is False
@@ -195,14 +225,12 @@ class TestSyncConfig:
 
         assert days_back == 365
 
-    def test_get_entity_days_back_custom(self, monkeypatch):
+    def test_get_entity_days_back_custom(self):
         """Test getting custom days back for specific entity"""
         # TODO: Adjust entity name for your transactional data types
-        monkeypatch.setenv("SYNC_TRANSACTIONS_DAYS_BACK", "90")
-
-        config = SyncConfig()
-
-        days_back = config.get_entity_days_back("transactions")
+        with patch.dict(os.environ, {"SYNC_TRANSACTIONS_DAYS_BACK": "90"}):
+            config = SyncConfig()
+            days_back = config.get_entity_days_back("transactions")
 
         assert days_back == 90
 
@@ -214,34 +242,29 @@ class TestSyncConfig:
 
         assert start_date is None
 
-    def test_get_entity_start_date_custom(self, monkeypatch):
+    def test_get_entity_start_date_custom(self):
         """Test getting custom start date for specific entity"""
         # TODO: Adjust entity name for your transactional data types
-        monkeypatch.setenv("SYNC_TRANSACTIONS_START_DATE", "2020-01-01")
+        with patch.dict(os.environ, {"SYNC_TRANSACTIONS_START_DATE": "2020-01-01"}):
+            config = SyncConfig()
+            start_date = config.get_entity_start_date("transactions")
 
-        config = SyncConfig()
+        assert start_date == "2020-01-01"
 
-        start_date = config.get_entity_start_date("transactions")
+    def test_new_instance_sees_env_change(self, monkeypatch):
+        """Test a config built after setenv in the same test reads the new value"""
+        monkeypatch.setenv("SYNC_DEFAULT_DAYS_BACK", "30")
+        assert SyncConfig().default_days_back == 30
 
-        assert start_date == "2020-01-01"
+        monkeypatch.setenv("SYNC_DEFAULT_DAYS_BACK", "60")
+        assert SyncConfig().default_days_back == 60
 
-    def test_sync_config_boolean_parsing(self, monkeypatch):
+    @pytest.mark.parametrize("env_value,expected", _ENV_BOOL_CASES, ids=_ENV_BOOL_IDS)
+    def test_sync_config_boolean_parsing(self, env_value, expected):
         """Test boolean environment variable parsing"""
-        # Test various boolean string formats
-        test_cases = [
-            ("true", True),
-            ("True", True),
-            ("TRUE", True),
-            ("false", False),
-            ("False", False),
-            ("FALSE", False),
-            ("anything_else", False),
-        ]
-
-        for env_value, expected in test_cases:
-            monkeypatch.setenv("SYNC_ENABLE_METRICS", env_value)
+        with patch.dict(os.environ, {"SYNC_ENABLE_METRICS": env_value}):
             config = SyncConfig()
-            assert config.enable_metrics is expected
+        assert config.enable_metrics is expected
 
 
 # =============================================================================
@@ -252,15 +275,23 @@ class TestSyncConfig:
 class TestConfigIntegration:
     """Integration tests for configuration with real environment"""
 
-    def test_all_configs_validate_together(self, api_config, neo4j_config, sync_config):
-        """Test all configurations validate successfully together"""
-        # This would typically be done in orchestrator initialization
+    # One test per config so each requests only the fixture it checks
+    # (orchestrator initialization validates all three together)
+
+    def test_api_config_validates(self, api_config_readonly):
+        """Test API configuration validates successfully"""
+        assert api_config_readonly.validate() is True
+
+    def test_neo4j_config_validates(self, neo4j_config_readonly):
+        """Test Neo4j configuration validates successfully"""
+        assert neo4j_config_readonly.validate() is True
 
-        assert api_config.validate() is True
-        assert neo4j_config.validate() is True
+    def test_sync_config_usable(self, sync_config_readonly):
+        """Test sync configuration is usable"""
         # SyncConfig has no validate method - just check it exists
-        assert sync_config.default_days_back > 0
+        assert sync_config_readonly.default_days_back > 0
 
+    @pytest.mark.slow
     def test_config_from_dotenv(self):
         """
         Test loading configuration from .env file
@@ -268,8 +299,9 @@ class TestConfigIntegration:
         TODO: This test requires a .env file in your project root
         Run this manually to verify .env loading works correctly
         """
-        from dotenv import load_dotenv
-        load_dotenv()
+        if dotenv is None:
+            pytest.skip("python-dotenv not installed")
+        dotenv.load_dotenv()
 
         # Try to create configs from environment
         api_config = {API}Config()
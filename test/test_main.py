@@ -0,0 +1,186 @@
+"""
+MCP Server Tests
+================
+Tests for query guards, serialization and session/cache helpers in main.py
+(no Neo4j connection needed).
+
+main.py is imported with a stand-in FastMCP app: the decorators only register
+tools and lifecycle hooks, which these tests don't exercise.
+"""
+
+import asyncio
+import importlib
+import sys
+import types
+from contextlib import asynccontextmanager
+from unittest.mock import Mock
+
+import pytest
+
+
+class _StubApp:
+    """FastMCP stand-in: every decorator factory (tool, on_startup, ...) returns fn unchanged"""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: (lambda fn: fn)
+
+
+def _import_main():
+    stub = types.ModuleType("fastmcp")
+    stub.FastMCP = _StubApp
+    saved = sys.modules.get("fastmcp")
+    sys.modules["fastmcp"] = stub
+    try:
+        sys.modules.pop("main", None)
+        return importlib.import_module("main")
+    finally:
+        if saved is None:
+            sys.modules.pop("fastmcp", None)
+        else:
+            sys.modules["fastmcp"] = saved
+
+
+main = _import_main()
+
+
+class TestGuardUnbounded:
+    """Tests for capping unlabeled full-graph scans"""
+
+    def test_parameterized_limit_is_not_doubled(self):
+        """Test a LIMIT $param counts as bounded"""
+        query = "MATCH (n) RETURN n LIMIT $limit"
+
+        error, guarded = main._guard_unbounded(query, allow_unbounded=False)
+
+        assert error is None
+        assert guarded == query
+
+    def test_limit_appended_after_trailing_comment(self):
+        """Test the appended LIMIT lands outside a trailing // comment"""
+        query = "MATCH (n) RETURN n // everything"
+
+        error, guarded = main._guard_unbounded(query, allow_unbounded=False)
+
+        assert error is None
+        assert guarded.splitlines()[-1] == f"LIMIT {main.MAX_UNBOUND_LIMIT}"
+
+
+class TestSerialization:
+    """Tests for Neo4j value serialization"""
+
+    def test_iso_keeps_offset_of_equal_instants(self):
+        """Test equal DateTimes in different zones keep their own offset"""
+        from datetime import timedelta, timezone
+        from neo4j.time import DateTime
+
+        utc = DateTime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        plus_one = DateTime(2024, 1, 1, 13, 0, 0, tzinfo=timezone(timedelta(hours=1)))
+
+        assert utc == plus_one
+        assert main._iso(utc).endswith("+00:00")
+        assert main._iso(plus_one) == plus_one.isoformat()
+        assert main._iso(plus_one).endswith("+01:00")
+
+    def test_repeated_timestamps_hit_iso_cache(self):
+        """Test identical timestamps in one batch are formatted once"""
+        from neo4j.time import DateTime
+
+        main._iso_cached.cache_clear()
+        rows = [{"createdDateTime": DateTime(2024, 1, 1, 12, 0, 0)} for _ in range(3)]
+
+        serialized = main.serialize_neo4j_value(rows)
+
+        info = main._iso_cached.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+        assert {row["createdDateTime"] for row in serialized} == {"2024-01-01T12:00:00.000000000"}
+
+
+class TestScopedSession:
+    """Tests for sharing one session across a tool call"""
+
+    def test_nested_calls_reuse_one_session(self, monkeypatch):
+        """Test nested scoped_session blocks get the outer session"""
+        session = Mock(name="session")
+        fake_driver = Mock()
+
+        @asynccontextmanager
+        async def _session(**kwargs):
+            yield session
+
+        fake_driver.session = Mock(side_effect=_session)
+
+        async def _get_driver():
+            return fake_driver
+
+        monkeypatch.setattr(main, "get_driver", _get_driver)
+
+        async def _tool():
+            async with main.scoped_session() as outer:
+                async with main.scoped_session() as inner:
+                    return outer, inner
+
+        outer, inner = asyncio.run(_tool())
+
+        assert outer is inner is session
+        fake_driver.session.assert_called_once()
+        assert main._request_session.get() is None
+
+
+class TestCachedTool:
+    """Tests for the in-process read-tool cache"""
+
+    @pytest.fixture(autouse=True)
+    def _clear_tool_cache(self):
+        main._tool_cache.clear()
+        yield
+        main._tool_cache.clear()
+
+    def test_second_call_is_served_from_cache(self):
+        """Test a repeated call with the same arguments skips the query"""
+        calls = []
+
+        @main.cached_tool(ttl=30, key_labels=("Customer",))
+        async def _tool(guid):
+            calls.append(guid)
+            return {"success": True, "guid": guid}
+
+        asyncio.run(_tool("a"))
+        asyncio.run(_tool("a"))
+        asyncio.run(_tool("b"))
+
+        assert calls == ["a", "b"]
+
+    def test_invalidate_drops_entries_for_label(self):
+        """Test invalidate(label) forces the next call to miss"""
+        calls = []
+
+        @main.cached_tool(ttl=30, key_labels=("Customer",))
+        async def _tool():
+            calls.append(1)
+            return {"success": True}
+
+        asyncio.run(_tool())
+        main.invalidate("Project")
+        asyncio.run(_tool())
+        main.invalidate("Customer")
+        asyncio.run(_tool())
+
+        assert len(calls) == 2
+
+    def test_failed_result_is_not_cached(self):
+        """Test error responses are retried instead of cached"""
+        calls = []
+
+        @main.cached_tool(ttl=30)
+        async def _tool():
+            calls.append(1)
+            return {"success": False}
+
+        asyncio.run(_tool())
+        asyncio.run(_tool())
+
+        assert len(calls) == 2
@@ -9,53 +9,50 @@ This catches the most common bug: forgetting to call a relationship method.
 TODO: Customize for your project's relationship methods
 """
 
-import unittest
+import functools
 import inspect
+import re
 
 
-class TestOrchestrationCoverage(unittest.TestCase):
-    """Test that orchestrator calls ALL relationship creation methods"""
+@functools.lru_cache(maxsize=1)
+def _orchestrator_source() -> str:
+    """Source of SyncOrchestrator._create_relationships minus comments (read once per run)"""
+    # TODO: Update import path to match your project
+    from {project}_sync.orchestrator import SyncOrchestrator
+    source = inspect.getsource(SyncOrchestrator._create_relationships)
+    # Commented-out calls (template placeholders) must not count as registered
+    return re.sub(r"#.*", "", source)
+
+
+def test_orchestrator_calls_all_relationship_methods():
+    """
+    Verify orchestrator._create_relationships() calls all relationship methods
+    
+    Pattern from real-world production project: grep to verify counts match
+    
+    Command line verification:
+        grep -r "def create_.*_relationships" {project}_sync/relationships/*.py | wc -l
+        grep "create_.*_relationships()" {project}_sync/orchestrator.py | wc -l
     
-    def test_orchestrator_calls_all_relationship_methods(self):
-        """
-        Verify orchestrator._create_relationships() calls all relationship methods
-        
-        Pattern from real-world production project: grep to verify counts match
-        
-        Command line verification:
-            grep -r "def create_.*_relationships" {project}_sync/relationships/*.py | wc -l
-            grep "create_.*_relationships()" {project}_sync/orchestrator.py | wc -l
-        
-        These counts MUST match!
-        """
-        # TODO: Import your orchestrator
-        # from {project}_sync.orchestrator import SyncOrchestrator
-        
-        # Read orchestrator source code
-        # source = inspect.getsource(SyncOrchestrator._create_relationships)
-        
-        # TODO: List all expected relationship methods
-        expected_methods = [
-            # 'create_customer_project_relationships',
-            # 'create_customer_user_relationships',
-            # 'create_project_owner_relationships',
-            # Add all your relationship methods here
-        ]
-        
-        # Check each method is called in orchestrator
-        missing_methods = []
-        # for method_name in expected_methods:
-        #     if method_name not in source:
-        #         missing_methods.append(method_name)
-        
-        # Assert all methods are registered
-        # self.assertEqual(len(missing_methods), 0,
-        #     f"Orchestrator missing {len(missing_methods)} method calls:\n" +
-        #     "\n".join(f"  - {m}" for m in missing_methods))
-        
-        # TODO: Remove this pass when you implement the test
-        pass
-
-
-if __name__ == "__main__":
-    unittest.main()
+    These counts MUST match!
+    """
+    # Read orchestrator source once, collect call sites in one regex pass
+    # (matches self.<module>.create_*_relationships( calls)
+    source = _orchestrator_source()
+    called_methods = set(re.findall(r"\.(create_\w+_relationships)\s*\(", source))
+
+    # TODO: List all expected relationship methods
+    expected_methods = [
+        # 'create_customer_project_relationships',
+        # 'create_customer_user_relationships',
+        # 'create_project_owner_relationships',
+        # Add all your relationship methods here
+    ]
+
+    # Single set difference instead of one source scan per method
+    missing_methods = sorted(set(expected_methods) - called_methods)
+
+    assert not missing_methods, (
+        f"Orchestrator missing {len(missing_methods)} method calls:\n"
+        + "\n".join(f"  - {m}" for m in missing_methods)
+    )
@@ -6,7 +6,10 @@ Modular sync framework for syncing {API_NAME} data to Neo4j.
 Package structure:
 - config.py: Configuration dataclasses
 - {api}_client.py: API client with pagination/retry
+- cache.py: Stale-while-revalidate cache for reference data
+- http_cache.py: ETag/Last-Modified store for conditional GETs
 - neo4j_base.py: Base class for Neo4j operations
+- write_queue.py: Background batch writer for node upserts
 - orchestrator.py: Coordinates all sync operations
 - entities/: Entity sync modules
 - relationships/: Relationship creation modules
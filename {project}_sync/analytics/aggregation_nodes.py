@@ -9,7 +9,7 @@ Creates time-period hierarchy for efficient time-range queries:
 
 Pattern Implementation:
 - Inherit from Neo4jBase for Neo4j operations
-- create_year/quarter/month_nodes() methods
+- create_year/quarter/month_nodes() methods (or create_period_hierarchy() in one query)
 - MERGE nodes to handle incremental updates
 - Create parent relationships: Day→Month→Quarter→Year
 - Link fact nodes (WorkHour, Invoice) to periods via RECORDED_IN
@@ -27,13 +27,54 @@ Benefits:
 - Dashboard support: Pre-aggregated data for rendering
 """
 import logging
-from datetime import datetime, timedelta
-from typing import Tuple
+from datetime import date
+from typing import Optional, Tuple
 from ..neo4j_base import Neo4jBase
 
 logger = logging.getLogger(__name__)
 
 
+# One statement per level; rows are passed as $rows (see Neo4jBase._execute_unwind)
+_YEAR_CYPHER = """
+UNWIND $rows AS r
+MERGE (y:Year {year: r.year})
+SET y.yearString = r.yearString
+"""
+
+_QUARTER_CYPHER = """
+UNWIND $rows AS r
+MATCH (y:Year {year: r.year})
+MERGE (q:Quarter {id: r.quarter_id})
+SET q.year = r.year,
+    q.quarter = r.quarter,
+    q.yearQuarter = r.quarter_id
+MERGE (y)-[:CONTAINS]->(q)
+"""
+
+_MONTH_CYPHER = """
+UNWIND $rows AS r
+MATCH (q:Quarter {id: r.quarter_id})
+MERGE (m:Month {id: r.month_id})
+SET m.year = r.year,
+    m.month = r.month,
+    m.yearMonth = r.month_id,
+    m.yearMonthInt = r.year * 100 + r.month,
+    m.quarter = r.quarter
+MERGE (q)-[:CONTAINS]->(m)
+"""
+
+_DAY_CYPHER = """
+UNWIND $rows AS r
+MATCH (m:Month {id: r.month_id})
+MERGE (d:Day {id: r.date_str})
+SET d.year = r.year,
+    d.month = r.month,
+    d.day = r.day,
+    d.date = r.date_str
+MERGE (m)-[:CONTAINS]->(d)
+"""
+
+
 class AggregationNodes(Neo4jBase):
     """Handles creating time-period aggregation nodes for analytics
 
@@ -53,6 +94,39 @@ class AggregationNodes(Neo4jBase):
       └─ CONTAINS ─→ Quarter(Q2)
     """
 
+    # Rows per UNWIND transaction (caps tx-state memory for large Day ranges)
+    BATCH_SIZE = 5000
+
+    # (label, property) keys used by MERGE / MATCH lookups below.
+    # Names match migration_001 so IF NOT EXISTS makes either path idempotent.
+    PERIOD_CONSTRAINTS = (
+        ("Year", "year"),
+        ("Quarter", "id"),
+        ("Month", "id"),
+        ("Month", "yearMonthInt"),
+        ("Day", "id"),
+    )
+
+    def ensure_schema(self) -> int:
+        """Create uniqueness constraints for period nodes (call before creating them)
+
+        Without these, every MERGE (m:Month {id: ...}) is a label scan;
+        with them it's an index seek.
+
+        Returns:
+            int: Number of constraint statements executed
+        """
+        for label, property_name in self.PERIOD_CONSTRAINTS:
+            query = f"""
+            CREATE CONSTRAINT {label}_{property_name}_unique IF NOT EXISTS
+            FOR (n:{label})
+            REQUIRE n.{property_name} IS UNIQUE
+            """
+            self._execute_query(query, {})
+
+        logger.info(f"  ✓ Ensured {len(self.PERIOD_CONSTRAINTS)} period constraints")
+        return len(self.PERIOD_CONSTRAINTS)
+
     def create_year_nodes(self, start_year: int = 2020, end_year: int = 2030) -> int:
         """Create Year aggregation nodes
 
@@ -68,20 +142,13 @@ class AggregationNodes(Neo4jBase):
         Returns:
             int: Number of year nodes created
         """
-        queries = []
-        for year in range(start_year, end_year + 1):
-            queries.append({
-                "query": """
-                MERGE (y:Year {year: $year})
-                SET y.yearString = $yearString
-                """,
-                "parameters": {
-                    "year": year,
-                    "yearString": str(year)
-                }
-            })
+        rows = [
+            {"year": year, "yearString": str(year)}
+            for year in range(start_year, end_year + 1)
+        ]
 
-        count = self._execute_batch(queries)
+        # One UNWIND query instead of one MERGE per year
+        count = self._execute_unwind(_YEAR_CYPHER, rows)
         logger.info(f"  ✓ Created {count} Year nodes ({start_year}-{end_year})")
         return count
 
@@ -99,27 +166,13 @@ class AggregationNodes(Neo4jBase):
         Returns:
             int: Number of quarter nodes created
         """
-        queries = []
-        for year in range(start_year, end_year + 1):
-            for quarter in range(1, 5):
-                quarter_id = f"{year}-Q{quarter}"
-                queries.append({
-                    "query": """
-                    MATCH (y:Year {year: $year})
-                    MERGE (q:Quarter {id: $quarter_id})
-                    SET q.year = $year,
-                        q.quarter = $quarter,
-                        q.yearQuarter = $quarter_id
-                    MERGE (y)-[:CONTAINS]->(q)
-                    """,
-                    "parameters": {
-                        "year": year,
-                        "quarter": quarter,
-                        "quarter_id": quarter_id
-                    }
-                })
+        rows = [
+            {"year": year, "quarter": quarter, "quarter_id": f"{year}-Q{quarter}"}
+            for year in range(start_year, end_year + 1)
+            for quarter in range(1, 5)
+        ]
 
-        count = self._execute_batch(queries)
+        count = self._execute_unwind(_QUARTER_CYPHER, rows)
         logger.info(f"  ✓ Created {count} Quarter nodes")
         return count
 
@@ -137,36 +190,83 @@ class AggregationNodes(Neo4jBase):
         Returns:
             int: Number of month nodes created
         """
-        queries = []
+        rows = []
         for year in range(start_year, end_year + 1):
             for month in range(1, 13):
                 quarter = (month - 1) // 3 + 1
-                quarter_id = f"{year}-Q{quarter}"
-                month_id = f"{year}-{month:02d}"
-
-                queries.append({
-                    "query": """
-                    MATCH (q:Quarter {id: $quarter_id})
-                    MERGE (m:Month {id: $month_id})
-                    SET m.year = $year,
-                        m.month = $month,
-                        m.yearMonth = $month_id,
-                        m.quarter = $quarter
-                    MERGE (q)-[:CONTAINS]->(m)
-                    """,
-                    "parameters": {
-                        "year": year,
-                        "month": month,
-                        "quarter": quarter,
-                        "quarter_id": quarter_id,
-                        "month_id": month_id
-                    }
+                rows.append({
+                    "year": year,
+                    "month": month,
+                    "quarter": quarter,
+                    "quarter_id": f"{year}-Q{quarter}",
+                    "month_id": f"{year}-{month:02d}"
                 })
 
-        count = self._execute_batch(queries)
+        count = self._execute_unwind(_MONTH_CYPHER, rows)
         logger.info(f"  ✓ Created {count} Month nodes")
         return count
 
+    def create_period_hierarchy(self, start_year: int = 2020, end_year: int = 2030) -> int:
+        """Create Year→Quarter→Month hierarchy in a single server-side query
+
+        Equivalent to create_year_nodes() + create_quarter_nodes() + create_month_nodes(),
+        but generates all periods and CONTAINS relationships with range()/UNWIND in one
+        round trip and one transaction (10 years: 1 query instead of 3).
+
+        TODO: Customize year range (see create_year_nodes)
+
+        Args:
+            start_year: First year
+            end_year: Last year
+
+        Returns:
+            int: Number of period nodes created (years + quarters + months)
+        """
+        query = """
+        UNWIND range($startYear, $endYear) AS yr
+        MERGE (y:Year {year: yr})
+        SET y.yearString = toString(yr)
+        WITH y, yr
+        UNWIND range(1, 4) AS qtr
+        WITH y, yr, qtr, toString(yr) + '-Q' + toString(qtr) AS quarterId
+        MERGE (q:Quarter {id: quarterId})
+        SET q.year = yr,
+            q.quarter = qtr,
+            q.yearQuarter = quarterId
+        MERGE (y)-[:CONTAINS]->(q)
+        WITH q, yr, qtr
+        UNWIND range((qtr - 1) * 3 + 1, qtr * 3) AS mon
+        WITH q, yr, qtr, mon, toString(yr) + '-' + right('0' + toString(mon), 2) AS monthId
+        MERGE (m:Month {id: monthId})
+        SET m.year = yr,
+            m.month = mon,
+            m.yearMonth = monthId,
+            m.yearMonthInt = yr * 100 + mon,
+            m.quarter = qtr
+        MERGE (q)-[:CONTAINS]->(m)
+        RETURN count(m) AS months
+        """
+
+        def _work(tx):
+            record = tx.run(query, startYear=start_year, endYear=end_year).single()
+            return record["months"] if record else 0
+
+        # One managed write transaction: a single commit (one fsync) for all three
+        # levels, retried automatically by the driver on transient errors (deadlocks)
+        try:
+            months = self._session().execute_write(_work)
+        except Exception as e:
+            logger.error(f"Failed to create period hierarchy: {e}")
+            raise
+
+        years = max(end_year - start_year + 1, 0)
+        count = years + years * 4 + months
+        logger.info(
+            f"  ✓ Created {years} Year, {years * 4} Quarter, {months} Month nodes "
+            f"({start_year}-{end_year})"
+        )
+        return count
+
     def create_day_nodes(self, start_date: str = "2020-01-01", end_date: str = "2030-12-31") -> int:
         """Create Day aggregation nodes (optional for very detailed analytics)
 
@@ -184,45 +284,37 @@ class AggregationNodes(Neo4jBase):
         Returns:
             int: Number of day nodes created
         """
-        queries = []
-        current = datetime.strptime(start_date, "%Y-%m-%d")
-        end = datetime.strptime(end_date, "%Y-%m-%d")
-
-        while current <= end:
-            year = current.year
-            month = current.month
-            day = current.day
-            date_str = current.strftime("%Y-%m-%d")
-            month_id = f"{year}-{month:02d}"
-
-            queries.append({
-                "query": """
-                MATCH (m:Month {id: $month_id})
-                MERGE (d:Day {id: $date_str})
-                SET d.year = $year,
-                    d.month = $month,
-                    d.day = $day,
-                    d.date = $date_str
-                MERGE (m)-[:CONTAINS]->(d)
-                """,
-                "parameters": {
-                    "year": year,
-                    "month": month,
-                    "day": day,
-                    "date_str": date_str,
-                    "month_id": month_id
-                }
+        # Walk integer ordinals; isoformat() gives YYYY-MM-DD and its [:7] prefix is the month id
+        first = date.fromisoformat(start_date).toordinal()
+        last = date.fromisoformat(end_date).toordinal()
+        days = [date.fromordinal(ordinal) for ordinal in range(first, last + 1)]
+
+        rows = []
+        for d in days:
+            date_str = d.isoformat()
+            rows.append({
+                "year": d.year,
+                "month": d.month,
+                "day": d.day,
+                "date_str": date_str,
+                "month_id": date_str[:7]
             })
 
-            current += timedelta(days=1)
-
-        if queries:
-            count = self._execute_batch(queries)
+        if rows:
+            # Commit in chunks so a 10-year range doesn't build one giant transaction
+            count = self._execute_unwind(_DAY_CYPHER, rows, batch_size=self.BATCH_SIZE)
             logger.info(f"  ✓ Created {count} Day nodes ({start_date} to {end_date})")
             return count
         return 0
 
-    def link_facts_to_periods(self, fact_entity: str, date_property: str) -> int:
+    def link_facts_to_periods(
+        self,
+        fact_entity: str,
+        date_property: str,
+        rows_per_transaction: int = 10000,
+        relink: bool = False,
+        year_month_property: Optional[str] = None
+    ) -> int:
         """Link fact entities (WorkHour, Invoice) to time-period nodes
 
         Creates RECORDED_IN relationships between fact nodes and Month nodes.
@@ -235,35 +327,123 @@ class AggregationNodes(Neo4jBase):
         Args:
             fact_entity: Entity type (e.g., "WorkHour", "Invoice")
             date_property: Property containing date (e.g., "eventDate", "invoiceDate")
+            rows_per_transaction: Facts committed per server-side transaction
+                                  (CALL ... IN TRANSACTIONS; bounds tx-state memory)
+            relink: If False (default), only facts without a RECORDED_IN link are
+                    processed, so incremental runs skip already-linked facts.
+                    Set True after fact dates were edited to re-check every fact.
+            year_month_property: Integer YYYYMM property precomputed on facts at
+                    sync time (e.g., "yearMonthInt"). When given, facts join
+                    Month.yearMonthInt directly - no per-row date() parsing:
+                    SET wh.yearMonthInt = date(wh.eventDate).year * 100
+                                          + date(wh.eventDate).month
 
         Returns:
             int: Number of relationships created
         """
+        # Month id "YYYY-MM" built with right('0' + ...) (Cypher has no sprintf);
+        # Month.id lookup is an index seek via the Month_id_unique constraint (migration 001).
+        # Committed in batches so large fact counts don't build one unbounded transaction.
+        unlinked_filter = "" if relink else "AND NOT (f)-[:RECORDED_IN]->(:Month)"
+        if year_month_property:
+            key_property = year_month_property
+            month_match = f"MATCH (m:Month {{yearMonthInt: f.{year_month_property}}})"
+        else:
+            key_property = date_property
+            month_match = f"""WITH f, date(f.{date_property}) as d
+            WITH f, toString(d.year) + '-' + right('0' + toString(d.month), 2) as monthId
+            MATCH (m:Month {{id: monthId}})"""
+
         query = f"""
         MATCH (f:{fact_entity})
-        WHERE f.{date_property} IS NOT NULL
-        WITH f, f.{date_property} as dateStr
-        WITH f, dateStr,
-             date(dateStr).year as year,
-             date(dateStr).month as month
-        WITH f, dateStr, year, month,
-             year + '-' + sprintf('%02d', month) as monthId
-        MATCH (m:Month {{id: monthId}})
-        MERGE (f)-[:RECORDED_IN]->(m)
-        RETURN count(*) as count
+        WHERE f.{key_property} IS NOT NULL {unlinked_filter}
+        CALL {{
+            WITH f
+            {month_match}
+            MERGE (f)-[:RECORDED_IN]->(m)
+            RETURN count(*) as linked
+        }} IN TRANSACTIONS OF $rowsPerTransaction ROWS
+        RETURN sum(linked) as count
         """
 
         try:
-            with self.driver.session(database=self.config.database) as session:
-                result = session.run(query)
-                record = result.single()
-                count = record["count"] if record else 0
-                logger.info(f"  ✓ Linked {count} {fact_entity} entities to Month periods")
-                return count
+            # Auto-commit run is required for CALL ... IN TRANSACTIONS
+            record = self._run_autocommit(query, {"rowsPerTransaction": rows_per_transaction})
+            count = record["count"] if record else 0
+            logger.info(f"  ✓ Linked {count} {fact_entity} entities to Month periods")
+            return count
         except Exception as e:
             logger.error(f"Failed to link {fact_entity} to periods: {e}")
             return 0
 
+    def link_facts_to_periods_apoc(
+        self,
+        fact_entity: str,
+        date_property: str,
+        batch_size: int = 10000,
+        parallel: bool = False,
+        concurrency: int = 8
+    ) -> int:
+        """Link fact entities to Month nodes with apoc.periodic.iterate (requires APOC)
+
+        For very large fact sets: APOC streams unlinked facts and commits every
+        batch_size rows, optionally in parallel batches.
+
+        parallel=True is off by default: facts from the same month all lock that
+        Month node when the relationship is created, so parallel batches can hit
+        lock contention. Enable it when facts are spread over many months.
+
+        Args:
+            fact_entity: Entity type (e.g., "WorkHour", "Invoice")
+            date_property: Property containing date (e.g., "eventDate", "invoiceDate")
+            batch_size: Facts per committed batch
+            parallel: Run batches concurrently
+            concurrency: Parallel batch workers (when parallel=True)
+
+        Returns:
+            int: Number of facts processed in committed batches
+        """
+        iterate_query = f"""
+        MATCH (f:{fact_entity})
+        WHERE f.{date_property} IS NOT NULL AND NOT (f)-[:RECORDED_IN]->(:Month)
+        RETURN f
+        """
+        action_query = f"""
+        WITH f, date(f.{date_property}) as d
+        MATCH (m:Month {{id: toString(d.year) + '-' + right('0' + toString(d.month), 2)}})
+        MERGE (f)-[:RECORDED_IN]->(m)
+        """
+        query = """
+        CALL apoc.periodic.iterate($iterateQuery, $actionQuery, {
+            batchSize: $batchSize, parallel: $parallel, concurrency: $concurrency
+        })
+        YIELD committedOperations, failedOperations, errorMessages
+        RETURN committedOperations, failedOperations, errorMessages
+        """
+        params = {
+            "iterateQuery": iterate_query,
+            "actionQuery": action_query,
+            "batchSize": batch_size,
+            "parallel": parallel,
+            "concurrency": concurrency
+        }
+
+        try:
+            result = self._execute_query_with_result(query, params)
+        except Exception as e:
+            logger.error(f"Failed to link {fact_entity} to periods via APOC: {e}")
+            return 0
+
+        record = result[0] if result else {}
+        count = record.get("committedOperations", 0)
+        if record.get("failedOperations"):
+            logger.warning(
+                f"  ⚠ {record['failedOperations']} {fact_entity} link operations failed: "
+                f"{record.get('errorMessages')}"
+            )
+        logger.info(f"  ✓ Linked {count} {fact_entity} entities to Month periods (APOC)")
+        return count
+
     # TODO: Add more aggregation levels or custom periods
     # Example:
     # def create_week_nodes(self) -> int:
@@ -9,7 +9,7 @@ Rationale:
 Pattern Implementation:
 - Inherit from Neo4jBase for Neo4j operations
 - calculate_period_metrics() aggregates and stores on time-period nodes
-- Support incremental updates (specific periods or all)
+- Support incremental updates (specific periods, dirty periods, or all)
 - Methods match metrics/ module pattern but write to different nodes
 
 TODO: Customize for your {API_NAME}:
@@ -32,12 +32,113 @@ Trade-offs:
 - Staleness if not updated frequently
 """
 import logging
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Optional
+from neo4j import Result
 from ..neo4j_base import Neo4jBase
 
 logger = logging.getLogger(__name__)
 
 
+# Key property per period label (matches AggregationNodes.PERIOD_CONSTRAINTS):
+# Month/Quarter are keyed by id ("2025-01", "2025-Q1"), Year by its number
+_PERIOD_KEYS = MappingProxyType({"month": "id", "quarter": "id", "year": "year"})
+
+
+def _period_metrics_cypher(label: str, key: str = "id") -> str:
+    """Build the period metrics query for a period label (Month, Quarter, Year)
+
+    The period filter is a parameter ($periods = null means all periods), so full
+    and incremental refreshes share one query text and one cached Neo4j plan.
+    $periods holds values of the label's key property (key).
+    """
+    return f"""
+MATCH (p:{label})
+WHERE $periods IS NULL OR p.{key} IN $periods
+
+// Each aggregation runs in its own CALL subquery returning one row per period,
+// so OPTIONAL MATCHes never multiply into a (hours x invoices x users) cross product
+
+// TODO: Aggregate work hours linked to this period
+// Adjust RECORDED_IN relationship and properties as needed
+CALL {{
+    WITH p
+    OPTIONAL MATCH (p)<-[:RECORDED_IN]-(wh:WorkHour)
+    RETURN sum(wh.quantity) as totalHours,
+           sum(CASE WHEN wh.isBillable THEN wh.quantity ELSE 0 END) as billableHours,
+           sum(CASE WHEN NOT wh.isBillable THEN wh.quantity ELSE 0 END) as nonBillableHours,
+           sum(wh.quantity * COALESCE(wh.unitCost, 0)) as totalCost
+}}
+
+// TODO: Aggregate revenue linked to this period
+// Adjust RECORDED_IN relationship and properties as needed
+CALL {{
+    WITH p
+    OPTIONAL MATCH (p)<-[:RECORDED_IN]-(inv:Invoice)
+    RETURN sum(inv.totalAmount) as totalRevenue
+}}
+
+// TODO: Count unique projects and users (optional)
+CALL {{
+    WITH p
+    OPTIONAL MATCH (p)<-[:RECORDED_IN]-(:WorkHour)-[:LOGGED_BY]-(u:User)
+    RETURN count(DISTINCT u.guid) as uniqueUsers
+}}
+
+CALL {{
+    WITH p
+    OPTIONAL MATCH (p)<-[:RECORDED_IN]-(:WorkHour)-[:FOR_PROJECT]-(proj:Project)
+    RETURN count(DISTINCT proj.guid) as uniqueProjects
+}}
+
+// Single terminal WITH: sum()/count() over no rows already yield 0, so the
+// subquery results need no COALESCE pass-through.
+// Skip the write when nothing underneath changed (no property writes,
+// no write locks, no tx log traffic); NULL (never denormalized) counts as changed
+WITH p, totalHours, billableHours, nonBillableHours, totalCost, totalRevenue,
+     uniqueUsers, uniqueProjects,
+     COALESCE(
+         p.totalHours <> totalHours OR
+         p.billableHours <> billableHours OR
+         p.nonBillableHours <> nonBillableHours OR
+         p.totalCost <> totalCost OR
+         p.totalRevenue <> totalRevenue OR
+         p.uniqueUsers <> uniqueUsers OR
+         p.uniqueProjects <> uniqueProjects,
+         true
+     ) as changed
+
+// TODO: Step 5 - Set denormalized properties
+FOREACH (_ IN CASE WHEN changed THEN [1] ELSE [] END |
+    SET p.totalHours = totalHours,
+        p.billableHours = billableHours,
+        p.nonBillableHours = nonBillableHours,
+        p.totalCost = totalCost,
+        p.totalRevenue = totalRevenue,
+        p.margin = totalRevenue - totalCost,
+        p.marginPct = CASE
+            WHEN totalRevenue > 0
+            THEN ((totalRevenue - totalCost) / totalRevenue) * 100
+            ELSE 0
+        END,
+        p.uniqueUsers = uniqueUsers,
+        p.uniqueProjects = uniqueProjects,
+        p.lastDenormalizedAt = datetime()
+)
+
+RETURN count(p) as periodCount,
+       sum(CASE WHEN changed THEN 1 ELSE 0 END) as changedCount
+"""
+
+
+# Built once at import (read-only) - calculate_period_metrics never rebuilds query text
+_PERIOD_METRICS_CYPHER = MappingProxyType({
+    period_type: _period_metrics_cypher(period_type.capitalize(), key)
+    for period_type, key in _PERIOD_KEYS.items()
+})
+
+
 class Denormalization(Neo4jBase):
     """Handles denormalizing metrics onto time-period and entity nodes
 
@@ -67,6 +168,9 @@ class Denormalization(Neo4jBase):
     }
     """
 
+    # Period metrics Cypher keyed by period_type ("month", "quarter", "year")
+    _QUERIES = _PERIOD_METRICS_CYPHER
+
     def calculate_period_metrics(self, period_type: str = "month", periods: Optional[List[str]] = None) -> int:
         """Calculate and denormalize metrics on time-period nodes
 
@@ -81,8 +185,8 @@ class Denormalization(Neo4jBase):
 
         Args:
             period_type: "month", "quarter", or "year"
-            periods: Optional list of specific period IDs to update
-                    (e.g., ["2025-01", "2025-02"] for months)
+            periods: Optional list of specific period keys to update
+                    (e.g., ["2025-01", "2025-02"] for months, [2024, 2025] for years)
                     If None, updates all periods
 
         Returns:
@@ -91,79 +195,224 @@ class Denormalization(Neo4jBase):
         if periods is not None and len(periods) == 0:
             return 0
 
-        # TODO: Customize for your {API_NAME}
+        # TODO: Customize _period_metrics_cypher() for your {API_NAME}
         # This is a template query - adjust based on:
         # - Fact entity names (WorkHour, TimeEntry, etc.)
         # - Revenue source (Invoice, TimeTracking, etc.)
         # - Cost calculation method
-        where_clause = f"WHERE p.id IN $periods" if periods else ""
-        params = {"periods": periods} if periods else {}
+        query = self._QUERIES.get(period_type) or _period_metrics_cypher(
+            period_type.capitalize()
+        )
+        params = {"periods": periods}
 
-        query = f"""
-        MATCH (p:{period_type.capitalize()})
-        {where_clause}
+        try:
+            record = self._execute_eager(query, params, result_transformer=Result.single)
+            count = record["periodCount"] if record else 0
+            changed = record["changedCount"] if record else 0
+            logger.info(
+                f"  ✓ Denormalized {count} {period_type.capitalize()} metrics "
+                f"({changed} changed, {count - changed} unchanged)"
+            )
+            return count
+        except Exception as e:
+            logger.error(f"Failed to calculate {period_type} metrics: {e}")
+            logger.debug(f"Query: {query}")
+            logger.debug(f"Params: {params}")
+            return 0
 
-        // TODO: Aggregate work hours linked to this period
-        // Adjust RECORDED_IN relationship and properties as needed
-        OPTIONAL MATCH (p)<-[:RECORDED_IN]-(wh:WorkHour)
-        WITH p,
-             sum(wh.quantity) as totalHours,
-             sum(CASE WHEN wh.isBillable THEN wh.quantity ELSE 0 END) as billableHours,
-             sum(CASE WHEN NOT wh.isBillable THEN wh.quantity ELSE 0 END) as nonBillableHours,
-             sum(wh.quantity * COALESCE(wh.unitCost, 0)) as totalCost
+    def calculate_period_metrics_parallel(
+        self,
+        period_type: str = "month",
+        periods: Optional[List[str]] = None,
+        shards: int = 8
+    ) -> int:
+        """Calculate period metrics with the period list split across concurrent queries
+
+        Periods write disjoint nodes, so shards don't contend for locks.
+        Each shard is a calculate_period_metrics() call in its own managed transaction.
+
+        Args:
+            period_type: "month", "quarter", or "year"
+            periods: Period keys to update (None = all periods of this type)
+            shards: Concurrent queries (keep <= Neo4j connection pool size)
 
-        // TODO: Aggregate revenue linked to this period
-        // Adjust RECORDED_IN relationship and properties as needed
-        OPTIONAL MATCH (p)<-[:RECORDED_IN]-(inv:Invoice)
-        WITH p, totalHours, billableHours, nonBillableHours, totalCost,
-             sum(inv.totalAmount) as totalRevenue
-
-        // TODO: Count unique projects and users (optional)
-        OPTIONAL MATCH (p)<-[:RECORDED_IN]-(wh2:WorkHour)-[:LOGGED_BY]-(u:User)
-        WITH p, totalHours, billableHours, nonBillableHours, totalCost, totalRevenue,
-             count(DISTINCT u.guid) as uniqueUsers
-
-        OPTIONAL MATCH (p)<-[:RECORDED_IN]-(wh3:WorkHour)-[:FOR_PROJECT]-(proj:Project)
-        WITH p, totalHours, billableHours, nonBillableHours, totalCost, totalRevenue, uniqueUsers,
-             count(DISTINCT proj.guid) as uniqueProjects
-
-        // TODO: Step 5 - Set denormalized properties
-        SET p.totalHours = COALESCE(totalHours, 0),
-            p.billableHours = COALESCE(billableHours, 0),
-            p.nonBillableHours = COALESCE(nonBillableHours, 0),
-            p.totalCost = COALESCE(totalCost, 0),
-            p.totalRevenue = COALESCE(totalRevenue, 0),
-            p.margin = COALESCE(totalRevenue, 0) - COALESCE(totalCost, 0),
-            p.marginPct = CASE
-                WHEN totalRevenue > 0
-                THEN ((totalRevenue - COALESCE(totalCost, 0)) / totalRevenue) * 100
-                ELSE 0
-            END,
-            p.uniqueUsers = COALESCE(uniqueUsers, 0),
-            p.uniqueProjects = COALESCE(uniqueProjects, 0),
-            p.lastDenormalizedAt = datetime()
-
-        RETURN count(p) as periodCount
+        Returns:
+            int: Number of periods updated
+        """
+        if periods is None:
+            try:
+                key = _PERIOD_KEYS.get(period_type, "id")  # Year nodes have no id
+                result = self._execute_query_with_result(
+                    f"MATCH (p:{period_type.capitalize()}) RETURN p.{key} as id", {}
+                )
+            except Exception as e:
+                logger.error(f"Failed to list {period_type} periods: {e}")
+                return 0
+            periods = [record["id"] for record in result if record["id"] is not None]
+
+        chunks = [chunk for chunk in (periods[i::shards] for i in range(shards)) if chunk]
+        if not chunks:
+            return 0
+
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            counts = executor.map(
+                lambda chunk: self.calculate_period_metrics(period_type, chunk), chunks
+            )
+            return sum(counts)
+
+    # =========================================================================
+    # Incremental (dirty period) updates
+    # =========================================================================
+
+    DIRTY_PERIODS_KEY = "dirty_months"
+
+    def mark_periods_dirty(self, period_ids: Iterable[str]) -> int:
+        """Persist period IDs touched by a sync so their metrics get recalculated
+
+        Stored on a (:SyncState {key: "dirty_months"}) node so a failed or
+        interrupted run doesn't lose pending updates.
+
+        Usage (during fact sync):
+            dirty.add(work_hour["eventDate"][:7])     # "2025-01"
+            ...
+            denorm.mark_periods_dirty(dirty)
+            denorm.calculate_dirty_period_metrics()
+
+        Args:
+            period_ids: Month IDs (YYYY-MM) of inserted/updated facts
+
+        Returns:
+            int: Number of period IDs marked
+        """
+        period_ids = sorted(set(period_ids))
+        if not period_ids:
+            return 0
+
+        query = """
+        MERGE (s:SyncState {key: $key})
+        SET s.periods = [x IN COALESCE(s.periods, []) WHERE NOT x IN $periods] + $periods,
+            s.updatedAt = datetime()
         """
 
         try:
-            with self.driver.session(database=self.config.database) as session:
-                result = session.run(query, params)
-                record = result.single()
-                count = record["periodCount"] if record else 0
-                logger.info(f"  ✓ Denormalized {count} {period_type.capitalize()} metrics")
-                return count
+            self._execute_query(query, {"key": self.DIRTY_PERIODS_KEY, "periods": period_ids})
+            logger.info(f"  ✓ Marked {len(period_ids)} periods dirty")
+            return len(period_ids)
         except Exception as e:
-            logger.error(f"Failed to calculate {period_type} metrics: {e}")
-            logger.debug(f"Query: {query}")
-            logger.debug(f"Params: {params}")
+            logger.error(f"Failed to mark periods dirty: {e}")
             return 0
 
+    def install_dirty_period_trigger(
+        self,
+        fact_dates: Optional[Dict[str, str]] = None,
+        trigger_name: str = "dirty_periods"
+    ) -> bool:
+        """Track dirty months server-side with an APOC trigger (requires APOC triggers)
+
+        Alternative to collecting dirty_periods in the orchestrator: every commit that
+        creates or updates a fact node appends its YYYY-MM to the same SyncState node
+        read by calculate_dirty_period_metrics(), so sync modules need no bookkeeping.
+
+        Requires apoc.trigger.enabled=true in apoc.conf. Installed via the system
+        database; idempotent (re-installing replaces the trigger).
+
+        Args:
+            fact_dates: Fact label -> date property (YYYY-MM-DD...)
+                        (default: {"WorkHour": "eventDate", "Invoice": "invoiceDate"})
+            trigger_name: APOC trigger name
+
+        Returns:
+            bool: True if installed
+        """
+        fact_dates = fact_dates or {"WorkHour": "eventDate", "Invoice": "invoiceDate"}
+        date_case = " ".join(
+            f"WHEN n:{label} THEN n.{prop}" for label, prop in fact_dates.items()
+        )
+
+        statement = f"""
+        WITH $createdNodes + [a IN reduce(acc = [], k IN keys($assignedNodeProperties) |
+                                          acc + $assignedNodeProperties[k]) | a.node] as touched
+        UNWIND touched as n
+        WITH DISTINCT n, CASE {date_case} END as dateValue
+        WHERE dateValue IS NOT NULL
+        WITH collect(DISTINCT substring(toString(dateValue), 0, 7)) as months
+        WHERE size(months) > 0
+        MERGE (s:SyncState {{key: '{self.DIRTY_PERIODS_KEY}'}})
+        SET s.periods = [x IN COALESCE(s.periods, []) WHERE NOT x IN months] + months
+        """
+
+        try:
+            with self.driver.session(database="system") as session:
+                session.run(
+                    "CALL apoc.trigger.install("
+                    "$database, $name, $statement, {phase: 'afterAsync'})",
+                    {
+                        "database": self.config.database,
+                        "name": trigger_name,
+                        "statement": statement
+                    }
+                ).consume()
+            logger.info(
+                f"  ✓ Installed APOC trigger '{trigger_name}' for {', '.join(fact_dates)}"
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Failed to install dirty period trigger: {e}")
+            return False
+
+    def calculate_dirty_period_metrics(self) -> int:
+        """Recalculate metrics only for periods marked dirty, then clear them
+
+        Steady-state syncs touch a handful of months, so this scans only their
+        facts instead of every WorkHour/Invoice (see calculate_period_metrics).
+
+        Returns:
+            int: Number of periods updated
+        """
+        try:
+            result = self._execute_query_with_result(
+                "MATCH (s:SyncState {key: $key}) RETURN s.periods as periods",
+                {"key": self.DIRTY_PERIODS_KEY}
+            )
+        except Exception as e:
+            logger.error(f"Failed to read dirty periods: {e}")
+            return 0
+
+        periods = (result[0]["periods"] if result else None) or []
+        if not periods:
+            logger.info("  ⊙ No dirty periods to recalculate")
+            return 0
+
+        count = self.calculate_period_metrics("month", periods=periods)
+        if count == 0:
+            # calculate_period_metrics logs and returns 0 on failure - keep periods dirty
+            logger.warning(f"  ⚠ No periods updated, keeping {len(periods)} marked dirty")
+            return 0
+
+        try:
+            self._execute_query("""
+            MATCH (s:SyncState {key: $key})
+            SET s.periods = [x IN COALESCE(s.periods, []) WHERE NOT x IN $periods]
+            """, {"key": self.DIRTY_PERIODS_KEY, "periods": periods})
+        except Exception as e:
+            logger.error(f"Failed to clear dirty periods: {e}")
+
+        return count
+
+    # Properties SET per node by the summary queries below
+    # (keep in sync with their SET clauses - used to derive node counts from counters)
+    _CUSTOMER_SUMMARY_PROPS = 4
+    _USER_SUMMARY_PROPS = 4
+
     def calculate_customer_summaries(self, customer_guids: Optional[List[str]] = None) -> int:
         """Denormalize Customer-level metrics
 
         Aggregates project revenue, hours, and costs per customer.
 
+        Two-stage rollup: reads Project.hoursWorked / Project.totalRevenue cached by
+        ProjectMetrics.calculate_project_metrics() (orchestrator step 7), so this
+        scans Projects, not WorkHours. Run it after project metrics are current.
+
         TODO: Implement based on your entity relationships:
         - Customer-Project-WorkHour-User relationships
         - Revenue from invoices or work hours
@@ -200,21 +449,48 @@ class Denormalization(Neo4jBase):
             c.totalHours = COALESCE(customerHours, 0),
             c.totalRevenue = COALESCE(customerRevenue, 0),
             c.lastDenormalizedAt = datetime()
-
-        RETURN count(c) as customerCount
         """
 
         try:
-            with self.driver.session(database=self.config.database) as session:
-                result = session.run(query, params)
-                record = result.single()
-                count = record["customerCount"] if record else 0
-                logger.info(f"  ✓ Updated {count} Customer denormalized metrics")
-                return count
+            summary = self._execute_eager(query, params, result_transformer=Result.consume)
+            # No RETURN row to materialize - derive node count from write counters
+            count = summary.counters.properties_set // self._CUSTOMER_SUMMARY_PROPS
+            logger.info(
+                f"  ✓ Updated {count} Customer denormalized metrics "
+                f"({summary.result_available_after} ms)"
+            )
+            return count
         except Exception as e:
             logger.error(f"Failed to calculate Customer summaries: {e}")
             return 0
 
+    def calculate_customer_summaries_for_projects(self, project_guids: List[str]) -> int:
+        """Re-roll Customer summaries only for customers owning the given projects
+
+        Use after an incremental ProjectMetrics.calculate_project_metrics(project_guids)
+        so a few changed Projects don't trigger a full Customer pass.
+
+        Args:
+            project_guids: GUIDs of projects whose metrics were just recalculated
+
+        Returns:
+            int: Number of customers updated
+        """
+        if not project_guids:
+            return 0
+
+        try:
+            result = self._execute_query_with_result("""
+            MATCH (c:Customer)-[:HAS_PROJECT]->(p:Project)
+            WHERE p.guid IN $projectGuids
+            RETURN DISTINCT c.guid as guid
+            """, {"projectGuids": project_guids})
+        except Exception as e:
+            logger.error(f"Failed to find customers for changed projects: {e}")
+            return 0
+
+        return self.calculate_customer_summaries([record["guid"] for record in result])
+
     def calculate_user_summaries(self, user_guids: Optional[List[str]] = None) -> int:
         """Denormalize User-level metrics
 
@@ -256,21 +532,46 @@ class Denormalization(Neo4jBase):
             u.billableHours = COALESCE(billableHours, 0),
             u.totalCost = COALESCE(totalCost, 0),
             u.lastDenormalizedAt = datetime()
-
-        RETURN count(u) as userCount
         """
 
         try:
-            with self.driver.session(database=self.config.database) as session:
-                result = session.run(query, params)
-                record = result.single()
-                count = record["userCount"] if record else 0
-                logger.info(f"  ✓ Updated {count} User denormalized metrics")
-                return count
+            summary = self._execute_eager(query, params, result_transformer=Result.consume)
+            count = summary.counters.properties_set // self._USER_SUMMARY_PROPS
+            logger.info(
+                f"  ✓ Updated {count} User denormalized metrics "
+                f"({summary.result_available_after} ms)"
+            )
+            return count
         except Exception as e:
             logger.error(f"Failed to calculate User summaries: {e}")
             return 0
 
+    def calculate_all_summaries(self, max_workers: int = 5) -> Dict[str, int]:
+        """Run all denormalization queries concurrently
+
+        Period (month/quarter/year), customer, and user summaries write disjoint
+        properties on different labels, so they can run in parallel. The driver is
+        thread-safe and each method runs its own managed transaction on it.
+
+        Args:
+            max_workers: Concurrent queries (keep <= Neo4j connection pool size)
+
+        Returns:
+            Dict[str, int]: Updated node count per summary
+        """
+        jobs = {
+            "month": lambda: self.calculate_period_metrics("month"),
+            "quarter": lambda: self.calculate_period_metrics("quarter"),
+            "year": lambda: self.calculate_period_metrics("year"),
+            "customers": self.calculate_customer_summaries,
+            "users": self.calculate_user_summaries,
+        }
+
+        # Each method logs and returns 0 on failure, so result() doesn't raise
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {name: executor.submit(job) for name, job in jobs.items()}
+            return {name: future.result() for name, future in futures.items()}
+
     # TODO: Add more denormalization methods
     # Example:
     # def calculate_project_denormalized_metrics(self) -> int:
@@ -0,0 +1,136 @@
+"""
+Reference Data Cache
+====================
+In-process stale-while-revalidate cache for rarely changing API data
+(categories, statuses, types, ...).
+
+- Fresh (younger than ttl): served from cache
+- Stale (younger than stale_ttl): served from cache, refreshed in a background thread
+- Expired or missing: fetched synchronously
+
+A failed background refresh keeps serving the last good value until it expires.
+The cache lives for the process, so it pays off when syncs run repeatedly in
+one process (scheduler loop, long-running worker); a one-shot CLI run always misses.
+"""
+
+import functools
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Set
+
+logger = logging.getLogger(__name__)
+
+
+class ReferenceCache:
+    """
+    Thread-safe store of {key: {"value": ..., "ts": ...}} entries
+
+    Example:
+        categories = REFERENCE_CACHE.get(
+            "categories", api.fetch_categories, ttl=3600, stale_ttl=86400
+        )
+
+    Args:
+        clock: Monotonic seconds source for entry ages (injectable for tests)
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._entries: Dict[Hashable, Dict[str, Any]] = {}
+        self._refreshing: Set[Hashable] = set()
+        self._lock = threading.Lock()
+        self._clock = clock
+
+    def get(self, key: Hashable, loader: Callable[[], Any], ttl: float, stale_ttl: float) -> Any:
+        """
+        Get a value, loading or refreshing it as needed
+
+        Args:
+            key: Cache key
+            loader: Zero-argument callable fetching the current value
+            ttl: Seconds a value is served without refreshing
+            stale_ttl: Seconds a value may be served while a refresh runs
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            age = self._clock() - entry["ts"] if entry else None
+
+            if entry and age < ttl:
+                return entry["value"]
+
+            if entry and age < stale_ttl:
+                if key not in self._refreshing:
+                    self._refreshing.add(key)
+                    threading.Thread(
+                        target=self._refresh,
+                        args=(key, loader),
+                        name="reference-refresh",
+                        daemon=True
+                    ).start()
+                return entry["value"]
+
+        # Missing or expired: block on the loader
+        value = loader()
+        self._store(key, value)
+        return value
+
+    def _refresh(self, key: Hashable, loader: Callable[[], Any]):
+        """Background refresh; keeps the stale value on failure"""
+        try:
+            self._store(key, loader())
+        except Exception as e:
+            logger.warning(f"⚠ Background refresh failed for {key!r}, serving stale value: {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _store(self, key: Hashable, value: Any):
+        with self._lock:
+            self._entries[key] = {"value": value, "ts": self._clock()}
+
+    def clear(self):
+        """Drop all entries (e.g. in tests or after a known upstream change)"""
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared by all clients in the process
+REFERENCE_CACHE = ReferenceCache()
+
+
+def stale_while_revalidate(
+    ttl: float = 3600,
+    stale_ttl: float = 86400,
+    cache: ReferenceCache = REFERENCE_CACHE
+):
+    """
+    Decorate an API client method so its result is served stale-while-revalidate
+
+    The key is the method's qualified name, the instance's config (or the
+    instance itself when it has none) and the arguments. Clients built from
+    equal configs share the entry; clients of different API accounts don't.
+
+    Example:
+        @stale_while_revalidate(ttl=3600, stale_ttl=86400)
+        def get_categories(self) -> List[Dict]:
+            return self._make_request("/categories")
+
+    Args:
+        ttl: Seconds a value is served without refreshing
+        stale_ttl: Seconds a value may be served while a refresh runs
+        cache: Cache to store entries in
+
+    Returns:
+        Decorator
+    """
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            owner = getattr(self, "config", self)
+            key = (method.__qualname__, owner, args, tuple(sorted(kwargs.items())))
+            return cache.get(key, lambda: method(self, *args, **kwargs), ttl, stale_ttl)
+        return wrapper
+    return decorator
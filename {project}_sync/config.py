@@ -7,12 +7,97 @@ TODO: Customize for your specific API
 """
 
 import os
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Optional
 
 
-@dataclass
-class {API}Config:
+# =============================================================================
+# Environment helpers (memoized - snapshot os.environ once, parse each variable once)
+# =============================================================================
+
+@lru_cache(maxsize=1)
+def _env() -> Mapping[str, str]:
+    """Read-only snapshot of os.environ, taken on first use"""
+    return MappingProxyType(dict(os.environ))
+
+
+def _getenv(name: str, default: Optional[str] = None) -> Optional[str]:
+    """os.getenv() against the cached environment snapshot"""
+    return _env().get(name, default)
+
+
+@lru_cache(maxsize=None)
+def _get_env_int(name: str, default: int) -> int:
+    """Read an integer environment variable, falling back to default"""
+    return int(_getenv(name, str(default)))
+
+
+@lru_cache(maxsize=None)
+def _get_env_float(name: str, default: float) -> float:
+    """Read a float environment variable, falling back to default"""
+    return float(_getenv(name, str(default)))
+
+
+@lru_cache(maxsize=None)
+def _get_env_bool(name: str, default: bool) -> bool:
+    """Read a boolean environment variable ("true" in any case is True)"""
+    return _getenv(name, str(default)).lower() == "true"
+
+
+@lru_cache(maxsize=None)
+def _entity_env_var(entity_name: str, suffix: str) -> str:
+    """Per-entity variable name: ("transactions", "DAYS_BACK") -> SYNC_TRANSACTIONS_DAYS_BACK"""
+    return f"SYNC_{entity_name.upper()}_{suffix}"
+
+
+def _env_field(reader: Callable[..., Any], name: str, default: Any = None) -> Any:
+    """
+    Dataclass field whose default is read from the environment per instance
+
+    A plain `x: int = _get_env_int(...)` default is evaluated once, when the
+    class is defined, so later env changes (and _clear_env_cache) never reach it.
+    """
+    return field(default_factory=partial(reader, name, default))
+
+
+def _clear_env_cache() -> None:
+    """Drop the env snapshot and memoized values (call after changing os.environ, e.g. in tests)"""
+    _env.cache_clear()
+    _get_env_int.cache_clear()
+    _get_env_float.cache_clear()
+    _get_env_bool.cache_clear()
+
+
+class _EnvConfig:
+    """
+    Base for the env-backed config dataclasses
+
+    Under pytest (PYTEST_CURRENT_TEST is set) every instantiation drops the env
+    cache first, so monkeypatch.setenv / patch.dict changes made mid-test are seen.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, *args, **kwargs):
+        if "PYTEST_CURRENT_TEST" in os.environ:
+            _clear_env_cache()
+        return super().__new__(cls)
+
+
+# =============================================================================
+# Validation helper (memoized - configs are frozen, so a valid one stays valid)
+# =============================================================================
+
+@lru_cache(maxsize=32)
+def _validated(config) -> bool:
+    """Run config._check() once per distinct config value (failures are not cached)"""
+    return config._check()
+
+
+@dataclass(slots=True, frozen=True)
+class {API}Config(_EnvConfig):
     """
     {API_NAME} API configuration
 
@@ -28,35 +113,61 @@ class {API}Config:
     - SYNC_MAX_RETRIES: Maximum retry attempts (default: 3)
     - SYNC_BATCH_SIZE: Batch size for bulk operations (default: 100)
     - SYNC_REQUEST_TIMEOUT: Request timeout in seconds (default: 60)
+    - SYNC_PARALLEL_REQUESTS: Pages fetched concurrently by _make_request_parallel (default: 8)
+    - SYNC_RATE_LIMIT: Client-side request rate limit in requests/second (default: 0 = off)
+    - SYNC_RATE_BURST: Requests allowed back-to-back before the rate limit applies (default: 10)
+    - SYNC_TOKEN_CACHE: File to persist the OAuth token in between runs (default: unset = off)
+    - SYNC_ETAG_CACHE: SQLite file for conditional-GET bodies/validators (default: unset = off)
 
     TODO: Customize fields for your API authentication method
     """
 
     # API connection
-    api_url: str = os.getenv("{API_NAME}_URL", "https://api.example.com/v1")
+    api_url: str = _env_field(_getenv, "{API_NAME}_URL", "https://api.example.com/v1")
 
     # OAuth credentials (TODO: adjust for your auth method)
-    client_id: str = os.getenv("{API_NAME}_CLIENT_ID", "")
-    client_secret: str = os.getenv("{API_NAME}_CLIENT_SECRET", "")
+    client_id: str = _env_field(_getenv, "{API_NAME}_CLIENT_ID", "")
+    client_secret: str = _env_field(_getenv, "{API_NAME}_CLIENT_SECRET", "")
 
     # Alternative: API key authentication
-    api_key: Optional[str] = os.getenv("{API_NAME}_API_KEY")
-
-    # Runtime state
-    token: Optional[str] = None  # OAuth token set after authentication
+    api_key: Optional[str] = _env_field(_getenv, "{API_NAME}_API_KEY")
 
     # Request configuration
-    max_retries: int = int(os.getenv("SYNC_MAX_RETRIES", "3"))
-    batch_size: int = int(os.getenv("SYNC_BATCH_SIZE", "100"))
-    request_timeout: int = int(os.getenv("SYNC_REQUEST_TIMEOUT", "60"))
+    max_retries: int = _env_field(_get_env_int, "SYNC_MAX_RETRIES", 3)
+    batch_size: int = _env_field(_get_env_int, "SYNC_BATCH_SIZE", 100)
+    request_timeout: int = _env_field(_get_env_int, "SYNC_REQUEST_TIMEOUT", 60)
+    parallel_requests: int = _env_field(_get_env_int, "SYNC_PARALLEL_REQUESTS", 8)
+
+    # Proactive rate limiting (token bucket): pace requests below the API's
+    # limit instead of reacting to 429s. TODO: set from your API's documented limit
+    rate_limit: float = _env_field(_get_env_float, "SYNC_RATE_LIMIT", 0.0)
+    rate_burst: int = _env_field(_get_env_int, "SYNC_RATE_BURST", 10)
+
+    # Reuse an unexpired OAuth token across process runs (e.g. ~/.cache/{project}/token.json)
+    token_cache_path: Optional[str] = _env_field(_getenv, "SYNC_TOKEN_CACHE")
+
+    # Stored responses for conditional GETs on endpoints that opt in
+    # (e.g. ~/.cache/{project}/http.sqlite)
+    etag_cache_path: Optional[str] = _env_field(_getenv, "SYNC_ETAG_CACHE")
+
+    # Response shape (TODO: match your API): body key holding the page's items
+    # ("" if the body itself is the list) and the header carrying the next page token
+    items_key: str = "items"
+    next_token_header: str = "NextPageToken"
 
     def validate(self) -> bool:
         """
         Validate required configuration is present
 
+        The result is memoized per config value; invalid configs raise every time.
+
         Returns:
             bool: True if valid, raises ValueError if invalid
         """
+        return _validated(self)
+
+    def _check(self) -> bool:
+        """Uncached validation body used by validate()"""
         if not self.api_url:
             raise ValueError("{API_NAME}_URL is required")
 
@@ -73,8 +184,20 @@ class {API}Config:
         return True
 
 
-@dataclass
-class Neo4jConfig:
+@dataclass(slots=True)
+class AuthState:
+    """
+    Mutable authentication state for an API client
+
+    Kept separate from {API}Config so the configuration itself stays frozen.
+    """
+
+    token: Optional[str] = None  # OAuth token set after authentication
+    expires_at: float = 0.0  # Epoch seconds the token expires (0 = unknown)
+
+
+@dataclass(slots=True, frozen=True)
+class Neo4jConfig(_EnvConfig):
     """
     Neo4j database configuration
 
@@ -87,20 +210,35 @@ class Neo4jConfig:
 
     Optional environment variables:
     - NEO4J_DATABASE: Database name (default: neo4j)
+    - NEO4J_POOL_SIZE: Max pooled connections (default: 200)
+    - NEO4J_FETCH_SIZE: Records pulled per round-trip (default: 10000)
+    - NEO4J_ACQUISITION_TIMEOUT: Seconds to wait for a pooled connection (default: 60)
     """
 
-    uri: str = os.getenv("NEO4J_URI", "bolt://localhost:7687")
-    username: str = os.getenv("NEO4J_USERNAME", "neo4j")
-    password: str = os.getenv("NEO4J_PASSWORD", "")
-    database: str = os.getenv("NEO4J_DATABASE", "neo4j")
+    uri: str = _env_field(_getenv, "NEO4J_URI", "bolt://localhost:7687")
+    username: str = _env_field(_getenv, "NEO4J_USERNAME", "neo4j")
+    password: str = _env_field(_getenv, "NEO4J_PASSWORD", "")
+    database: str = _env_field(_getenv, "NEO4J_DATABASE", "neo4j")
+
+    # Driver tuning: concurrent sync workers each hold a connection, and large
+    # reads pull fetch_size records per round-trip (driver default: 1000)
+    pool_size: int = _env_field(_get_env_int, "NEO4J_POOL_SIZE", 200)
+    fetch_size: int = _env_field(_get_env_int, "NEO4J_FETCH_SIZE", 10000)
+    connection_acquisition_timeout: int = _env_field(_get_env_int, "NEO4J_ACQUISITION_TIMEOUT", 60)
 
     def validate(self) -> bool:
         """
         Validate required configuration is present
 
+        The result is memoized per config value; invalid configs raise every time.
+
         Returns:
             bool: True if valid, raises ValueError if invalid
         """
+        return _validated(self)
+
+    def _check(self) -> bool:
+        """Uncached validation body used by validate()"""
         if not self.uri:
             raise ValueError("NEO4J_URI is required")
         if not self.username:
@@ -111,8 +249,8 @@ class Neo4jConfig:
         return True
 
 
-@dataclass
-class SyncConfig:
+@dataclass(slots=True, frozen=True)
+class SyncConfig(_EnvConfig):
     """
     Sync operation configuration
 
@@ -130,12 +268,12 @@ class SyncConfig:
 
     # Date range configuration for transactional data
     # Example: SYNC_TRANSACTIONS_DAYS_BACK, SYNC_EVENTS_DAYS_BACK
-    default_days_back: int = int(os.getenv("SYNC_DEFAULT_DAYS_BACK", "365"))
+    default_days_back: int = _env_field(_get_env_int, "SYNC_DEFAULT_DAYS_BACK", 365)
 
     # Feature flags
-    enable_metrics: bool = os.getenv("SYNC_ENABLE_METRICS", "true").lower() == "true"
-    enable_analytics: bool = os.getenv("SYNC_ENABLE_ANALYTICS", "true").lower() == "true"
-    create_indexes: bool = os.getenv("SYNC_CREATE_INDEXES", "true").lower() == "true"
+    enable_metrics: bool = _env_field(_get_env_bool, "SYNC_ENABLE_METRICS", True)
+    enable_analytics: bool = _env_field(_get_env_bool, "SYNC_ENABLE_ANALYTICS", True)
+    create_indexes: bool = _env_field(_get_env_bool, "SYNC_CREATE_INDEXES", True)
 
     def get_entity_days_back(self, entity_name: str) -> int:
         """
@@ -147,8 +285,7 @@ class SyncConfig:
         Returns:
             int: Days to look back
         """
-        env_var = f"SYNC_{entity_name.upper()}_DAYS_BACK"
-        return int(os.getenv(env_var, str(self.default_days_back)))
+        return _get_env_int(_entity_env_var(entity_name, "DAYS_BACK"), self.default_days_back)
 
     def get_entity_start_date(self, entity_name: str) -> Optional[str]:
         """
@@ -160,5 +297,4 @@ class SyncConfig:
         Returns:
             Optional[str]: Start date in YYYY-MM-DD format, or None
         """
-        env_var = f"SYNC_{entity_name.upper()}_START_DATE"
-        return os.getenv(env_var)
+        return _getenv(_entity_env_var(entity_name, "START_DATE"))
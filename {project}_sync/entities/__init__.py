@@ -17,4 +17,10 @@ Pattern:
 3. MERGE on NODE KEY (typically guid)
 4. Store only primitive values and foreign GUIDs
 5. Return bool indicating success/failure
+
+Imports:
+Submodules are not re-exported here, so importing the package (e.g. from a
+migration or CLI tool) does not load every module. Import what you need
+directly:
+    from {project}_sync.entities.customer import CustomerSync
 """
@@ -0,0 +1,112 @@
+"""
+Shared helpers for entity sync modules
+"""
+
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
+
+
+def extract_nested_guid(data: Dict, nested_field: str) -> Optional[str]:
+    """
+    Extract GUID from a nested API object (e.g., data["customer"]["guid"])
+
+    Args:
+        data: API response dict
+        nested_field: Name of nested field
+
+    Returns:
+        Optional[str]: GUID if the nested object is a mapping with one, None otherwise
+    """
+    nested_obj = data.get(nested_field)
+    if nested_obj is None:
+        return None
+    # EAFP: json.loads payloads are dicts, so the happy path is a plain lookup
+    try:
+        return nested_obj["guid"]
+    except (KeyError, TypeError):
+        return None
+
+
+@lru_cache(maxsize=64)
+def nested_guid_extractor(nested_field: str) -> Callable[[Dict], Optional[str]]:
+    """
+    Get a single-field version of extract_nested_guid for hot loops
+
+    The field name is bound once, so each call is one closure call with no
+    argument passing or attribute lookups. Extractors are cached per field.
+
+    Example:
+        customer_guid = nested_guid_extractor("customer")
+        guids = [customer_guid(item) for item in projects]
+
+    Args:
+        nested_field: Name of nested field
+
+    Returns:
+        Callable taking an API response dict and returning the GUID or None
+    """
+    def extract(data: Dict, _field: str = nested_field) -> Optional[str]:
+        nested_obj = data.get(_field)
+        if nested_obj is None:
+            return None
+        try:
+            return nested_obj["guid"]
+        except (KeyError, TypeError):
+            return None
+
+    return extract
+
+
+def make_row_builder(
+    flat_fields: Sequence[Tuple[str, Union[str, Tuple[str, ...]], Any]],
+    nested_fields: Sequence[Tuple[str, str]] = (),
+    name: str = "build_row"
+) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Generate a straight-line function that flattens one API dict into query params
+
+    The field layout is fixed per entity, so instead of looping over field
+    tables for every row, the layout is compiled once into a single dict
+    literal, e.g.:
+
+        def build_row(row, _get=dict.get, _EMPTY={}):
+            return {'guid': _get(row, 'guid', None), ...,
+                    'businessUnitGuid': _get(_get(row, 'businessUnit') or _EMPTY, 'guid')}
+
+    Example:
+        build = make_row_builder(
+            flat_fields=(("guid", "guid", None), ("name", "name", "")),
+            nested_fields=(("businessUnit", "businessUnitGuid"),),
+        )
+        build({"guid": "c-1", "businessUnit": {"guid": "bu-2"}})
+        # {"guid": "c-1", "name": "", "businessUnitGuid": "bu-2"}
+
+    Args:
+        flat_fields: (property, api field, default) triples. The api field may be
+                     a tuple of fallbacks; the first truthy value wins.
+        nested_fields: (api field, property) pairs for nested objects whose
+                       "guid" is stored as a foreign GUID property
+        name: Function name (shows up in tracebacks as <name>)
+
+    Returns:
+        Callable taking an API response dict and returning a params dict
+    """
+    if not name.isidentifier():
+        raise ValueError(f"Invalid row builder name: {name!r}")
+
+    items = []
+    for prop, source, default in flat_fields:
+        sources = (source,) if isinstance(source, str) else tuple(source)
+        lookups = [f"_get(row, {field!r})" for field in sources[:-1]]
+        lookups.append(f"_get(row, {sources[-1]!r}, {default!r})")
+        items.append(f"{prop!r}: {' or '.join(lookups)}")
+    for field, prop in nested_fields:
+        items.append(f"{prop!r}: _get(_get(row, {field!r}) or _EMPTY, 'guid')")
+
+    src = (
+        f"def {name}(row, _get=dict.get, _EMPTY={{}}):\n"
+        f"    return {{{', '.join(items)}}}\n"
+    )
+    namespace: Dict[str, Any] = {}
+    exec(compile(src, f"<{name}>", "exec"), namespace)
+    return namespace[name]
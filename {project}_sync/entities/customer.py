@@ -5,9 +5,11 @@ Syncs Customer entities from {API_NAME} to Neo4j.
 
 Pattern Implementation:
 - Inherits from Neo4jBase for Neo4j operations
-- sync_customer() method handles single entity sync
+- sync_customers_bulk() writes many customers per UNWIND transaction
+- sync_customers_pages() overlaps page fetching with Neo4j writes
+- sync_customer() method handles single entity sync (wraps the bulk path)
 - MERGE on guid (NODE KEY) to avoid duplicates
-- Stores only primitive values and foreign GUIDs
+- Stores only primitive values and foreign GUIDs (lastModified as native datetime)
 - Returns bool indicating success/failure
 - Nested object extraction follows "{Entity} in {API_NAME} is a nested object" pattern
 
@@ -17,8 +19,9 @@ TODO: Customize for your {API_NAME}:
 3. Validate field names match {API_NAME} API response
 4. Check doc/{api}_doc.json for "$ref" fields to identify nested objects
 """
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, List
 from ..neo4j_base import Neo4jBase
+from ._util import make_row_builder
 
 
 class CustomerSync(Neo4jBase):
@@ -34,6 +37,48 @@ class CustomerSync(Neo4jBase):
     - Metrics: Not applicable for reference data
     """
 
+    BATCH_SIZE = 1000
+
+    # Flat properties: (property, api field, default)
+    # TODO: Add/remove fields based on {API_NAME} schema (keep _BULK_QUERY in sync)
+    _FLAT_FIELDS = (
+        ("guid", "guid", None),
+        ("name", "name", ""),
+        ("number", "number", ""),
+        ("isActive", "isActive", True),
+        ("lastModified", "lastModifiedDateTime", ""),
+    )
+
+    # Nested API objects stored as foreign GUID properties: (field, property)
+    _NESTED_GUID_FIELDS = (
+        ("businessUnit", "businessUnitGuid"),
+        ("accountOwner", "accountOwnerGuid"),
+    )
+
+    # Flattens one API response into _BULK_QUERY row params (generated once)
+    _customer_row = staticmethod(
+        make_row_builder(_FLAT_FIELDS, _NESTED_GUID_FIELDS, name="customer_row")
+    )
+
+    # Row keys, sent as one list per key (see Neo4jBase._columnar_unwind)
+    _ROW_KEYS = tuple(prop for prop, _, _ in _FLAT_FIELDS) + tuple(
+        prop for _, prop in _NESTED_GUID_FIELDS
+    )
+
+    _BULK_QUERY = Neo4jBase._columnar_unwind(_ROW_KEYS) + """
+        MERGE (c:Customer {guid: r.guid})
+        SET
+            c.name = r.name,
+            c.number = r.number,
+            c.isActive = r.isActive,
+            c.businessUnitGuid = r.businessUnitGuid,
+            c.accountOwnerGuid = r.accountOwnerGuid,
+            c.lastModified = CASE
+                WHEN coalesce(r.lastModified, '') = '' THEN null
+                ELSE datetime(r.lastModified)
+            END
+        """
+
     def sync_customer(self, customer_data: Dict[str, Any]) -> bool:
         """Sync a single customer to Neo4j
 
@@ -41,6 +86,8 @@ class CustomerSync(Neo4jBase):
         Only stores customer attributes and foreign GUIDs - does not create
         related entities inline.
 
+        Thin wrapper around sync_customers_bulk() with a one-element list.
+
         Pattern:
         1. MERGE on guid (NODE KEY) - ensures idempotency
         2. SET properties with customer data
@@ -70,37 +117,47 @@ class CustomerSync(Neo4jBase):
             "lastModifiedDateTime": "2025-01-15T10:30:00Z"
         }}
         """
-        query = """
-        MERGE (c:Customer {guid: $guid})
-        SET
-            c.name = $name,
-            c.number = $number,
-            c.isActive = $isActive,
-            c.businessUnitGuid = $businessUnitGuid,
-            c.accountOwnerGuid = $accountOwnerGuid,
-            c.lastModified = $lastModified
-        RETURN c.guid AS guid
+        return self.sync_customers_bulk([customer_data]) == 1
+
+    def sync_customers_bulk(self, customers: List[Dict[str, Any]], batch_size: int = 0) -> int:
+        """Sync many customers to Neo4j with one UNWIND query per batch
+
+        Rows are flattened in Python first, then each batch is written in a
+        single transaction instead of one MERGE round-trip per customer.
+
+        Args:
+            customers: List of customer entities from {API_NAME} API
+            batch_size: Customers per transaction (default: BATCH_SIZE)
+
+        Returns:
+            int: Number of customers sent to Neo4j
         """
+        rows = list(map(self._customer_row, customers))
+        return self._execute_unwind(
+            self._BULK_QUERY, rows, batch_size or self.BATCH_SIZE, columns=self._ROW_KEYS
+        )
+
+    def sync_customers_pages(
+        self,
+        pages: Iterable[List[Dict[str, Any]]],
+        batch_size: int = 0
+    ) -> int:
+        """Sync customers page by page, writing each page while the next is fetched
+
+        Use with a lazy page iterator from the API client so fetching and
+        Neo4j writes overlap instead of running back to back.
 
-        # TODO: Extract nested object GUIDs following this pattern
-        # Check for nested object existence before accessing properties
-        business_unit_guid = None
-        if customer_data.get("businessUnit"):
-            business_unit_guid = customer_data["businessUnit"].get("guid")
-
-        account_owner_guid = None
-        if customer_data.get("accountOwner"):
-            account_owner_guid = customer_data["accountOwner"].get("guid")
-
-        return self._execute_query(query, {
-            "guid": customer_data.get("guid"),
-            "name": customer_data.get("name", ""),
-            "number": customer_data.get("number", ""),
-            "isActive": customer_data.get("isActive", True),
-            "businessUnitGuid": business_unit_guid,
-            "accountOwnerGuid": account_owner_guid,
-            "lastModified": customer_data.get("lastModifiedDateTime", "")
-        })
+        Args:
+            pages: Iterable of customer lists (one per API page)
+            batch_size: Customers per transaction (default: BATCH_SIZE)
+
+        Returns:
+            int: Number of customers sent to Neo4j
+        """
+        rows = (list(map(self._customer_row, page)) for page in pages)
+        return self._execute_unwind_pages(
+            self._BULK_QUERY, rows, batch_size or self.BATCH_SIZE, columns=self._ROW_KEYS
+        )
 
     # TODO: Add more entity sync methods following the same pattern
     # Example:
@@ -5,10 +5,12 @@ Syncs User entities from {API_NAME} to Neo4j.
 
 Pattern Implementation:
 - Inherits from Neo4jBase for Neo4j operations
-- sync_user() method handles single entity sync
+- sync_users_bulk() writes many users per UNWIND transaction
+- sync_users_pages() overlaps page fetching with Neo4j writes
+- sync_user() method handles single entity sync (wraps the bulk path)
 - MERGE on guid (NODE KEY) to avoid duplicates
 - Extracts nested object GUIDs (e.g., user.role.guid)
-- Stores only primitive values and foreign GUIDs
+- Stores only primitive values and foreign GUIDs (lastModified as native datetime)
 - Returns bool indicating success/failure
 
 TODO: Customize for your {API_NAME}:
@@ -18,8 +20,9 @@ TODO: Customize for your {API_NAME}:
 4. Check doc/{api}_doc.json for "$ref" fields to identify nested objects
 5. Handle special cases (e.g., user permissions, roles, team assignments)
 """
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, List
 from ..neo4j_base import Neo4jBase
+from ._util import make_row_builder
 
 
 class UserSync(Neo4jBase):
@@ -36,6 +39,56 @@ class UserSync(Neo4jBase):
     - Metrics: Not applicable
     """
 
+    BATCH_SIZE = 1000
+
+    # Flat properties: (property, api field or fallback fields, default)
+    # TODO: Add/remove fields based on {API_NAME} schema (keep _BULK_QUERY in sync)
+    _FLAT_FIELDS = (
+        ("guid", "guid", None),
+        ("firstName", "firstName", ""),
+        ("lastName", "lastName", ""),
+        ("email", "email", ""),
+        ("isActive", "isActive", True),
+        ("lastModified", ("lastModifiedDateTime", "lastUpdatedDateTime"), ""),
+    )
+
+    # Nested API objects stored as foreign GUID properties: (field, property)
+    _NESTED_GUID_FIELDS = (
+        ("role", "roleGuid"),
+        ("team", "teamGuid"),
+        ("supervisor", "supervisorGuid"),
+        ("department", "departmentGuid"),
+        ("permissionProfile", "permissionProfileGuid"),
+    )
+
+    # Flattens one API response into _BULK_QUERY row params (generated once)
+    _user_row = staticmethod(
+        make_row_builder(_FLAT_FIELDS, _NESTED_GUID_FIELDS, name="user_row")
+    )
+
+    # Row keys, sent as one list per key (see Neo4jBase._columnar_unwind)
+    _ROW_KEYS = tuple(prop for prop, _, _ in _FLAT_FIELDS) + tuple(
+        prop for _, prop in _NESTED_GUID_FIELDS
+    )
+
+    _BULK_QUERY = Neo4jBase._columnar_unwind(_ROW_KEYS) + """
+        MERGE (u:User {guid: r.guid})
+        SET
+            u.firstName = r.firstName,
+            u.lastName = r.lastName,
+            u.email = r.email,
+            u.isActive = r.isActive,
+            u.roleGuid = r.roleGuid,
+            u.teamGuid = r.teamGuid,
+            u.supervisorGuid = r.supervisorGuid,
+            u.departmentGuid = r.departmentGuid,
+            u.permissionProfileGuid = r.permissionProfileGuid,
+            u.lastModified = CASE
+                WHEN coalesce(r.lastModified, '') = '' THEN null
+                ELSE datetime(r.lastModified)
+            END
+        """
+
     def sync_user(self, user_data: Dict[str, Any]) -> bool:
         """Sync a single user to Neo4j
 
@@ -43,6 +96,8 @@ class UserSync(Neo4jBase):
         Extracts nested object GUIDs and stores as properties.
         Does not create related entities inline.
 
+        Thin wrapper around sync_users_bulk() with a one-element list.
+
         Pattern:
         1. MERGE on guid (NODE KEY) - ensures idempotency
         2. Extract nested object GUIDs with existence checks
@@ -76,57 +131,43 @@ class UserSync(Neo4jBase):
             "lastModifiedDateTime": "2025-01-15T10:30:00Z"
         }}
         """
-        query = """
-        MERGE (u:User {guid: $guid})
-        SET
-            u.firstName = $firstName,
-            u.lastName = $lastName,
-            u.email = $email,
-            u.isActive = $isActive,
-            u.roleGuid = $roleGuid,
-            u.teamGuid = $teamGuid,
-            u.supervisorGuid = $supervisorGuid,
-            u.departmentGuid = $departmentGuid,
-            u.permissionProfileGuid = $permissionProfileGuid,
-            u.lastModified = $lastModified
-        RETURN u.guid AS guid
+        return self.sync_users_bulk([user_data]) == 1
+
+    def sync_users_bulk(self, users: List[Dict[str, Any]], batch_size: int = 0) -> int:
+        """Sync many users to Neo4j with one UNWIND query per batch
+
+        Rows are flattened in Python first, then each batch is written in a
+        single transaction instead of one MERGE round-trip per user.
+
+        Args:
+            users: List of user entities from {API_NAME} API
+            batch_size: Users per transaction (default: BATCH_SIZE)
+
+        Returns:
+            int: Number of users sent to Neo4j
         """
+        rows = list(map(self._user_row, users))
+        return self._execute_unwind(
+            self._BULK_QUERY, rows, batch_size or self.BATCH_SIZE, columns=self._ROW_KEYS
+        )
+
+    def sync_users_pages(self, pages: Iterable[List[Dict[str, Any]]], batch_size: int = 0) -> int:
+        """Sync users page by page, writing each page while the next is fetched
+
+        Use with a lazy page iterator from the API client so fetching and
+        Neo4j writes overlap instead of running back to back.
 
-        # TODO: Extract nested object GUIDs following this pattern
-        # Always check existence before accessing nested properties
-        role_guid = None
-        if user_data.get("role"):
-            role_guid = user_data["role"].get("guid")
-
-        team_guid = None
-        if user_data.get("team"):
-            team_guid = user_data["team"].get("guid")
-
-        supervisor_guid = None
-        if user_data.get("supervisor"):
-            supervisor_guid = user_data["supervisor"].get("guid")
-
-        department_guid = None
-        if user_data.get("department"):
-            department_guid = user_data["department"].get("guid")
-
-        permission_profile_guid = None
-        if user_data.get("permissionProfile"):
-            permission_profile_guid = user_data["permissionProfile"].get("guid")
-
-        return self._execute_query(query, {
-            "guid": user_data.get("guid"),
-            "firstName": user_data.get("firstName", ""),
-            "lastName": user_data.get("lastName", ""),
-            "email": user_data.get("email", ""),
-            "isActive": user_data.get("isActive", True),
-            "roleGuid": role_guid,
-            "teamGuid": team_guid,
-            "supervisorGuid": supervisor_guid,
-            "departmentGuid": department_guid,
-            "permissionProfileGuid": permission_profile_guid,
-            "lastModified": user_data.get("lastModifiedDateTime", user_data.get("lastUpdatedDateTime", ""))
-        })
+        Args:
+            pages: Iterable of user lists (one per API page)
+            batch_size: Users per transaction (default: BATCH_SIZE)
+
+        Returns:
+            int: Number of users sent to Neo4j
+        """
+        rows = (list(map(self._user_row, page)) for page in pages)
+        return self._execute_unwind_pages(
+            self._BULK_QUERY, rows, batch_size or self.BATCH_SIZE, columns=self._ROW_KEYS
+        )
 
     # TODO: Add more entity sync methods following the same pattern
     # Example:
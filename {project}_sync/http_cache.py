@@ -0,0 +1,99 @@
+"""
+HTTP Validator Cache
+====================
+SQLite store of response bodies with their ETag / Last-Modified validators,
+for conditional GETs across sync runs.
+
+The client sends If-None-Match / If-Modified-Since from the stored entry; a
+304 reply has no body, so the stored one is decoded instead of downloading
+the page again. Only worth it for endpoints that return identical pages
+run over run (stable page parameters, server support for validators):
+requests opt in per endpoint (see {API}Client._make_request(conditional=True)).
+"""
+
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from typing import Dict, Optional
+from urllib.parse import urlencode
+
+
+@dataclass(slots=True, frozen=True)
+class CachedResponse:
+    """Stored response body, its validators, and the page token parsed from it"""
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body: bytes
+    next_token: Optional[str]
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for this entry"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class EtagCache:
+    """
+    Thread-safe SQLite-backed validator cache
+
+    Example:
+        cache = EtagCache("~/.cache/{project}/http.sqlite")
+        key = EtagCache.key(url, params)
+        cached = cache.get(key)
+        response = session.get(url, params=params, headers=cached.validators() if cached else None)
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: SQLite database file (created if missing)
+        """
+        path = os.path.expanduser(path)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body BLOB, next_token TEXT)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def key(url: str, params: Dict) -> str:
+        """Cache key for a GET: URL plus its query parameters in sorted order"""
+        return f"GET {url}?{urlencode(sorted(params.items()))}"
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Stored response for key, or None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, body, next_token FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        return CachedResponse(*row) if row else None
+
+    def put(
+        self,
+        key: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        body: bytes,
+        next_token: Optional[str]
+    ):
+        """Store (or replace) the response for key"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (key, etag, last_modified, body, next_token)
+            )
+            self._conn.commit()
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
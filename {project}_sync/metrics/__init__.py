@@ -21,4 +21,10 @@ Example Workflow:
 3. Query aggregates hours, revenue, cost from related entities
 4. SET calculated properties on Project node
 5. Return count of updated projects
+
+Imports:
+Submodules are not re-exported here, so importing the package (e.g. from a
+migration or CLI tool) does not load every module. Import what you need
+directly:
+    from {project}_sync.metrics.project_metrics import ProjectMetrics
 """
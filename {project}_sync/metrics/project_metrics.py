@@ -12,11 +12,13 @@ Metrics Pattern:
 - Return count of updated projects for verification
 
 TODO: Customize for your {API_NAME}:
-1. Replace {Entity} with your entity name (e.g., Project, Service, Assignment)
+1. Replace {Entity} with your entity name (e.g., Project, Service, Assignment),
+   or pass entity_label/phase_rel/invoice_rel to ProjectMetrics()
 2. Add/remove metrics based on business requirements
 3. Verify relationship names match your Neo4j schema
 4. Test metric calculations with sample data
-5. Optimize Cypher queries if needed (use indexes for large datasets)
+5. Keep a unique constraint on {Entity}.guid (migration 001) - the filtered
+   query uses it as an index hint
 
 Common Metrics Patterns:
 - Hours aggregation: sum(workhour.quantity) WHERE workhour.isBillable
@@ -27,7 +29,9 @@ Common Metrics Patterns:
 - Billing rate: billableHours / totalHours * 100
 """
 import logging
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from ..config import Neo4jConfig
 from ..neo4j_base import Neo4jBase
 
 logger = logging.getLogger(__name__)
@@ -62,45 +66,31 @@ class ProjectMetrics(Neo4jBase):
     4. Log shows: "✓ Updated 42 project metrics"
     """
 
-    def calculate_project_metrics(self, project_guids: Optional[List[str]] = None) -> int:
-        """Calculate and store metrics as properties on {Entity} nodes
-
-        Aggregates related data (work hours, invoices, etc.) and stores
-        calculated KPIs as properties. Updated inline during sync.
-
-        Args:
-            project_guids: Optional list of specific project GUIDs to update.
-                          If None, updates all projects.
-
-        Returns:
-            int: Number of projects updated
-        """
-        if project_guids is not None and len(project_guids) == 0:
-            return 0  # No projects to update
-
-        where_clause = "WHERE p.guid IN $projectGuids" if project_guids else ""
-        params = {"projectGuids": project_guids} if project_guids else {}
-
-        query = f"""
-        MATCH (p:{{Entity}})
-        {where_clause}
+    # Max GUIDs per filtered metrics transaction
+    GUID_CHUNK_SIZE = 1000
 
+    # Shared aggregation/SET body; {phase_rel}/{invoice_rel} are filled in by
+    # _compile_queries() (pass them to __init__ instead of editing the Cypher)
+    _METRICS_BODY = """
         // TODO: Step 1 - Calculate hours metrics
         // Customize for your entity relationships:
         // - Does your entity have phases/tasks that contain work hours?
         // - Is the relationship HAS_PHASE, CONTAINS_TASK, or something else?
         // - Adjust OPTIONAL MATCH and relationship names accordingly
-        OPTIONAL MATCH (p)-[:HAS_PHASE]->(ph:Phase)<-[:RECORDED_ON]-(wh:WorkHour)
+        // - Costs are aggregated here too (see Step 4) so work hours are
+        //   traversed once instead of twice
+        OPTIONAL MATCH (p)-[:{phase_rel}]->(ph:Phase)<-[:RECORDED_ON]-(wh:WorkHour)
         WITH p,
              sum(wh.quantity) as hoursWorked,
              sum(CASE WHEN wh.isBillable THEN wh.quantity ELSE 0 END) as billableHours,
-             sum(CASE WHEN NOT wh.isBillable THEN wh.quantity ELSE 0 END) as nonBillableHours
+             sum(CASE WHEN NOT wh.isBillable THEN wh.quantity ELSE 0 END) as nonBillableHours,
+             sum(wh.quantity * COALESCE(wh.unitCost, 0)) as totalCost
 
         // TODO: Step 2 - Calculate estimate
         // Customize: OPTIONAL MATCH (p)-[:HAS_PHASE]->(ph2:Phase)
         // Then: sum(ph2.workHoursEstimate) as hourEstimate
-        OPTIONAL MATCH (p)-[:HAS_PHASE]->(ph2:Phase)
-        WITH p, hoursWorked, billableHours, nonBillableHours,
+        OPTIONAL MATCH (p)-[:{phase_rel}]->(ph2:Phase)
+        WITH p, hoursWorked, billableHours, nonBillableHours, totalCost,
              sum(ph2.workHoursEstimate) as hourEstimate
 
         // TODO: Step 3 - Calculate revenue
@@ -108,16 +98,14 @@ class ProjectMetrics(Neo4jBase):
         // - Does your entity have invoices?
         // - Is the relationship FOR_PROJECT, REFERENCES, or something else?
         // - Adjust relationship name and sum field accordingly
-        OPTIONAL MATCH (p)<-[:FOR_PROJECT]-(inv:Invoice)
-        WITH p, hoursWorked, billableHours, nonBillableHours, hourEstimate,
+        OPTIONAL MATCH (p)<-[:{invoice_rel}]-(inv:Invoice)
+        WITH p, hoursWorked, billableHours, nonBillableHours, totalCost, hourEstimate,
              sum(inv.totalAmount) as totalRevenue
 
         // TODO: Step 4 - Calculate costs
         // Customize: aggregate work hour unit costs or resource costs
-        // Current pattern: hours * unitCost from work entries
-        OPTIONAL MATCH (p)-[:HAS_PHASE]->(ph3:Phase)<-[:RECORDED_ON]-(wh2:WorkHour)
-        WITH p, hoursWorked, billableHours, nonBillableHours, hourEstimate, totalRevenue,
-             sum(wh2.quantity * COALESCE(wh2.unitCost, 0)) as totalCost
+        // Current pattern: hours * unitCost from work entries, summed in Step 1.
+        // If costs come from a different path, add a separate OPTIONAL MATCH here.
 
         // TODO: Step 5 - Set calculated properties
         // Add/remove SET properties based on your metrics requirements
@@ -148,17 +136,115 @@ class ProjectMetrics(Neo4jBase):
         RETURN count(p) as projectsUpdated
         """
 
+    # Prefixes for the two variants. The filtered one seeks by guid through the
+    # {label}.guid unique constraint (migration 001) instead of scanning every
+    # node; the planner cannot seek on an "$x IS NULL OR ..." predicate, so
+    # "all" and "filtered" stay separate query strings.
+    _MATCH_ALL = """
+        MATCH (p:{label})
+"""
+    _MATCH_FILTERED = """
+        MATCH (p:{label})
+        USING INDEX p:{label}(guid)
+        WHERE p.guid IN $projectGuids
+"""
+
+    def __init__(
+        self,
+        config: Neo4jConfig,
+        entity_label: str = "{Entity}",
+        phase_rel: str = "HAS_PHASE",
+        invoice_rel: str = "FOR_PROJECT"
+    ):
+        """
+        Initialize and compile the metrics queries for this schema
+
+        Args:
+            config: Neo4j configuration
+            entity_label: Label of the nodes that receive metrics
+            phase_rel: Relationship from entity to Phase nodes
+            invoice_rel: Relationship from Invoice nodes to the entity
+        """
+        super().__init__(config)
+        self._query_all, self._query_filtered = self._compile_queries(
+            entity_label, phase_rel, invoice_rel
+        )
+
+    @classmethod
+    def _compile_queries(
+        cls, entity_label: str, phase_rel: str, invoice_rel: str
+    ) -> Tuple[str, str]:
+        """
+        Substitute schema names into the query templates (once, at construction)
+
+        Labels and relationship types are trusted code-level identifiers,
+        not user input.
+
+        Returns:
+            Tuple of (all-entities query, filtered-by-guid query)
+        """
+        body = cls._METRICS_BODY.format(phase_rel=phase_rel, invoice_rel=invoice_rel)
+        return (
+            cls._MATCH_ALL.format(label=entity_label) + body,
+            cls._MATCH_FILTERED.format(label=entity_label) + body,
+        )
+
+    def calculate_project_metrics(
+        self,
+        project_guids: Optional[List[str]] = None,
+        chunk_size: int = 0,
+        max_workers: int = 1
+    ) -> int:
+        """Calculate and store metrics as properties on {Entity} nodes
+
+        Aggregates related data (work hours, invoices, etc.) and stores
+        calculated KPIs as properties. Updated inline during sync.
+
+        Long guid lists are split into chunks of chunk_size, each written in
+        its own transaction, so a large incremental update never holds every
+        project in one transaction.
+
+        Args:
+            project_guids: Optional list of specific project GUIDs to update.
+                          If None, updates all projects.
+            chunk_size: GUIDs per transaction (default: GUID_CHUNK_SIZE)
+            max_workers: Chunks to run concurrently (1 = sequential)
+
+        Returns:
+            int: Number of projects updated
+        """
+        if project_guids is None:
+            # The all-projects query takes no parameters
+            query = self._query_all
+            param_sets = [None]
+        elif not project_guids:
+            return 0  # No projects to update
+        else:
+            query = self._query_filtered
+            step = chunk_size or self.GUID_CHUNK_SIZE
+            param_sets = [
+                {"projectGuids": project_guids[i:i + step]}
+                for i in range(0, len(project_guids), step)
+            ]
+
+        def run(params: Optional[Dict]) -> int:
+            record = self._session().execute_write(
+                lambda tx: tx.run(query, params).single()
+            )
+            return record["projectsUpdated"] if record else 0
+
         try:
-            with self.driver.session(database=self.config.database) as session:
-                result = session.run(query, params)
-                record = result.single()
-                count = record["projectsUpdated"] if record else 0
-                logger.info(f"  ✓ Updated {count} {{Entity}} metrics")
-                return count
+            if max_workers > 1 and len(param_sets) > 1:
+                with ThreadPoolExecutor(max_workers=min(max_workers, len(param_sets))) as executor:
+                    count = sum(executor.map(run, param_sets))
+            else:
+                count = sum(run(params) for params in param_sets)
+            logger.info(f"  ✓ Updated {count} {{Entity}} metrics")
+            return count
         except Exception as e:
             logger.error(f"Failed to calculate {{Entity}} metrics: {e}")
             logger.debug(f"Query: {query}")
-            logger.debug(f"Params: {params}")
+            logger.debug(f"Chunks: {len(param_sets)}")
             return 0
 
     # TODO: Add more metric calculation methods
@@ -30,12 +30,24 @@ Performance:
 - Monitor: neo4j.metrics db hits/misses
 """
 import logging
-from typing import Dict
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+from neo4j.exceptions import ClientError
 from ..neo4j_base import Neo4jBase
 from ..config import Neo4jConfig
 
 logger = logging.getLogger(__name__)
 
+# Server error codes meaning the index/constraint (or an equivalent one) is already there
+_ALREADY_EXISTS_CODES = frozenset({
+    "Neo.ClientError.Schema.EquivalentSchemaRuleAlreadyExists",
+    "Neo.ClientError.Schema.IndexAlreadyExists",
+    "Neo.ClientError.Schema.IndexWithNameAlreadyExists",
+    "Neo.ClientError.Schema.ConstraintAlreadyExists",
+    "Neo.ClientError.Schema.ConstraintWithNameAlreadyExists",
+})
+
 
 class IndexMigration(Neo4jBase):
     """Create indexes and constraints for performance
@@ -49,14 +61,43 @@ class IndexMigration(Neo4jBase):
     - Report creation results
     """
 
-    def __init__(self, config: Neo4jConfig, dry_run: bool = False):
+    # Nodes sampled per label when measuring property value distributions
+    SELECTIVITY_SAMPLE = 100000
+
+    def __init__(
+        self,
+        config: Neo4jConfig,
+        dry_run: bool = False,
+        max_workers: int = 1,
+        use_stats_planning: bool = False,
+    ):
+        """
+        Args:
+            config: Neo4j configuration
+            dry_run: If True, plan without applying
+            max_workers: Statements submitted concurrently per step (1 = one
+                         transaction per step; >1 overlaps round-trips on
+                         high-latency servers, one statement per transaction)
+            use_stats_planning: If True, skip property indexes whose sampled
+                                values are too uniform for the planner to use,
+                                and order composite columns most-selective-first
+                                (not in dry runs)
+        """
         super().__init__(config)
         self.dry_run = dry_run
+        self.max_workers = max_workers
+        self.use_stats_planning = use_stats_planning
+        self._stats_lock = threading.Lock()
         self.stats = {
             "indexes_created": 0,
             "constraints_created": 0,
+            "indexes_skipped": 0,
             "errors": []
         }
+        # (query, description) pairs queued by _execute_migration, applied by _flush_ddl
+        self._ddl_queue: List[Tuple[str, str]] = []
+        # (label, property) -> (sampled nodes, distinct values, most common value count)
+        self._value_stats_cache: Dict[Tuple[str, str], Tuple[int, int, int]] = {}
 
     def run(self) -> Dict[str, any]:
         """Execute all index/constraint creation
@@ -65,25 +106,31 @@ class IndexMigration(Neo4jBase):
             Dict with stats:
             - indexes_created: count
             - constraints_created: count
+            - indexes_skipped: count (stats planning only)
             - errors: list of error messages
         """
         logger.info("=" * 80)
         logger.info("STARTING INDEX MIGRATION (001_create_indexes)")
-        logger.info(f"Dry run mode: {self.dry_run}")
+        logger.info("Dry run mode: %s", self.dry_run)
         logger.info("=" * 80)
 
         try:
+            # Each step queues its DDL; _flush_ddl applies it in one transaction
             # Step 1: Unique constraints (also creates indexes)
             self._create_unique_constraints()
+            self._flush_ddl()
 
             # Step 2: Property indexes on frequently queried properties
             self._create_property_indexes()
+            self._flush_ddl()
 
             # Step 3: Composite indexes for multi-property filters
             self._create_composite_indexes()
+            self._flush_ddl()
 
             # Step 4: Full-text search indexes (optional)
             self._create_fulltext_indexes()
+            self._flush_ddl()
 
             # Step 5: Verify index creation
             self._verify_indexes()
@@ -92,7 +139,7 @@ class IndexMigration(Neo4jBase):
             return self.stats
 
         except Exception as e:
-            logger.error(f"Migration failed: {e}")
+            logger.error("Migration failed: %s", e)
             self.stats["errors"].append(str(e))
             return self.stats
 
@@ -117,8 +164,15 @@ class IndexMigration(Neo4jBase):
             ("Project", "guid"),
             ("{Entity3}", "guid"),
             ("{Entity4}", "guid"),
+            ("MarketSegment", "guid"),  # Customer IN_SEGMENT pair lookups
             # Optional: business key constraints
             ("Customer", "number"),  # Customer reference number
+            # Time-period nodes (analytics/aggregation_nodes.py MERGE + lookup keys)
+            ("Year", "year"),
+            ("Quarter", "id"),
+            ("Month", "id"),
+            ("Month", "yearMonthInt"),
+            ("Day", "id"),
         ]
 
         for label, property_name in constraints:
@@ -143,41 +197,71 @@ class IndexMigration(Neo4jBase):
         - Status fields: isActive, isClosed, isApproved
         - Dates: createdDate, modifiedDate, eventDate, deadline
         - References: ownerGuid, customerGuid, projectGuid
-        - Search: name, email, description
+        - Search: name, email, description (add a TEXT index for substring search)
+
+        With use_stats_planning, each property is checked against a data sample
+        first (see _should_index), so run after the initial sync.
         """
         logger.info("\n2. Creating property indexes...")
 
         # TODO: Add indexes for your frequently queried properties
+        # (label, property, kind): RANGE serves equality/range/sort/STARTS WITH,
+        # TEXT (trigram) serves CONTAINS/ENDS WITH on string properties
         indexes = [
             # Customer indexes
-            ("Customer", "number"),
-            ("Customer", "name"),
-            ("Customer", "isActive"),
+            ("Customer", "number", "RANGE"),
+            ("Customer", "number", "TEXT"),
+            ("Customer", "name", "RANGE"),
+            ("Customer", "name", "TEXT"),
+            ("Customer", "isActive", "RANGE"),
+            ("Customer", "lastModified", "RANGE"),  # datetime - range filters for incremental work
 
             # User indexes
-            ("User", "email"),
-            ("User", "isActive"),
-            ("User", "firstName"),
-            ("User", "lastName"),
+            ("User", "email", "RANGE"),
+            ("User", "email", "TEXT"),
+            ("User", "isActive", "RANGE"),
+            ("User", "firstName", "RANGE"),
+            ("User", "firstName", "TEXT"),
+            ("User", "lastName", "RANGE"),
+            ("User", "lastName", "TEXT"),
+            ("User", "lastModified", "RANGE"),  # datetime - range filters for incremental work
 
             # Project indexes
-            ("Project", "isActive"),
-            ("Project", "isClosed"),
-            ("Project", "deadline"),
-            ("Project", "customerGuid"),
+            ("Project", "isActive", "RANGE"),
+            ("Project", "isClosed", "RANGE"),
+            ("Project", "deadline", "RANGE"),
+            ("Project", "customerGuid", "RANGE"),
+
+            # WorkHour indexes (metrics billable/non-billable split)
+            ("WorkHour", "isBillable", "RANGE"),
+
+            # Foreign GUIDs filtered by relationship MERGEs
+            # (see FK_INDEX_SPECS in relationships/customer_relationships.py)
+            ("ContactPerson", "customerGuid", "RANGE"),
+            ("Address", "customerGuid", "RANGE"),
+            ("Invoice", "customerGuid", "RANGE"),
 
             # TODO: Add more indexes for your entities
-            # ("{Entity}", "{property}"),
+            # ("{Entity}", "{property}", "RANGE"),
         ]
 
-        for label, property_name in indexes:
-            index_name = f"{label}_{property_name}_idx"
+        for label, property_name, kind in indexes:
+            if self.use_stats_planning and not self._should_index(label, property_name):
+                logger.info(
+                    "  ⊙ Skipped low-selectivity index: %s %s.%s", kind, label, property_name
+                )
+                self.stats["indexes_skipped"] += 1
+                continue
+
+            # RANGE keeps the original *_idx names so existing databases match
+            suffix = "idx" if kind == "RANGE" else kind.lower()
+            index_name = f"{label}_{property_name}_{suffix}"
             query = f"""
-            CREATE INDEX {index_name} IF NOT EXISTS
+            CREATE {kind} INDEX {index_name} IF NOT EXISTS
             FOR (n:{label})
             ON (n.{property_name})
             """
-            self._execute_migration(query, f"INDEX {label}.{property_name}")
+            self._execute_migration(query, f"{kind} INDEX {label}.{property_name}")
 
     def _create_composite_indexes(self):
         """Create composite indexes for multi-property queries
@@ -192,6 +276,10 @@ class IndexMigration(Neo4jBase):
         - Speed up queries with multiple filters
         - Reduce work: one index covers two properties
         - Order matters: (isActive, deadline) ≠ (deadline, isActive)
+        - With use_stats_planning (and not dry_run), columns are reordered
+          most-selective-first from a data sample, so run after the initial
+          sync for a meaningful order. IF NOT EXISTS keeps an existing index
+          under the same name as it is, whatever the new order.
         """
         logger.info("\n3. Creating composite indexes...")
 
@@ -199,13 +287,24 @@ class IndexMigration(Neo4jBase):
         composite_indexes = [
             # ({Entity}, [properties], "index_name") tuples
             ("Project", ["isActive", "isClosed"], "project_status_idx"),
-            ("User", ["firstName", "lastName"], "user_name_idx"),
+            ("User", ["lastName", "firstName"], "user_name_idx"),
 
             # TODO: Add more composite indexes for your queries
             # ("{Entity}", ["{property1}", "{property2}"], "{entity}_multi_idx"),
         ]
 
+        reorder = self.use_stats_planning and not self.dry_run
         for label, properties, index_name in composite_indexes:
+            if reorder:
+                # Most selective column first; ties (e.g. empty database) keep declared order
+                ordered = sorted(properties, key=lambda p: -self._selectivity(label, p))
+                if ordered != properties:
+                    logger.info(
+                        "  composite order chosen by selectivity: %s(%s)",
+                        label, ", ".join(ordered)
+                    )
+                properties = ordered
+
             props_str = ", ".join([f"n.{p}" for p in properties])
             query = f"""
             CREATE INDEX {index_name} IF NOT EXISTS
@@ -214,6 +313,81 @@ class IndexMigration(Neo4jBase):
             """
             self._execute_migration(query, f"COMPOSITE {label}.{'+'.join(properties)}")
 
+    def _value_stats(self, label: str, property_name: str) -> Tuple[int, int, int]:
+        """Sample a property's value distribution, cached per run
+
+        One query serves both composite column ordering and stats planning.
+
+        Args:
+            label: Node label
+            property_name: Property to measure
+
+        Returns:
+            Tuple of (sampled nodes, distinct non-null values, most common value count);
+            all zero if there is no data or the query fails
+        """
+        key = (label, property_name)
+        if key not in self._value_stats_cache:
+            query = f"""
+            MATCH (n:{label})
+            WITH n LIMIT $sample
+            WITH n.{property_name} AS value, count(*) AS freq
+            RETURN sum(freq) AS total, count(value) AS distinctValues, max(freq) AS topFreq
+            """
+            try:
+                record = self._session().run(query, {"sample": self.SELECTIVITY_SAMPLE}).single()
+                total = (record["total"] or 0) if record else 0
+                self._value_stats_cache[key] = (
+                    (total, record["distinctValues"], record["topFreq"]) if total else (0, 0, 0)
+                )
+            except Exception as e:
+                logger.debug("Value sampling failed for %s.%s: %s", label, property_name, e)
+                self._value_stats_cache[key] = (0, 0, 0)
+        return self._value_stats_cache[key]
+
+    def _selectivity(self, label: str, property_name: str) -> float:
+        """Distinct values / nodes for a property
+
+        Args:
+            label: Node label
+            property_name: Property to measure
+
+        Returns:
+            float: Selectivity in [0, 1] (0 if there is no data or the query fails)
+        """
+        total, distinct, _ = self._value_stats(label, property_name)
+        return distinct / total if total else 0.0
+
+    def _should_index(
+        self,
+        label: str,
+        property_name: str,
+        min_selectivity: float = 0.01,
+        max_mcv_frac: float = 0.9,
+    ) -> bool:
+        """Whether an index on the property is likely to be used
+
+        An index on a near-constant property (e.g. isActive on a 99% active
+        label) is skipped by the planner but still costs every MERGE/SET.
+
+        Args:
+            label: Node label
+            property_name: Property to check
+            min_selectivity: Minimum distinct values / nodes
+            max_mcv_frac: Maximum share of nodes holding the most common value
+
+        Returns:
+            bool: False for low-selectivity properties; True otherwise,
+                  including when there is no data to judge from
+        """
+        total, _, top_freq = self._value_stats(label, property_name)
+        if not total:
+            return True
+        return (
+            self._selectivity(label, property_name) >= min_selectivity
+            and top_freq / total <= max_mcv_frac
+        )
+
     def _create_fulltext_indexes(self):
         """Create full-text search indexes
 
@@ -241,12 +415,13 @@ class IndexMigration(Neo4jBase):
         ]
 
         for index_name, labels, properties in fulltext_indexes:
-            labels_str = "`, `".join(labels)
-            props_str = "`, `".join(properties)
+            # Multi-label fulltext indexes use the (n:A|B) label union
+            labels_str = "|".join(f"`{label}`" for label in labels)
+            props_str = ", ".join(f"n.`{p}`" for p in properties)
             query = f"""
             CREATE FULLTEXT INDEX {index_name} IF NOT EXISTS
-            FOR (n:`{labels_str}`)
-            ON EACH [n.`{props_str.replace('`, `', '`, n.`')}`]
+            FOR (n:{labels_str})
+            ON EACH [{props_str}]
             """
             self._execute_migration(query, f"FULLTEXT {index_name}")
 
@@ -260,78 +435,153 @@ class IndexMigration(Neo4jBase):
         """
         logger.info("\n5. Verifying indexes...")
 
-        query = "SHOW INDEXES"
+        # One round-trip: total count plus the non-ONLINE indexes
+        query = """
+        SHOW INDEXES YIELD name, state
+        WITH collect([name, state]) AS indexes
+        RETURN size(indexes) AS total,
+               [i IN indexes WHERE i[1] <> 'ONLINE'] AS pending
+        """
         try:
-            with self.driver.session(database=self.config.database) as session:
-                result = session.run(query)
-                indexes = [record["name"] for record in result]
-                logger.info(f"  ✓ Total indexes: {len(indexes)}")
-
-                # Check for non-ONLINE indexes
-                result = session.run("SHOW INDEXES YIELD name, state WHERE state <> 'ONLINE'")
-                pending = list(result)
-                if pending:
-                    logger.warning(f"  ⚠ Indexes not yet ONLINE: {len(pending)}")
-                    for record in pending:
-                        logger.warning(f"    - {record['name']}: {record['state']}")
+            # Aggregation always yields exactly one row; unpack it positionally
+            total, pending = self._execute_eager(query, {}).records[0]
+            logger.info("  ✓ Total indexes: %s", total)
+
+            # Check for non-ONLINE indexes
+            if pending:
+                logger.warning("  ⚠ Indexes not yet ONLINE: %s", len(pending))
+                for name, state in pending:
+                    logger.warning("    - %s: %s", name, state)
 
         except Exception as e:
-            logger.error(f"Failed to verify indexes: {e}")
+            logger.error("Failed to verify indexes: %s", e)
             self.stats["errors"].append(f"Verification failed: {e}")
 
     def _execute_migration(self, query: str, description: str):
-        """Execute a single migration statement
+        """Queue a single migration statement (applied by _flush_ddl)
 
         Args:
             query: Cypher query to execute
             description: Human-readable description for logging
         """
         if self.dry_run:
-            logger.info(f"  [DRY RUN] Would create: {description}")
+            logger.info("  [DRY RUN] Would create: %s", description)
             return
 
-        try:
-            with self.driver.session(database=self.config.database) as session:
-                session.run(query)
-                logger.info(f"  ✓ Created: {description}")
+        self._ddl_queue.append((query, description))
 
-                if "CONSTRAINT" in query:
-                    self.stats["constraints_created"] += 1
-                else:
-                    self.stats["indexes_created"] += 1
+    def _flush_ddl(self):
+        """Apply queued statements in one write transaction on the pooled session
 
+        One round-trip per step instead of one session per statement. If the
+        transaction fails, the statements are re-applied one by one so the
+        failing statement is identified and the rest still get created.
+        With max_workers > 1 the statements are submitted concurrently instead.
+        """
+        queue, self._ddl_queue = self._ddl_queue, []
+        if not queue:
+            return
+
+        if self.max_workers > 1 and len(queue) > 1:
+            # Index population is already asynchronous on the server; this only
+            # overlaps the submit/acknowledge round-trips (one session per worker)
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(queue))) as executor:
+                list(executor.map(lambda item: self._apply_ddl(*item), queue))
+            return
+
+        try:
+            summaries = self._session().execute_write(
+                lambda tx: [tx.run(query).consume() for query, _ in queue]
+            )
         except Exception as e:
-            # Check if index/constraint already exists (idempotent)
-            if "already exists" in str(e).lower() or "equivalent" in str(e).lower():
-                logger.info(f"  ⊙ Already exists: {description}")
+            logger.warning("  ⚠ Batched DDL failed (%s), applying statements individually", e)
+            for query, description in queue:
+                self._apply_ddl(query, description)
+            return
+
+        for (query, description), summary in zip(queue, summaries):
+            self._record_result(query, description, summary)
+
+    def _apply_ddl(self, query: str, description: str):
+        """Apply one statement in its own transaction, classifying failures"""
+        try:
+            summary = self._session().run(query).consume()
+            self._record_result(query, description, summary)
+
+        except ClientError as e:
+            # Index/constraint already exists (idempotent)
+            if e.code in _ALREADY_EXISTS_CODES:
+                logger.info("  ⊙ Already exists: %s", description)
             else:
-                logger.error(f"  ✗ Failed to create {description}: {e}")
-                self.stats["errors"].append(f"{description}: {e}")
+                self._record_error(description, e)
+
+        except Exception as e:
+            self._record_error(description, e)
+
+    def _record_error(self, description: str, error: Exception):
+        """Log and collect a failed statement (thread-safe)"""
+        logger.error("  ✗ Failed to create %s: %s", description, error)
+        with self._stats_lock:
+            self.stats["errors"].append(f"{description}: {error}")
+
+    def _record_result(self, query: str, description: str, summary):
+        """Log and count an applied statement
+
+        IF NOT EXISTS statements succeed without doing anything when the
+        schema rule is already present; the summary counters tell the two apart.
+        """
+        counters = summary.counters
+        if not (counters.indexes_added or counters.constraints_added):
+            logger.info("  ⊙ Already exists: %s", description)
+            return
+
+        logger.info("  ✓ Created: %s", description)
+
+        stat = "constraints_created" if "CONSTRAINT" in query else "indexes_created"
+        with self._stats_lock:
+            self.stats[stat] += 1
 
     def _print_summary(self):
         """Print migration summary"""
         logger.info("\n" + "=" * 80)
         logger.info("MIGRATION SUMMARY")
         logger.info("=" * 80)
-        logger.info(f"Constraints created: {self.stats['constraints_created']}")
-        logger.info(f"Indexes created:     {self.stats['indexes_created']}")
-        logger.info(f"Errors:              {len(self.stats['errors'])}")
+        logger.info("Constraints created: %s", self.stats['constraints_created'])
+        logger.info("Indexes created:     %s", self.stats['indexes_created'])
+        if self.stats["indexes_skipped"]:
+            logger.info("Indexes skipped:     %s", self.stats['indexes_skipped'])
+        logger.info("Errors:              %s", len(self.stats['errors']))
         if self.stats["errors"]:
             logger.error("Errors encountered:")
             for error in self.stats["errors"]:
-                logger.error(f"  - {error}")
+                logger.error("  - %s", error)
         logger.info("=" * 80 + "\n")
 
 
-def run_migration(neo4j_config: Neo4jConfig, dry_run: bool = False):
+def run_migration(
+    neo4j_config: Neo4jConfig,
+    dry_run: bool = False,
+    max_workers: int = 1,
+    use_stats_planning: bool = False,
+):
     """Convenience function to run migration
 
     Args:
         neo4j_config: Neo4jConfig instance
         dry_run: If True, plan without applying
+        max_workers: Concurrent DDL submissions per step (see IndexMigration)
+        use_stats_planning: Skip low-selectivity property indexes (see IndexMigration)
 
     Returns:
         Dict with migration stats
     """
-    migration = IndexMigration(neo4j_config, dry_run=dry_run)
-    return migration.run()
+    migration = IndexMigration(
+        neo4j_config,
+        dry_run=dry_run,
+        max_workers=max_workers,
+        use_stats_planning=use_stats_planning,
+    )
+    try:
+        return migration.run()
+    finally:
+        migration.close()
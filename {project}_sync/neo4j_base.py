@@ -7,13 +7,43 @@ All entity sync, relationship, and metrics modules should inherit from this clas
 """
 
 import logging
-from typing import Dict, List, Any
-from neo4j import GraphDatabase, Driver
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import groupby, islice
+from typing import Callable, Dict, Iterable, Iterator, List, Any, Optional, Sequence, Tuple
+from neo4j import GraphDatabase, Driver, EagerResult, Record, Result, RoutingControl, Session
+from neo4j.exceptions import ServiceUnavailable, SessionExpired, TransientError
 
 from .config import Neo4jConfig
+from .entities._util import extract_nested_guid, nested_guid_extractor
 
 logger = logging.getLogger(__name__)
 
+_PARAM_RE = re.compile(r"\$(\w+)")
+
+# Errors the driver's managed transactions retry (deadlocks are TransientError)
+_RETRYABLE_ERRORS = (TransientError, ServiceUnavailable, SessionExpired)
+
+
+def _discard_result(result: Result) -> None:
+    """execute_query transformer for callers that need neither records nor counters"""
+    return None
+
+
+def _relationships_created(result: Result) -> int:
+    """Result transformer for write queries without RETURN: new relationships from the summary"""
+    return result.consume().counters.relationships_created
+
+
+@lru_cache(maxsize=128)
+def _unwind_template(query: str) -> str:
+    """Rewrite a $param query to run once per row of UNWIND $rows AS row"""
+    return "UNWIND $rows AS row " + _PARAM_RE.sub(r"row.\1", query)
+
 
 class Neo4jBase:
     """
@@ -21,6 +51,7 @@ class Neo4jBase:
 
     Provides:
     - Connection management with connection pooling
+    - One reusable session per thread for all query helpers
     - Common query execution methods
     - Batch operation utilities
     - Error handling patterns
@@ -43,31 +74,104 @@ class Neo4jBase:
         """
         self.config = config
         self.driver: Driver = None
+        self._local = threading.local()
+        self._sessions: List[Session] = []
+        self._sessions_lock = threading.Lock()
+        self._apoc_available: Optional[bool] = None  # see _has_apoc()
+        self._merge_query_cache: Dict[Tuple[str, str, str], str] = {}  # see _merge_query()
+        self._connectivity_verified = False  # see _verify_connectivity()
         self.connect()
 
     def connect(self):
         """
-        Establish connection to Neo4j database
+        Create the Neo4j driver
 
         Creates driver with connection pooling.
         Connection is reused across all queries.
+
+        No network I/O happens here: the driver opens connections on demand and
+        connectivity is verified before the first pooled session is handed out,
+        so short-lived instances (dry runs, tests) never touch the server.
         """
-        logger.info(f"Connecting to Neo4j at {self.config.uri}...")
+        logger.info("Configuring Neo4j driver for %s...", self.config.uri)
 
         self.driver = GraphDatabase.driver(
             self.config.uri,
-            auth=(self.config.username, self.config.password)
+            auth=(self.config.username, self.config.password),
+            max_connection_pool_size=self.config.pool_size,
+            connection_acquisition_timeout=self.config.connection_acquisition_timeout,
+            keep_alive=True
         )
+        self._connectivity_verified = False
+        logger.info(
+            "Neo4j pool: %d connections, %ss acquisition timeout",
+            self.config.pool_size, self.config.connection_acquisition_timeout
+        )
+
+    def _verify_connectivity(self):
+        """
+        Check the server is reachable, once per driver
 
-        # Test connection
-        with self.driver.session(database=self.config.database) as session:
-            result = session.run("RETURN 1 as test")
-            result.single()
+        Raises:
+            neo4j.exceptions.ServiceUnavailable / AuthError on failure
+        """
+        with self._sessions_lock:
+            if self._connectivity_verified:
+                return
+            self.driver.verify_connectivity()
+            self._connectivity_verified = True
+
+        logger.info("✓ Connected to Neo4j at %s", self.config.uri)
+
+    def _session(self) -> Session:
+        """
+        Get the long-lived session for the calling thread
+
+        Sessions are not thread-safe, so each thread gets its own session,
+        created on first use and reused for every later call. The transaction
+        and batch helpers in this class run on it, so a helper called from a
+        worker thread uses that thread's session; never pass a session between
+        threads. (Single-statement helpers go through _execute_eager instead.)
+
+        Returns:
+            Session bound to the configured database
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            if not self._connectivity_verified:
+                self._verify_connectivity()
+            session = self.driver.session(
+                database=self.config.database, fetch_size=self.config.fetch_size
+            )
+            self._local.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+
+    def _release_session(self):
+        """
+        Close the calling thread's pooled session, if it has one
 
-        logger.info("✓ Connected to Neo4j")
+        Call from the end of a short-lived worker thread: its session would
+        otherwise stay open in self._sessions until close().
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            return
+        self._local.session = None
+        with self._sessions_lock:
+            if session in self._sessions:
+                self._sessions.remove(session)
+        session.close()
 
     def close(self):
-        """Close Neo4j driver connection"""
+        """Close pooled sessions and the Neo4j driver connection"""
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+            self._local = threading.local()
+        for session in sessions:
+            session.close()
+
         if self.driver:
             self.driver.close()
             logger.info("Neo4j connection closed")
@@ -76,6 +180,86 @@ class Neo4jBase:
     # Query Execution
     # =========================================================================
 
+    def _execute_eager(
+        self,
+        query: str,
+        parameters: Dict[str, Any],
+        result_transformer: Optional[Callable[[Result], Any]] = None
+    ) -> EagerResult:
+        """
+        Run one statement through driver.execute_query
+
+        The driver acquires a connection, runs the statement in a managed write
+        transaction (retried on transient errors) and returns the fully fetched
+        records, keys and summary, without any session bookkeeping here.
+        Thread-safe: the driver is shared, sessions are not.
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            result_transformer: Replaces the default EagerResult conversion;
+                                its return value is returned instead
+
+        Returns:
+            EagerResult: (records, summary, keys), or the transformer's result
+        """
+        if not self._connectivity_verified:
+            self._verify_connectivity()
+        return self.driver.execute_query(
+            query,
+            parameters,
+            database_=self.config.database,
+            routing_=RoutingControl.WRITE,
+            result_transformer_=result_transformer or Result.to_eager_result,
+        )
+
+    def _run_autocommit(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        max_attempts: int = 1,
+        result_transformer: Callable[[Result], Any] = Result.single
+    ) -> Any:
+        """
+        Execute an auto-commit query and return its single result record
+
+        Required for CALL { ... } IN TRANSACTIONS, which commits its own inner
+        transactions and cannot run inside execute_write / execute_query, so
+        it gets none of the driver's managed retries. Pass max_attempts > 1 to
+        rerun on transient errors (deadlock, leader switch, dropped connection)
+        with exponential backoff; only do so for idempotent (MERGE) queries,
+        since batches committed before the failure run again.
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            max_attempts: Attempts before a transient error is re-raised
+            result_transformer: Applied to the Result instead of .single()
+                                (e.g. _relationships_created for queries without RETURN)
+
+        Returns:
+            Record or None (the single result row), or the transformer's value
+        """
+        for attempt in range(max_attempts):
+            try:
+                return result_transformer(self._session().run(query, parameters or {}))
+
+            except _RETRYABLE_ERRORS as e:
+                if attempt < max_attempts - 1:
+                    wait_time = 2 ** attempt
+                    logger.warning("Transient error (%s), retrying in %ss...", e, wait_time)
+                    time.sleep(wait_time)
+                    continue
+                logger.error("Auto-commit query failed after %d attempts: %s", max_attempts, e)
+                logger.debug("Query: %s", query)
+                raise
+
+            except Exception as e:
+                logger.error("Auto-commit query failed: %s", e)
+                logger.debug("Query: %s", query)
+                logger.debug("Parameters: %s", parameters)
+                raise
+
     def _execute_query(self, query: str, parameters: Dict[str, Any]) -> bool:
         """
         Execute single Cypher query
@@ -88,15 +272,15 @@ class Neo4jBase:
             bool: True if successful
         """
         try:
-            with self.driver.session(database=self.config.database) as session:
-                result = session.run(query, parameters)
-                result.consume()  # Consume result to complete query
+            # Nothing is returned to the caller, so skip building records and the
+            # ResultSummary; the commit discards whatever the server still streams
+            self._execute_eager(query, parameters, result_transformer=_discard_result)
             return True
 
         except Exception as e:
-            logger.error(f"Query execution failed: {e}")
-            logger.debug(f"Query: {query}")
-            logger.debug(f"Parameters: {parameters}")
+            logger.error("Query execution failed: %s", e)
+            logger.debug("Query: %s", query)
+            logger.debug("Parameters: %s", parameters)
             raise
 
     def _execute_query_with_result(self, query: str, parameters: Dict[str, Any]) -> List[Dict]:
@@ -111,21 +295,61 @@ class Neo4jBase:
             List of result records as dictionaries
         """
         try:
-            with self.driver.session(database=self.config.database) as session:
-                result = session.run(query, parameters)
-                return [record.data() for record in result]
+            records, _, keys = self._execute_eager(query, parameters)
+            # Records are tuples; zip against the shared keys instead of record.data()
+            return [dict(zip(keys, record)) for record in records]
+
+        except Exception as e:
+            logger.error("Query execution failed: %s", e)
+            logger.debug("Query: %s", query)
+            logger.debug("Parameters: %s", parameters)
+            raise
+
+    def _iter_query(self, query: str, parameters: Dict[str, Any]) -> Iterator[Record]:
+        """
+        Stream query results one record at a time
+
+        Records are yielded as they arrive instead of being buffered into
+        dicts, so callers can process large results in constant memory and
+        stop early. Uses its own session (not the pooled one) because the
+        result stays open while the caller iterates; the session closes when
+        the generator is exhausted or closed.
+
+        Example:
+            for guid, name in self._iter_query("MATCH (c:Customer) RETURN c.guid, c.name", {}):
+                ...
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+
+        Yields:
+            Record: Tuple-like record (index or key access)
+        """
+        try:
+            with self.driver.session(
+                database=self.config.database, fetch_size=self.config.fetch_size
+            ) as session:
+                yield from session.run(query, parameters)
 
         except Exception as e:
-            logger.error(f"Query execution failed: {e}")
-            logger.debug(f"Query: {query}")
-            logger.debug(f"Parameters: {parameters}")
+            logger.error("Query execution failed: %s", e)
+            logger.debug("Query: %s", query)
+            logger.debug("Parameters: %s", parameters)
             raise
 
-    def _execute_batch(self, queries: List[Dict[str, Any]]) -> int:
+    def _execute_batch(self, queries: List[Dict[str, Any]], coalesce: bool = False) -> int:
         """
         Execute multiple queries in a single transaction
 
-        Useful for bulk operations. All queries succeed or all fail (ACID).
+        Useful for bulk operations. All queries succeed or all fail (ACID);
+        the whole batch is retried on transient errors.
+
+        With coalesce=True, consecutive queries sharing the same template string
+        run as one UNWIND $rows AS row statement (see _execute_many), so the
+        server parses and plans the template once instead of once per query.
+        Order is preserved: only adjacent queries are merged, so pass identical
+        templates next to each other to benefit.
 
         Args:
             queries: List of dicts with "query" and "parameters" keys
@@ -133,38 +357,258 @@ class Neo4jBase:
                     {"query": "CREATE (n:Node {id: $id})", "parameters": {"id": 1}},
                     {"query": "CREATE (n:Node {id: $id})", "parameters": {"id": 2}}
                 ]
+            coalesce: Merge adjacent same-template queries into one UNWIND
 
         Returns:
             int: Number of queries executed
         """
-        try:
-            with self.driver.session(database=self.config.database) as session:
-                with session.begin_transaction() as tx:
-                    for query_obj in queries:
-                        query = query_obj["query"]
-                        parameters = query_obj.get("parameters", {})
-                        tx.run(query, parameters)
-                    tx.commit()
+        def work(tx):
+            if not coalesce:
+                for query_obj in queries:
+                    tx.run(query_obj["query"], query_obj.get("parameters", {})).consume()
+                return
+
+            for query, group in groupby(queries, key=lambda q: q["query"]):
+                rows = [query_obj.get("parameters", {}) for query_obj in group]
+                if len(rows) == 1:
+                    tx.run(query, rows[0]).consume()
+                else:
+                    tx.run(_unwind_template(query), {"rows": rows}).consume()
 
+        try:
+            # Managed transaction: retried as a whole on transient errors
+            self._session().execute_write(work)
             return len(queries)
 
         except Exception as e:
-            logger.error(f"Batch execution failed: {e}")
+            logger.error("Batch execution failed: %s", e)
+            raise
+
+    def _execute_many(
+        self,
+        query: str,
+        parameter_list: List[Dict[str, Any]],
+        batch_size: int = 0
+    ) -> int:
+        """
+        Execute one $param query template for many parameter dicts
+
+        The template is rewritten to UNWIND $rows AS row with each $name
+        replaced by row.name, then sent through _execute_unwind. Only use it
+        for per-row write templates: aggregations (count, collect, ...) would
+        aggregate across all rows, "$" inside string literals is rewritten too,
+        and the template must not use its own variable named row.
+
+        Example:
+            self._execute_many(
+                "MERGE (n:Node {id: $id}) SET n.name = $name",
+                [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}],
+            )
+
+        Args:
+            query: Cypher query using top-level $parameters
+            parameter_list: One parameter dict per execution
+            batch_size: Rows per transaction (0 = all rows in one transaction)
+
+        Returns:
+            int: Number of parameter dicts executed
+        """
+        return self._execute_unwind(_unwind_template(query), parameter_list, batch_size)
+
+    @staticmethod
+    def _columnar_unwind(keys: Sequence[str], alias: str = "r") -> str:
+        """
+        Cypher prefix that rebuilds row maps from one list parameter per key
+
+        Use with _execute_unwind(..., columns=keys). Each key name is sent once
+        per batch instead of once per row, which shrinks the request for wide
+        rows; the rest of the query reads <alias>.<key> as usual.
+
+        Example:
+            _columnar_unwind(("guid", "name"))
+            # UNWIND range(0, size($guid) - 1) AS i
+            # WITH {guid: $guid[i], name: $name[i]} AS r
+
+        Args:
+            keys: Row keys (valid Cypher parameter names)
+            alias: Row variable name used by the rest of the query
+
+        Returns:
+            str: Query prefix ending in "AS <alias>"
+        """
+        fields = ", ".join(f"{key}: ${key}[i]" for key in keys)
+        return (
+            f"\n        UNWIND range(0, size(${keys[0]}) - 1) AS i"
+            f"\n        WITH {{{fields}}} AS {alias}"
+        )
+
+    def _execute_unwind(
+        self,
+        query: str,
+        rows: List[Dict[str, Any]],
+        batch_size: int = 0,
+        columns: Optional[Sequence[str]] = None
+    ) -> int:
+        """
+        Execute one UNWIND $rows query for a list of parameter rows
+
+        The query text is sent once per batch instead of once per row, so Neo4j
+        plans it once and each batch is a single managed write transaction.
+
+        Example:
+            query = "UNWIND $rows AS r MERGE (y:Year {year: r.year})"
+            self._execute_unwind(query, [{"year": 2024}, {"year": 2025}])
+
+        Args:
+            query: Cypher query starting with UNWIND $rows AS <alias>, or with
+                   _columnar_unwind(columns) when columns is given
+            rows: List of parameter dicts (one per row)
+            batch_size: Rows per transaction (0 = all rows in one transaction)
+            columns: Send each batch as one list per key instead of a list of maps
+
+        Returns:
+            int: Number of rows sent
+        """
+        if not rows:
+            return 0
+
+        step = batch_size or len(rows)
+        try:
+            session = self._session()
+            for i in range(0, len(rows), step):
+                batch = rows[i:i + step]
+                if columns:
+                    params = {key: [row[key] for row in batch] for key in columns}
+                else:
+                    params = {"rows": batch}
+                session.execute_write(lambda tx, params=params: tx.run(query, params).consume())
+            return len(rows)
+
+        except Exception as e:
+            logger.error("UNWIND execution failed: %s", e)
+            logger.debug("Query: %s", query)
             raise
 
+    def _execute_unwind_pages(
+        self,
+        query: str,
+        pages: Iterable[List[Dict[str, Any]]],
+        batch_size: int = 0,
+        max_pending: int = 2,
+        columns: Optional[Sequence[str]] = None
+    ) -> int:
+        """
+        Execute an UNWIND $rows query per page, overlapping writes with the producer
+
+        Each page is handed to a single background writer thread, so the caller's
+        iterator (typically an API page fetch) runs while the previous page is
+        written. At most max_pending pages are queued, which bounds memory.
+
+        Args:
+            query: Cypher query starting with UNWIND $rows AS <alias>
+            pages: Iterable of row lists (e.g. one list per API page)
+            batch_size: Rows per transaction within a page (0 = whole page)
+            max_pending: Pages written or queued before the producer waits
+            columns: Columnar parameter layout (see _execute_unwind)
+
+        Returns:
+            int: Number of rows sent
+        """
+        total = 0
+        pending = deque()
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="neo4j-writer") as writer:
+            try:
+                for rows in pages:
+                    if len(pending) >= max_pending:
+                        total += pending.popleft().result()
+                    pending.append(
+                        writer.submit(self._execute_unwind, query, rows, batch_size, columns)
+                    )
+
+                while pending:
+                    total += pending.popleft().result()
+            finally:
+                # Runs after the queued pages on the same thread, which exits with the executor
+                writer.submit(self._release_session).result()
+
+        return total
+
     # =========================================================================
     # Batch Utilities
     # =========================================================================
 
+    def _run_relationship_batch(
+        self,
+        query: str,
+        rows: Iterable[Dict[str, Any]],
+        batch_size: int = 1000
+    ) -> int:
+        """
+        MERGE relationships for a list of GUID pairs, one transaction per batch
+
+        Each row is resolved through the guid indexes instead of scanning the
+        whole child label, so only the pairs actually touched by a sync are sent.
+
+        Example:
+            query = (
+                "UNWIND $rows AS row "
+                "MATCH (c:Customer {guid: row.customerGuid}) "
+                "MATCH (p:Project {guid: row.childGuid}) "
+                "MERGE (c)-[:HAS_PROJECT]->(p)"
+            )
+            self._run_relationship_batch(query, [{"customerGuid": "c-1", "childGuid": "p-1"}])
+
+        The query needs no RETURN: the count comes from the result summary, so
+        the server streams no rows and keeps no aggregation state.
+
+        Args:
+            query: Cypher query starting with UNWIND $rows AS row
+            rows: Parameter dicts (one per relationship); any iterable, so a
+                  generator or PairSpool is consumed one batch at a time
+            batch_size: Rows per transaction
+
+        Returns:
+            int: Relationships created (MERGEs matching an existing one count 0)
+        """
+        total = 0
+        rows = iter(rows)
+        try:
+            session = self._session()
+            while True:
+                batch = list(islice(rows, batch_size))
+                if not batch:
+                    return total
+                params = {"rows": batch}
+                total += session.execute_write(
+                    lambda tx, params=params: _relationships_created(tx.run(query, params))
+                )
+
+        except Exception as e:
+            logger.error("Relationship batch failed: %s", e)
+            logger.debug("Query: %s", query)
+            raise
+
     def batch_merge_nodes(
         self,
         label: str,
         items: List[Dict[str, Any]],
-        batch_size: int = 1000
+        batch_size: int = 1000,
+        parallel: bool = False,
+        concurrency: int = 8
     ) -> int:
         """
         Batch merge nodes using UNWIND for performance
 
+        The whole list is sent once and the server commits it every batch_size
+        rows: via apoc.periodic.iterate when APOC is installed (optionally in
+        parallel), otherwise via CALL { ... } IN TRANSACTIONS. Every item's
+        properties are copied with SET n += item, so items may have different keys.
+
+        parallel=True is off by default: MERGE on a unique guid takes locks, and
+        duplicate guids across parallel batches can contend or deadlock. Enable
+        it when items are known to be unique.
+
         Example:
             items = [
                 {"guid": "123", "name": "Customer A"},
@@ -175,7 +619,9 @@ class Neo4jBase:
         Args:
             label: Node label
             items: List of node properties
-            batch_size: Number of nodes per batch
+            batch_size: Number of nodes per server-side transaction
+            parallel: Run APOC batches concurrently (APOC path only)
+            concurrency: Parallel batch workers (when parallel=True)
 
         Returns:
             int: Total nodes merged
@@ -183,41 +629,149 @@ class Neo4jBase:
         if not items:
             return 0
 
-        total_merged = 0
+        if self._has_apoc():
+            return self._batch_merge_nodes_apoc(label, items, batch_size, parallel, concurrency)
 
-        # Process in batches
-        for i in range(0, len(items), batch_size):
-            batch = items[i:i + batch_size]
+        query = self._merge_query("unwind", label)
 
-            # Build property SET clause dynamically
-            # Assumes first item has all properties
-            if not batch:
-                continue
+        try:
+            # Auto-commit transaction: required for CALL ... IN TRANSACTIONS
+            self._session().run(query, {"items": items, "chunk": batch_size}).consume()
 
-            sample_item = batch[0]
-            set_clauses = [f"n.{key} = item.{key}" for key in sample_item.keys() if key != "guid"]
-            set_clause = ", ".join(set_clauses) if set_clauses else "n.guid = item.guid"
+        except Exception as e:
+            logger.error("Batch merge failed for %s: %s", label, e)
+            raise
 
-            query = f"""
-            UNWIND $batch AS item
-            MERGE (n:{label} {{guid: item.guid}})
-            SET {set_clause}
-            """
+        total_merged = len(items)
+        logger.info("  Merged %s %s nodes", total_merged, label)
+        return total_merged
 
-            try:
-                with self.driver.session(database=self.config.database) as session:
-                    result = session.run(query, {"batch": batch})
-                    summary = result.consume()
-                    merged = summary.counters.nodes_created + summary.counters.properties_set
-                    total_merged += len(batch)
+    def upsert_batch(
+        self,
+        label: str,
+        rows: List[Dict[str, Any]],
+        key: str = "guid",
+        batch_size: int = 1000
+    ) -> int:
+        """
+        Upsert nodes in client-side batches of one managed transaction each
 
-            except Exception as e:
-                logger.error(f"Batch merge failed for {label}: {e}")
-                raise
+        Sends UNWIND $rows AS item MERGE (n:<label> {<key>: item.<key>})
+        SET n += item per batch_size rows. Unlike batch_merge_nodes (one
+        auto-commit request, committed server-side), every batch is its own
+        execute_write, so a transient error retries only that batch, and the
+        merge key is configurable.
+
+        Example:
+            self.upsert_batch("Customer", [{"guid": "123", "name": "Customer A"}])
+            self.upsert_batch("Month", months, key="id")
+
+        Args:
+            label: Node label
+            rows: List of node properties (each must contain key)
+            key: Property identifying the node (should have a unique constraint)
+            batch_size: Rows per transaction
+
+        Returns:
+            int: Number of rows sent
+        """
+        count = self._execute_unwind(self._merge_query("rows", label, key), rows, batch_size)
+        if count:
+            logger.info("  Upserted %s %s nodes", count, label)
+        return count
 
-        logger.info(f"  Merged {total_merged} {label} nodes")
+    def _batch_merge_nodes_apoc(
+        self,
+        label: str,
+        items: List[Dict[str, Any]],
+        batch_size: int,
+        parallel: bool,
+        concurrency: int
+    ) -> int:
+        """Merge nodes server-side with apoc.periodic.iterate (see batch_merge_nodes)"""
+        query = """
+        CALL apoc.periodic.iterate($iterateQuery, $actionQuery, {
+            batchSize: $batchSize, parallel: $parallel, concurrency: $concurrency,
+            params: {items: $items}
+        })
+        YIELD committedOperations, failedOperations, errorMessages
+        RETURN committedOperations, failedOperations, errorMessages
+        """
+        params = {
+            "iterateQuery": "UNWIND $items AS item RETURN item",
+            "actionQuery": self._merge_query("apoc", label),
+            "batchSize": batch_size,
+            "parallel": parallel,
+            "concurrency": concurrency,
+            "items": items
+        }
+
+        try:
+            record = self._session().run(query, params).single()
+        except Exception as e:
+            logger.error("Batch merge failed for %s: %s", label, e)
+            raise
+
+        total_merged = record["committedOperations"] if record else 0
+        if record and record["failedOperations"]:
+            logger.warning(
+                "  ⚠ %s %s merges failed: %s",
+                record["failedOperations"], label, record["errorMessages"]
+            )
+        logger.info("  Merged %s %s nodes (APOC)", total_merged, label)
         return total_merged
 
+    def _merge_query(self, kind: str, label: str, key: str = "guid") -> str:
+        """
+        Node MERGE query for a label, built once per instance
+
+        SET n += item makes the query independent of the item keys, so one
+        string per (kind, label, key) serves every batch and every call.
+
+        Args:
+            kind: "unwind" ($items list, committed every $chunk rows server-side),
+                  "rows" (UNWIND $rows, one batch per transaction)
+                  or "apoc" (periodic.iterate action)
+            label: Node label
+            key: Merge key property
+
+        Returns:
+            str: Cypher query
+        """
+        cache_key = (kind, label, key)
+        query = self._merge_query_cache.get(cache_key)
+        if query is None:
+            merge = f"MERGE (n:{label} {{{key}: item.{key}}}) SET n += item"
+            if kind == "apoc":
+                query = merge
+            elif kind == "rows":
+                query = f"UNWIND $rows AS item {merge}"
+            else:
+                query = f"""
+                UNWIND $items AS item
+                CALL {{
+                    WITH item
+                    {merge}
+                }} IN TRANSACTIONS OF $chunk ROWS
+                """
+            self._merge_query_cache[cache_key] = query
+        return query
+
+    def _has_apoc(self) -> bool:
+        """Whether apoc.periodic.iterate is installed (checked once per instance)"""
+        if self._apoc_available is None:
+            try:
+                record = self._session().run(
+                    "SHOW PROCEDURES YIELD name "
+                    "WHERE name = 'apoc.periodic.iterate' "
+                    "RETURN count(*) > 0 AS available"
+                ).single()
+                self._apoc_available = bool(record and record["available"])
+            except Exception as e:
+                logger.debug("APOC availability check failed: %s", e)
+                self._apoc_available = False
+        return self._apoc_available
+
     # =========================================================================
     # Utilities
     # =========================================================================
@@ -248,7 +802,11 @@ class Neo4jBase:
         Returns:
             str: GUID if found, None otherwise
         """
-        nested_obj = data.get(nested_field)
-        if nested_obj and isinstance(nested_obj, dict):
-            return nested_obj.get("guid")
-        return None
+        return extract_nested_guid(data, nested_field)
+
+    # Per-field extractor for loops over many items, e.g.
+    # customer_guid = self._nested_guid_extractor("customer")
+    _nested_guid_extractor = staticmethod(nested_guid_extractor)
+
+    # result_transformer for _run_autocommit writes without RETURN
+    _relationships_created = staticmethod(_relationships_created)
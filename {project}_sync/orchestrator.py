@@ -15,13 +15,17 @@ TODO: Customize sync workflow for your specific entities
 """
 
 import logging
+import threading
 import time
-from typing import Dict
+from dataclasses import dataclass, field
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Sequence, Set, Tuple
 from datetime import datetime
 
 from .config import {API}Config, Neo4jConfig, SyncConfig
 from .{api}_client import {API}Client
 from .neo4j_base import Neo4jBase
+from .write_queue import WriteQueue
 
 # TODO: Import your entity sync modules
 # from .entities.customer import CustomerSync
@@ -43,6 +47,34 @@ from .neo4j_base import Neo4jBase
 
 logger = logging.getLogger(__name__)
 
+# Step banner lines
+_BAR = "=" * 80
+_NL_BAR = "\n" + _BAR
+
+
+@dataclass(slots=True)
+class EntityStats:
+    """Per-entity sync counters"""
+
+    synced: int = 0
+    failed: int = 0
+
+
+@dataclass(slots=True)
+class SyncStats:
+    """
+    Counters for one sync run
+
+    Entity counters are keyed by entity name, so the summary iterates them
+    directly instead of pattern-matching flat "<entity>_synced" keys.
+    """
+
+    entities: Dict[str, EntityStats] = field(default_factory=dict)
+    relationships_created: int = 0
+    relationships_failed: int = 0
+    metrics_calculated: int = 0
+    total_time_seconds: float = 0.0
+
 
 class SyncOrchestrator(Neo4jBase):
     """
@@ -52,6 +84,23 @@ class SyncOrchestrator(Neo4jBase):
     and metrics calculation.
     """
 
+    # Core entity dependency graph: entity -> entities that must sync first.
+    # Each key "<name>" runs self._sync_<name>(); entities whose prerequisites
+    # are done sync concurrently (up to ENTITY_WORKERS at once).
+    # TODO: Register your core entities, e.g.
+    #   {"customers": (), "users": (), "projects": ("customers", "users")}
+    ENTITY_DAG: Dict[str, Tuple[str, ...]] = {}
+    ENTITY_WORKERS = 4
+
+    # Relationships created during core entity sync: relationship -> entities it
+    # joins. Each key "<name>" runs self._create_<name>_relationships() (returning
+    # a count) as soon as those entities are synced, while the rest are still
+    # syncing and the just-written nodes are still in Neo4j's page cache.
+    # Don't call these again in _create_relationships.
+    # TODO: Register relationships whose endpoints are both core entities, e.g.
+    #   {"customer_project": ("customers", "projects")}
+    RELATIONSHIP_DAG: Dict[str, Tuple[str, ...]] = {}
+
     def __init__(
         self,
         api_config: {API}Config,
@@ -93,30 +142,56 @@ class SyncOrchestrator(Neo4jBase):
         # TODO: Initialize analytics module (if applicable)
         # self.analytics = AggregationNodes(neo4j_config)
 
-        # Statistics tracking
+        # Month IDs (YYYY-MM) touched by transactional sync; only these get
+        # period metrics recalculated (see Denormalization.mark_periods_dirty)
+        self.dirty_periods: Set[str] = set()
+
+        # Write-behind node upserts: entity steps enqueue rows and keep fetching,
+        # _create_relationships drains the queue before reading the nodes
+        self.write_queue = WriteQueue(self)
+
+        # Statistics tracking (steps may run concurrently: see _add_entity_stats)
         self.stats = self._initialize_stats()
+        self._stats_lock = threading.Lock()
 
-    def _initialize_stats(self) -> Dict[str, int]:
-        """Initialize statistics dictionary"""
-        return {
+    def _initialize_stats(self) -> SyncStats:
+        """Initialize statistics"""
+        return SyncStats(entities={
             # TODO: Add your entity types
-            # "customers_synced": 0,
-            # "customers_failed": 0,
-            # "users_synced": 0,
-            # "users_failed": 0,
-            # "projects_synced": 0,
-            # "projects_failed": 0,
-            "relationships_created": 0,
-            "relationships_failed": 0,
-            "metrics_calculated": 0,
-            "total_time_seconds": 0
-        }
+            # "customers": EntityStats(),
+            # "users": EntityStats(),
+            # "projects": EntityStats(),
+            # "transactions": EntityStats(),
+        })
+
+    def _add_entity_stats(self, name: str, synced: int = 0, failed: int = 0):
+        """
+        Add one batch's entity counts to the run statistics
+
+        Count in local ints inside per-row loops and call this once per batch:
+        one locked update instead of a shared-object write per row, and safe
+        when entity steps run concurrently (ENTITY_DAG, parallel_steps).
+
+        Args:
+            name: Entity name (key in stats.entities; created if missing)
+            synced: Rows synced in the batch
+            failed: Rows failed in the batch
+        """
+        with self._stats_lock:
+            entity = self.stats.entities.setdefault(name, EntityStats())
+            entity.synced += synced
+            entity.failed += failed
 
     # =========================================================================
     # Main Sync Methods
     # =========================================================================
 
-    def run_full_sync(self, create_indexes: bool = True, dry_run: bool = False) -> bool:
+    def run_full_sync(
+        self,
+        create_indexes: bool = True,
+        dry_run: bool = False,
+        parallel_steps: bool = False
+    ) -> bool:
         """
         Execute complete full sync workflow
 
@@ -131,9 +206,14 @@ class SyncOrchestrator(Neo4jBase):
         8. Create analytics aggregations
         9. Print summary
 
+        With parallel_steps, steps 3-8 run as a dependency graph (see
+        _sync_steps): independent steps overlap, so wall-clock time approaches
+        the longest dependency chain instead of the sum of all steps.
+
         Args:
             create_indexes: Whether to create Neo4j indexes
             dry_run: If True, only print what would be synced
+            parallel_steps: Run independent steps 3-8 concurrently
 
         Returns:
             bool: True if successful
@@ -141,9 +221,9 @@ class SyncOrchestrator(Neo4jBase):
         start_time = time.time()
 
         try:
-            logger.info("=" * 80)
+            logger.info(_BAR)
             logger.info("STARTING FULL SYNC")
-            logger.info("=" * 80)
+            logger.info(_BAR)
 
             # Step 1: Authenticate
             if not self._authenticate():
@@ -153,32 +233,17 @@ class SyncOrchestrator(Neo4jBase):
             if create_indexes and not dry_run:
                 self._create_indexes()
 
-            # Step 3: Sync reference data (if any)
-            if not dry_run:
-                self._sync_reference_data()
-
-            # Step 4: Sync core entities
-            if not dry_run:
-                self._sync_core_entities()
-
-            # Step 5: Sync transactional data
-            if not dry_run:
-                self._sync_transactional_data()
-
-            # Step 6: Create relationships
+            # Steps 3-8: sync, relationships, metrics, analytics
             if not dry_run:
-                self._create_relationships()
-
-            # Step 7: Calculate metrics
-            if self.sync_config.enable_metrics and not dry_run:
-                self._calculate_metrics()
-
-            # Step 8: Create analytics aggregations
-            if self.sync_config.enable_analytics and not dry_run:
-                self._create_analytics()
+                steps = self._sync_steps()
+                if parallel_steps:
+                    self._run_steps(steps)
+                else:
+                    for step, _ in steps.values():
+                        step()
 
             # Step 9: Print summary
-            self.stats["total_time_seconds"] = time.time() - start_time
+            self.stats.total_time_seconds = time.time() - start_time
             self._print_summary()
 
             return True
@@ -190,17 +255,87 @@ class SyncOrchestrator(Neo4jBase):
         finally:
             self._close_connections()
 
+    def _sync_steps(self) -> Dict[str, Tuple[Callable[[], None], Sequence[str]]]:
+        """
+        Steps 3-8 in sequential order, each with the steps it depends on
+
+        Entities only store foreign GUIDs, so the three sync steps are
+        independent; relationships need all synced nodes, and metrics and
+        analytics read the relationships.
+
+        TODO: Tighten or relax dependencies to match your entities (e.g. make a
+        step depend on "reference_data" if it reads reference nodes)
+
+        Returns:
+            Dict of step name -> (step method, names of prerequisite steps)
+        """
+        steps = {
+            "reference_data": (self._sync_reference_data, ()),
+            "core_entities": (self._sync_core_entities, ()),
+            "transactional_data": (self._sync_transactional_data, ()),
+            "relationships": (
+                self._create_relationships,
+                ("reference_data", "core_entities", "transactional_data"),
+            ),
+        }
+        if self.sync_config.enable_metrics:
+            steps["metrics"] = (self._calculate_metrics, ("relationships",))
+        if self.sync_config.enable_analytics:
+            steps["analytics"] = (self._create_analytics, ("relationships",))
+        return steps
+
+    def _run_steps(
+        self,
+        steps: Dict[str, Tuple[Callable[[], None], Sequence[str]]],
+        max_workers: int = 4
+    ):
+        """
+        Run steps as a dependency graph, each as soon as its prerequisites finish
+
+        Steps run in worker threads; Neo4jBase gives every thread its own
+        session, so step methods need no changes. A failing step stops new
+        steps from starting and is re-raised once running steps finish.
+
+        Args:
+            steps: Step name -> (callable, prerequisite step names), see _sync_steps
+            max_workers: Maximum steps running at once
+
+        Raises:
+            ValueError: If the remaining steps' prerequisites can never be met
+        """
+        pending = dict(steps)
+        done: Set[str] = set()
+        running: Dict[Future, str] = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sync-step") as pool:
+            while pending or running:
+                for name, (step, depends_on) in list(pending.items()):
+                    if done.issuperset(depends_on):
+                        del pending[name]
+                        logger.info(f"TASK_STARTED: {name}")
+                        running[pool.submit(step)] = name
+
+                if not running:
+                    raise ValueError(f"Unsatisfiable step dependencies: {sorted(pending)}")
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    future.result()  # re-raise the step's exception
+                    done.add(name)
+                    logger.info(f"TASK_COMPLETED: {name}")
+
     # =========================================================================
     # Authentication
     # =========================================================================
 
     def _authenticate(self) -> bool:
         """Authenticate with {API_NAME} API"""
-        logger.info("\n" + "=" * 80)
+        logger.info(_NL_BAR)
         logger.info("STEP 1: AUTHENTICATION")
-        logger.info("=" * 80)
+        logger.info(_BAR)
 
-        if not self.api.authenticate():
+        if not self.api.ensure_authenticated():
             logger.error("✗ Authentication failed")
             return False
 
@@ -212,9 +347,9 @@ class SyncOrchestrator(Neo4jBase):
 
     def _create_indexes(self):
         """Create Neo4j indexes and constraints"""
-        logger.info("\n" + "=" * 80)
+        logger.info(_NL_BAR)
         logger.info("STEP 2: CREATE INDEXES")
-        logger.info("=" * 80)
+        logger.info(_BAR)
 
         # TODO: Option 1 - Create indexes directly here
         # self._create_customer_indexes()
@@ -225,8 +360,26 @@ class SyncOrchestrator(Neo4jBase):
         # from .migrations.migration_001_create_indexes import run_migration
         # run_migration(self.config)
 
+        # TODO: If using analytics - period node constraints before any period MERGE
+        # self.analytics.ensure_schema()
+
+        # Foreign GUID indexes used by the relationship step
+        self._ensure_fk_indexes()
+
         logger.info("✓ Index creation completed")
 
+    def _ensure_fk_indexes(self):
+        """
+        Index every foreign GUID property that a relationship MERGE filters on
+
+        Each relationship module lists its (label, property) pairs in
+        FK_INDEX_SPECS, so a new relationship method brings its index along.
+
+        TODO: Call ensure_fk_indexes() on each relationship module
+        """
+        # self.customer_relationships.ensure_fk_indexes()
+        # self.project_relationships.ensure_fk_indexes()
+
     # TODO: Example index creation methods
     # def _create_customer_indexes(self):
     #     """Create indexes for Customer nodes"""
@@ -247,11 +400,15 @@ class SyncOrchestrator(Neo4jBase):
 
         Examples: Categories, statuses, types, regions, etc.
 
+        Decorate the client's reference fetches with
+        cache.stale_while_revalidate so repeated syncs in one process serve
+        them from memory and refresh in the background.
+
         TODO: Implement if your API has reference data
         """
-        logger.info("\n" + "=" * 80)
+        logger.info(_NL_BAR)
         logger.info("STEP 3: SYNC REFERENCE DATA")
-        logger.info("=" * 80)
+        logger.info(_BAR)
 
         # TODO: Sync reference data
         # self._sync_categories()
@@ -269,37 +426,75 @@ class SyncOrchestrator(Neo4jBase):
         Sync core entities
 
         Core entities are the main objects in your domain model.
-        Order matters - sync entities with no dependencies first!
+        Order matters - declare each entity's prerequisites in ENTITY_DAG;
+        the scheduler starts an entity once they are synced.
+
+        Relationships registered in RELATIONSHIP_DAG join the same graph: each
+        starts once both of its endpoint entities are synced, instead of
+        waiting for every entity to finish.
 
-        TODO: Implement your core entity sync
+        TODO: Implement _sync_<entity>() methods and register them in ENTITY_DAG
         """
-        logger.info("\n" + "=" * 80)
+        logger.info(_NL_BAR)
         logger.info("STEP 4: SYNC CORE ENTITIES")
-        logger.info("=" * 80)
+        logger.info(_BAR)
 
-        # TODO: Sync core entities in dependency order
-        # Example:
-        # self._sync_customers()
-        # self._sync_users()
-        # self._sync_projects()  # Depends on customers and users
+        # Dependency order comes from ENTITY_DAG; independent entities overlap
+        steps = {
+            name: (getattr(self, f"_sync_{name}"), depends_on)
+            for name, depends_on in self.ENTITY_DAG.items()
+        }
+        for name, entities in self.RELATIONSHIP_DAG.items():
+            steps[f"{name}_relationships"] = (self._relationship_step(name), entities)
+        self._run_steps(steps, max_workers=self.ENTITY_WORKERS)
 
         logger.info("✓ Core entities sync completed")
 
+    def _relationship_step(self, name: str) -> Callable[[], None]:
+        """
+        Step running self._create_<name>_relationships() for RELATIONSHIP_DAG
+
+        Waits for queued node upserts first, then adds the returned count to
+        the run statistics.
+        """
+        create = getattr(self, f"_create_{name}_relationships")
+
+        def step():
+            self.write_queue.drain()
+            count = create()
+            with self._stats_lock:
+                self.stats.relationships_created += count
+
+        return step
+
+    # TODO: Example fused relationship method (see RELATIONSHIP_DAG)
+    # def _create_customer_project_relationships(self) -> int:
+    #     return self.customer_relationships.create_customer_project_relationships()
+
     # TODO: Example entity sync methods
     # def _sync_customers(self):
     #     """Sync customers from API to Neo4j"""
     #     logger.info("\nSyncing Customers...")
-    #     customers = self.api.get_customers()
     #
-    #     for customer_data in customers:
-    #         try:
-    #             self.customer_sync.sync_customer(customer_data)
-    #             self.stats["customers_synced"] += 1
-    #         except Exception as e:
-    #             logger.error(f"Failed to sync customer {customer_data.get('guid')}: {e}")
-    #             self.stats["customers_failed"] += 1
+    #     # One UNWIND transaction per API page instead of one MERGE per customer;
+    #     # pages stream from the client, so the next fetch overlaps the current
+    #     # write and only a couple of pages are in memory. Entities without a
+    #     # field mapping can use self.customer_sync.upsert_batch("Customer", rows)
+    #     try:
+    #         synced = self.customer_sync.sync_customers_pages(self.api.iter_customer_pages())
+    #         self._add_entity_stats("customers", synced=synced)
+    #     except Exception as e:
+    #         logger.error(f"Failed to sync customers: {e}")
+    #         self._add_entity_stats("customers", failed=1)
     #
-    #     logger.info(f"✓ Synced {self.stats['customers_synced']} customers")
+    #     logger.info(f"✓ Synced {self.stats.entities['customers'].synced} customers")
+    #
+    # Write-behind variant: enqueue rows and return to fetching; the queue
+    # batches the upserts in the background and is drained before relationships
+    # (entity counts then come from self.write_queue.drain()):
+    # def _sync_users(self):
+    #     for user in self.api.iter_users():
+    #         self.write_queue.enqueue("User", self.user_sync._user_row(user))
 
     # =========================================================================
     # Transactional Data Sync
@@ -314,9 +509,9 @@ class SyncOrchestrator(Neo4jBase):
 
         TODO: Implement your transactional data sync
         """
-        logger.info("\n" + "=" * 80)
+        logger.info(_NL_BAR)
         logger.info("STEP 5: SYNC TRANSACTIONAL DATA")
-        logger.info("=" * 80)
+        logger.info(_BAR)
 
         # TODO: Sync transactional data with date ranges
         # Example:
@@ -338,17 +533,21 @@ class SyncOrchestrator(Neo4jBase):
     #
     #     logger.info(f"  Date range: {start_date} to {end_date}")
     #
-    #     transactions = self.api.get_transactions(start_date, end_date)
+    #     transactions = self.api.iter_transactions(start_date, end_date)  # streamed
     #
+    #     # Count locally, flush to the shared stats once after the loop
+    #     synced = failed = 0
     #     for txn_data in transactions:
     #         try:
     #             self.transaction_sync.sync_transaction(txn_data)
-    #             self.stats["transactions_synced"] += 1
+    #             self.dirty_periods.add(txn_data["date"][:7])  # YYYY-MM
+    #             synced += 1
     #         except Exception as e:
     #             logger.error(f"Failed to sync transaction: {e}")
-    #             self.stats["transactions_failed"] += 1
+    #             failed += 1
+    #     self._add_entity_stats("transactions", synced, failed)
     #
-    #     logger.info(f"✓ Synced {self.stats['transactions_synced']} transactions")
+    #     logger.info(f"✓ Synced {self.stats.entities['transactions'].synced} transactions")
 
     # =========================================================================
     # Relationship Creation
@@ -364,13 +563,20 @@ class SyncOrchestrator(Neo4jBase):
         grep -r "def create_.*_relationships" {project}_sync/relationships/*.py | wc -l
         grep "create_.*_relationships()" {project}_sync/orchestrator.py | wc -l
 
-        These counts MUST match!
+        These counts MUST match! Methods generated from a RELATIONSHIP_SPECS
+        table have no "def" line; count their spec rows instead. Relationships
+        in RELATIONSHIP_DAG already ran during core entity sync (step 4).
 
         TODO: Add relationship creation calls
         """
-        logger.info("\n" + "=" * 80)
+        logger.info(_NL_BAR)
         logger.info("STEP 6: CREATE RELATIONSHIPS")
-        logger.info("=" * 80)
+        logger.info(_BAR)
+
+        # Relationships MATCH the synced nodes: wait for queued upserts
+        written, failed = self.write_queue.drain()
+        if failed:
+            logger.warning(f"⚠ {failed} queued node upserts failed ({written} written)")
 
         # TODO: Create relationships
         # Example:
@@ -378,9 +584,63 @@ class SyncOrchestrator(Neo4jBase):
         # self.customer_relationships.create_customer_user_relationships()
         # self.project_relationships.create_project_owner_relationships()
         # self.project_relationships.create_project_phase_relationships()
+        #
+        # Full refresh of all customer relationship types in one query:
+        # self.stats.relationships_created += (
+        #     self.customer_relationships.merge_all_relationships()
+        # )
+        #
+        # Independent relationship types can run concurrently instead:
+        # (from .relationships.customer_relationships import RELATIONSHIP_SPECS)
+        # self.stats.relationships_created += self._run_concurrently([
+        #     getattr(self.customer_relationships, f"create_customer_{name}_relationships")
+        #     for name, _, _ in RELATIONSHIP_SPECS
+        # ])
+        #
+        # Incremental runs: pass the GUID pairs collected during entity sync so
+        # only those relationships are merged instead of scanning every node:
+        # self.customer_relationships.create_customer_project_relationships(
+        #     pairs=[{"customerGuid": p["customer"]["guid"], "childGuid": p["guid"]}
+        #            for p in synced_projects if p.get("customer")]
+        # )
+        #
+        # For millions of pairs, spool them to disk during entity sync instead
+        # (from .relationships._pairs import PairSpool):
+        # self.project_pairs = PairSpool("customer_project")     # in _sync_projects
+        # self.project_pairs.add(extract_nested_guid(p, "customer"), p["guid"])
+        # self.customer_relationships.create_customer_project_relationships(
+        #     pairs=self.project_pairs
+        # )
+        # self.project_pairs.close()
 
         logger.info("✓ Relationship creation completed")
 
+    def _run_concurrently(self, tasks: Sequence[Callable[[], int]], max_workers: int = 4) -> int:
+        """
+        Run independent count-returning tasks in parallel and sum the results
+
+        Meant for relationship methods that MERGE different relationship types.
+        Each worker thread gets its own Neo4j session from Neo4jBase._session().
+        Types still share their Customer end nodes, so deadlocks can occur:
+        GUID-pair batches are retried by execute_write, full scans (auto-commit)
+        are rerun with backoff (CustomerRelationships.SCAN_ATTEMPTS), which is
+        safe since MERGE is idempotent.
+
+        Args:
+            tasks: Callables taking no arguments and returning a count
+            max_workers: Maximum tasks running at once
+
+        Returns:
+            int: Sum of the task results
+        """
+        if not tasks:
+            return 0
+
+        workers = min(max_workers, len(tasks))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sync-rel") as pool:
+            futures = [pool.submit(task) for task in tasks]
+        return sum(future.result() for future in futures)
+
     # =========================================================================
     # Metrics Calculation
     # =========================================================================
@@ -393,14 +653,14 @@ class SyncOrchestrator(Neo4jBase):
 
         TODO: Implement if you have calculated metrics
         """
-        logger.info("\n" + "=" * 80)
+        logger.info(_NL_BAR)
         logger.info("STEP 7: CALCULATE METRICS")
-        logger.info("=" * 80)
+        logger.info(_BAR)
 
         # TODO: Calculate metrics
         # Example:
         # self.metrics.calculate_all_projects()
-        # self.stats["metrics_calculated"] = count
+        # self.stats.metrics_calculated = count
 
         logger.info("✓ Metrics calculation completed")
 
@@ -419,14 +679,22 @@ class SyncOrchestrator(Neo4jBase):
 
         TODO: Implement if you need analytics optimizations
         """
-        logger.info("\n" + "=" * 80)
+        logger.info(_NL_BAR)
         logger.info("STEP 8: CREATE ANALYTICS")
-        logger.info("=" * 80)
+        logger.info(_BAR)
 
         # TODO: Create analytics
         # Example:
         # self.analytics.create_time_series_nodes()
         # self.analytics.create_denormalized_relationships()
+        #
+        # Full refresh - period/customer/user summaries run concurrently:
+        # self.denormalization.calculate_all_summaries()
+        #
+        # Incremental period metrics (only months touched by this sync):
+        # self.denormalization.mark_periods_dirty(self.dirty_periods)
+        # self.denormalization.calculate_dirty_period_metrics()
+        # (or install_dirty_period_trigger() once and skip mark_periods_dirty)
 
         logger.info("✓ Analytics creation completed")
 
@@ -436,32 +704,31 @@ class SyncOrchestrator(Neo4jBase):
 
     def _print_summary(self):
         """Print sync summary"""
-        logger.info("\n" + "=" * 80)
+        logger.info(_NL_BAR)
         logger.info("SYNC SUMMARY")
-        logger.info("=" * 80)
+        logger.info(_BAR)
 
         # Entities
         logger.info("\nEntities Synced:")
-        for key, value in self.stats.items():
-            if "_synced" in key:
-                entity = key.replace("_synced", "").replace("_", " ").title()
-                failed = self.stats.get(key.replace("_synced", "_failed"), 0)
-                logger.info(f"  {entity}: {value} (failed: {failed})")
+        for name, entity in self.stats.entities.items():
+            title = name.replace('_', ' ').title()
+            logger.info(f"  {title}: {entity.synced} (failed: {entity.failed})")
 
         # Relationships
-        logger.info(f"\nRelationships Created: {self.stats['relationships_created']}")
+        logger.info(f"\nRelationships Created: {self.stats.relationships_created}")
 
         # Metrics
         if self.sync_config.enable_metrics:
-            logger.info(f"Metrics Calculated: {self.stats['metrics_calculated']}")
+            logger.info(f"Metrics Calculated: {self.stats.metrics_calculated}")
 
         # Time
-        logger.info(f"\nTotal Time: {self.stats['total_time_seconds']:.2f}s")
-        logger.info("=" * 80)
+        logger.info(f"\nTotal Time: {self.stats.total_time_seconds:.2f}s")
+        logger.info(_BAR)
 
     def _close_connections(self):
         """Close all connections"""
         try:
+            self.write_queue.close()
             self.close()
             # TODO: Close other connections if needed
             # self.customer_sync.close()
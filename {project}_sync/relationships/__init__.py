@@ -11,10 +11,15 @@ Relationship Modules:
 
 Pattern:
 1. Inherit from Neo4jBase
-2. One method per relationship type (create_*_relationships())
+2. One method per relationship type (create_*_relationships()); plain
+   foreign-GUID relationships are a spec row (see RELATIONSHIP_SPECS in
+   customer_relationships.py) that generates the method and its Cypher
 3. MATCH both entities by guid properties stored in source entity
 4. MERGE relationship to avoid duplicates
 5. Return count of created relationships
+6. Accept optional GUID pairs (UNWIND batches via Neo4jBase._run_relationship_batch)
+   so incremental syncs avoid scanning the whole child label; for large pair
+   sets collect them in a _pairs.PairSpool (temp NDJSON file) instead of a list
 
 Example:
 - Customer has projectGuids → create HAS_PROJECT relationships
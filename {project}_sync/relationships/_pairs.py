@@ -0,0 +1,80 @@
+"""
+Disk-backed buffer for relationship GUID pairs
+
+Entity sync collects (parent GUID, child GUID) pairs for the relationship
+step. Holding millions of pair dicts in memory costs ~100 bytes each, so
+PairSpool appends them to a temporary NDJSON file instead and streams them
+back as parameter rows; only one UNWIND batch is in memory at a time.
+"""
+
+import json
+import os
+import tempfile
+from typing import Dict, Iterator, Optional
+
+
+class PairSpool:
+    """
+    Append-only NDJSON file of (parent GUID, child GUID) pairs for one relationship type
+
+    Example:
+        with PairSpool("customer_project") as spool:
+            for project in projects:
+                spool.add(extract_nested_guid(project, "customer"), project["guid"])
+            customer_relationships.create_customer_project_relationships(pairs=spool)
+
+    Iterating yields {parent_key: ..., child_key: ...} dicts, the row shape the
+    create_*_relationships pair queries expect. Not thread-safe: add() from one
+    thread (the thread syncing that entity).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        parent_key: str = "customerGuid",
+        child_key: str = "childGuid",
+        directory: Optional[str] = None
+    ):
+        """
+        Args:
+            name: Relationship name, used as the temp file prefix
+            parent_key: Row key for the parent GUID
+            child_key: Row key for the child GUID
+            directory: Directory for the temp file (default: system temp dir)
+        """
+        self.parent_key = parent_key
+        self.child_key = child_key
+        self.count = 0
+        self._file = tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", prefix=f"{name}-", suffix=".ndjson", dir=directory, delete=False
+        )
+
+    def add(self, parent_guid: Optional[str], child_guid: Optional[str]):
+        """Append one pair; pairs with a missing GUID are skipped"""
+        if parent_guid and child_guid:
+            self._file.write(json.dumps((parent_guid, child_guid)))
+            self._file.write("\n")
+            self.count += 1
+
+    def __iter__(self) -> Iterator[Dict[str, str]]:
+        """Stream the pairs written so far as parameter rows"""
+        self._file.flush()
+        parent_key, child_key = self.parent_key, self.child_key
+        with open(self._file.name, encoding="utf-8") as reader:
+            for line in reader:
+                parent_guid, child_guid = json.loads(line)
+                yield {parent_key: parent_guid, child_key: child_guid}
+
+    def close(self):
+        """Close and delete the temp file"""
+        self._file.close()
+        try:
+            os.unlink(self._file.name)
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self) -> "PairSpool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -6,25 +6,119 @@ Creates relationships for Customer entities:
 - Customer → Contact (HAS_CONTACT)
 - Customer → Address (HAS_ADDRESS)
 - Customer → Invoice (HAS_INVOICE)
+- Customer → MarketSegment (IN_SEGMENT, many-to-many)
 
 Pattern Implementation:
 - Inherits from Neo4jBase for Neo4j operations
-- One method per relationship type
+- One RELATIONSHIP_SPECS row per relationship type; the matching
+  create_customer_<name>_relationships() method is generated from it
 - MATCH both entities, MERGE relationship
+- Optional GUID pairs: index lookups for just the synced rows instead of a label scan
 - Return count for verification
 - All methods called from orchestrator.py
 
+Many-to-many (e.g. Customer ↔ MarketSegment): neither node stores the other's
+GUID, so there is nothing to scan. Fetch the (customer, segment) pairs from the
+API's join endpoint and MERGE them in UNWIND batches; each row is two guid
+index seeks instead of a Customer × Segment cartesian product. Use a direct
+relationship when the membership has no data of its own. Use a junction node
+(e.g. (:Customer)-[:HAS_MEMBERSHIP]->(:CustomerMarketSegment)-[:OF_SEGMENT]->(:MarketSegment))
+only when it carries properties (since, role, ...) or must be queried as an
+entity. A junction costs an extra node and relationship per pair.
+
 TODO: Customize for your {API_NAME}:
-1. Create methods for your entity relationships
+1. Add a RELATIONSHIP_SPECS row per foreign-GUID relationship
 2. Verify GUID properties are stored in entity nodes
-3. Update orchestrator.py to call these methods
-4. Use grep to verify: grep "create_.*_relationships()" orchestrator.py | wc -l
+3. Update orchestrator.py to call the generated methods (or loop over the specs)
+4. Verify the spec count:
+   >>> from {project}_sync.relationships.customer_relationships import RELATIONSHIP_SPECS
+   >>> len(RELATIONSHIP_SPECS)
 """
+
 import logging
+from typing import Callable, Dict, Iterable, Optional, Tuple
 from ..neo4j_base import Neo4jBase
 
 logger = logging.getLogger(__name__)
 
+# (name, child label, relationship type): the child stores the parent Customer's
+# GUID in customerGuid. Each row generates create_customer_<name>_relationships().
+# TODO: Verify labels and relationship types in doc/{api}_doc.json, e.g.
+#   ContactPerson or Contact? HAS_CONTACT or HAS_CONTACT_PERSON?
+RELATIONSHIP_SPECS: Tuple[Tuple[str, str, str], ...] = (
+    ("project", "{Entity2}", "HAS_{ENTITY2}"),
+    ("contact", "ContactPerson", "HAS_CONTACT"),
+    ("address", "Address", "HAS_ADDRESS"),
+    ("invoice", "Invoice", "HAS_INVOICE"),
+)
+
+# (child label, foreign GUID property) read by the relationship queries
+FK_INDEX_SPECS = tuple((label, "customerGuid") for _, label, _ in RELATIONSHIP_SPECS)
+
+
+def _fk_queries(label: str, rel_type: str) -> Tuple[str, str]:
+    """Full-scan and GUID-pair MERGE queries for one Customer→child relationship
+
+    Neither returns rows; callers read relationships_created from the summary.
+    """
+    scan_query = f"""
+        MATCH (n:{label})
+        WHERE n.customerGuid IS NOT NULL
+        CALL {{
+            WITH n
+            MATCH (c:Customer {{guid: n.customerGuid}})
+            MERGE (c)-[:{rel_type}]->(n)
+        }} IN TRANSACTIONS OF $commitRows ROWS
+        """
+    pairs_query = f"""
+        UNWIND $rows AS row
+        MATCH (c:Customer {{guid: row.customerGuid}})
+        MATCH (n:{label} {{guid: row.childGuid}})
+        MERGE (c)-[:{rel_type}]->(n)
+        """
+    return scan_query, pairs_query
+
+
+def _scan_all_query(specs) -> str:
+    """One query running every full-scan MERGE as CALL { } IN TRANSACTIONS
+
+    Each section OPTIONAL MATCHes its child label, so an empty label still
+    yields a row and later sections run; WITH DISTINCT collapses a section's
+    rows to one before the next label is matched. Nothing is returned:
+    callers read relationships_created from the summary.
+    """
+    sections = []
+    for i, (_, label, rel_type) in enumerate(specs):
+        barrier = "\n        WITH DISTINCT 0 AS done" if i else ""
+        sections.append(f"""{barrier}
+        OPTIONAL MATCH (n{i}:{label}) WHERE n{i}.customerGuid IS NOT NULL
+        CALL {{
+            WITH n{i}
+            MATCH (c:Customer {{guid: n{i}.customerGuid}})
+            MERGE (c)-[:{rel_type}]->(n{i})
+        }} IN TRANSACTIONS OF $commitRows ROWS""")
+    return "".join(sections) + "\n"
+
+
+# Query text is built once at import, so every run sends byte-identical strings
+# and Neo4j's plan cache (keyed by query text) skips re-planning after the first.
+# Labels and relationship types are literal: parameterizing them (apoc.merge.relationship)
+# would keep one plan string but lose the label-specific index lookups.
+# name -> (scan query, pairs query)
+RELATIONSHIP_QUERIES: Dict[str, Tuple[str, str]] = {
+    name: _fk_queries(label, rel_type) for name, label, rel_type in RELATIONSHIP_SPECS
+}
+SCAN_ALL_QUERY = _scan_all_query(RELATIONSHIP_SPECS)
+
+# Many-to-many Customer ↔ MarketSegment from join-endpoint GUID pairs
+# TODO: Verify the segment label and relationship type in doc/{api}_doc.json
+CUSTOMER_SEGMENT_QUERY = """
+        UNWIND $rows AS row
+        MATCH (c:Customer {guid: row.customerGuid})
+        MATCH (s:MarketSegment {guid: row.segmentGuid})
+        MERGE (c)-[:IN_SEGMENT]->(s)
+        """
+
 
 class CustomerRelationships(Neo4jBase):
     """Handles creating relationships for Customer entities
@@ -44,139 +138,145 @@ class CustomerRelationships(Neo4jBase):
     2. Relationships sync: MATCH (p:Project WHERE p.customerGuid = "c-123")
                           MATCH (c:Customer {guid: "c-123"})
                           MERGE (c)-[r:HAS_PROJECT]->(p)
+
+    Every generated create_customer_<name>_relationships(pairs=None) method
+    accepts optional pairs, an iterable of
+    {"customerGuid": ..., "childGuid": ...} dicts collected during entity sync
+    (a list, or a PairSpool that keeps large pair sets on disk).
+    With pairs, only those relationships are merged (UNWIND in batches of
+    BATCH_SIZE, both ends found via the guid indexes); without, the whole
+    child label is scanned (full refresh).
     """
 
-    def create_customer_project_relationships(self) -> int:
-        """Create HAS_PROJECT relationships between Customers and Projects
+    BATCH_SIZE = 1000
 
-        Pattern:
-        - MATCH projects with customerGuid property
-        - MATCH customer with that guid
-        - MERGE relationship to avoid duplicates
-        - RETURN count for verification
+    # Rows per inner transaction for full-scan MERGEs (bounds tx state and heap)
+    SCAN_COMMIT_ROWS = 10000
+
+    # Full-scan attempts on transient errors; GUID-pair batches already run in
+    # execute_write, which the driver retries itself
+    SCAN_ATTEMPTS = 5
+
+    def merge_all_relationships(self) -> int:
+        """Full-scan MERGE of every customer relationship type in one round-trip
+
+        Replaces separate create_*_relationships() calls for a full refresh:
+        one query, planned once, committed every SCAN_COMMIT_ROWS rows.
+        If it fails part-way, batches already committed stay, and the
+        individual methods are run so each type's error is reported separately.
 
         Returns:
-            int: Number of relationships created/found
-        """
-        query = """
-        MATCH (p:{Entity2})
-        WHERE p.customerGuid IS NOT NULL
-        MATCH (c:Customer {guid: p.customerGuid})
-        MERGE (c)-[r:HAS_{ENTITY2}]->(p)
-        RETURN count(r) as count
+            int: Relationships created across all types (existing ones count 0)
         """
         try:
-            with self.driver.session(database=self.config.database) as session:
-                result = session.run(query)
-                record = result.single()
-                count = record["count"] if record else 0
-                logger.info(f"  Created {count} Customer→{Entity2} relationships")
-                return count
+            count = self._run_autocommit(
+                SCAN_ALL_QUERY,
+                {"commitRows": self.SCAN_COMMIT_ROWS},
+                self.SCAN_ATTEMPTS,
+                result_transformer=self._relationships_created,
+            )
+            logger.info(f"  Created {count} customer relationships")
+            return count
         except Exception as e:
-            logger.error(f"Failed to create Customer→{Entity2} relationships: {e}")
-            return 0
+            logger.warning(f"  ⚠ Combined relationship scan failed ({e}), running per type")
+            return sum(self._merge_fk(name) for name, _, _ in RELATIONSHIP_SPECS)
 
-    def create_customer_contact_relationships(self) -> int:
-        """Create HAS_CONTACT relationships between Customers and Contact entities
+    def ensure_fk_indexes(self) -> int:
+        """Create an index on every foreign GUID property in FK_INDEX_SPECS
 
-        Pattern: Same as create_customer_project_relationships()
-        - Contact entities have customerGuid property
-        - Match and create relationships
-
-        TODO: Verify contact entity name and relationship type for your {API_NAME}:
-        - Is it ContactPerson, Contact, or something else?
-        - Is it HAS_CONTACT or HAS_CONTACT_PERSON?
-        - Check doc/{api}_doc.json for correct names
+        Without them the full-scan queries filter each child label by
+        customerGuid with a label scan. Index names follow migration 001's
+        <Label>_<property>_idx convention, so running both is idempotent.
 
         Returns:
-            int: Number of relationships created/found
-        """
-        query = """
-        MATCH (cp:ContactPerson)
-        WHERE cp.customerGuid IS NOT NULL
-        MATCH (c:Customer {guid: cp.customerGuid})
-        MERGE (c)-[r:HAS_CONTACT]->(cp)
-        RETURN count(r) as count
+            int: Number of index statements applied
         """
-        try:
-            with self.driver.session(database=self.config.database) as session:
-                result = session.run(query)
-                record = result.single()
-                count = record["count"] if record else 0
-                logger.info(f"  Created {count} Customer→ContactPerson relationships")
-                return count
-        except Exception as e:
-            logger.error(f"Failed to create Customer→ContactPerson relationships: {e}")
-            return 0
-
-    def create_customer_address_relationships(self) -> int:
-        """Create HAS_ADDRESS relationships between Customers and Addresses
+        applied = 0
+        for label, property_name in FK_INDEX_SPECS:
+            query = f"""
+            CREATE INDEX {label}_{property_name}_idx IF NOT EXISTS
+            FOR (n:{label})
+            ON (n.{property_name})
+            """
+            try:
+                self._execute_query(query, {})
+                applied += 1
+            except Exception as e:
+                logger.error(f"Failed to create index on {label}.{property_name}: {e}")
+        return applied
 
-        Pattern: Same as create_customer_project_relationships()
-        - Address entities have customerGuid property
-        - Match and create relationships
+    def _merge_fk(self, name: str, pairs: Optional[Iterable[Dict[str, str]]] = None) -> int:
+        """Run one spec's pairs query when pairs are given, otherwise its full scan
 
-        TODO: Verify address entity name for your {API_NAME}
+        Args:
+            name: RELATIONSHIP_SPECS name (e.g. "invoice")
+            pairs: {"customerGuid", "childGuid"} dicts, or None for a full scan
 
         Returns:
-            int: Number of relationships created/found
-        """
-        query = """
-        MATCH (a:Address)
-        WHERE a.customerGuid IS NOT NULL
-        MATCH (c:Customer {guid: a.customerGuid})
-        MERGE (c)-[r:HAS_ADDRESS]->(a)
-        RETURN count(r) as count
+            int: Number of relationships created (0 on error)
         """
+        scan_query, pairs_query = RELATIONSHIP_QUERIES[name]
+        description = f"Customer→{name}"
         try:
-            with self.driver.session(database=self.config.database) as session:
-                result = session.run(query)
-                record = result.single()
-                count = record["count"] if record else 0
-                logger.info(f"  Created {count} Customer→Address relationships")
-                return count
+            if pairs is not None:
+                count = self._run_relationship_batch(pairs_query, pairs, self.BATCH_SIZE)
+            else:
+                # Commits every SCAN_COMMIT_ROWS rows (CALL { } IN TRANSACTIONS)
+                count = self._run_autocommit(
+                    scan_query,
+                    {"commitRows": self.SCAN_COMMIT_ROWS},
+                    self.SCAN_ATTEMPTS,
+                    result_transformer=self._relationships_created,
+                )
+            logger.info(f"  Created {count} {description} relationships")
+            return count
         except Exception as e:
-            logger.error(f"Failed to create Customer→Address relationships: {e}")
+            logger.error(f"Failed to create {description} relationships: {e}")
             return 0
 
-    def create_customer_invoice_relationships(self) -> int:
-        """Create HAS_INVOICE relationships between Customers and Invoices
+    def create_customer_segment_relationships(self, pairs: Iterable[Dict[str, str]]) -> int:
+        """Create IN_SEGMENT relationships between Customers and MarketSegments
 
-        Pattern: Same as create_customer_project_relationships()
-        - Invoice entities have customerGuid property
-        - Match and create relationships
+        Many-to-many: the pairs come from the API's membership/join endpoint
+        (or a PairSpool(..., child_key="segmentGuid") filled during customer
+        sync), never from a label scan. Both ends are found via guid indexes.
 
-        TODO: Verify invoice entity name for your {API_NAME}
+        Args:
+            pairs: {"customerGuid": ..., "segmentGuid": ...} dicts
 
         Returns:
-            int: Number of relationships created/found
-        """
-        query = """
-        MATCH (i:Invoice)
-        WHERE i.customerGuid IS NOT NULL
-        MATCH (c:Customer {guid: i.customerGuid})
-        MERGE (c)-[r:HAS_INVOICE]->(i)
-        RETURN count(r) as count
+            int: Number of relationships created (0 on error)
         """
         try:
-            with self.driver.session(database=self.config.database) as session:
-                result = session.run(query)
-                record = result.single()
-                count = record["count"] if record else 0
-                logger.info(f"  Created {count} Customer→Invoice relationships")
-                return count
+            count = self._run_relationship_batch(CUSTOMER_SEGMENT_QUERY, pairs, self.BATCH_SIZE)
+            logger.info(f"  Created {count} Customer→MarketSegment relationships")
+            return count
         except Exception as e:
-            logger.error(f"Failed to create Customer→Invoice relationships: {e}")
+            logger.error(f"Failed to create Customer→MarketSegment relationships: {e}")
             return 0
 
-    # TODO: Add more relationship methods following the same pattern
-    # Example:
-    # def create_customer_market_segment_relationships(self) -> int:
-    #     """Create Customer→MarketSegment relationships via junction table
-    #
-    #     For many-to-many relationships:
-    #     - Create junction node entity first (e.g., CustomerMarketSegment)
-    #     - Then create relationships through junction
-    #     - This represents proper graph structure for complex relationships
-    #     """
-    #     pass
+
+def _relationship_method(name: str, label: str, rel_type: str) -> Callable[..., int]:
+    """Build create_customer_<name>_relationships for one RELATIONSHIP_SPECS row"""
+
+    def method(
+        self: CustomerRelationships, pairs: Optional[Iterable[Dict[str, str]]] = None
+    ) -> int:
+        return self._merge_fk(name, pairs)
+
+    method.__name__ = f"create_customer_{name}_relationships"
+    method.__qualname__ = f"CustomerRelationships.{method.__name__}"
+    method.__doc__ = (
+        f"Create {rel_type} relationships between Customers and {label} nodes\n\n"
+        f'Args:\n    pairs: Optional {{"customerGuid", "childGuid"}} dicts; None scans all\n\n'
+        f"Returns:\n    int: Number of relationships created"
+    )
+    return method
+
+
+for _name, _label, _rel_type in RELATIONSHIP_SPECS:
+    setattr(
+        CustomerRelationships,
+        f"create_customer_{_name}_relationships",
+        _relationship_method(_name, _label, _rel_type),
+    )
@@ -0,0 +1,179 @@
+"""
+Write-Behind Queue
+==================
+Decouples entity sync from Neo4j write speed.
+
+Entity sync enqueues (label, properties) rows and moves on to the next API
+page; a background thread collects them per label and upserts them with
+Neo4jBase.upsert_batch once the buffered rows reach max_bytes or the oldest
+row is max_age seconds old. API fetch I/O and database write I/O overlap,
+whichever side is slower.
+
+Call drain() before anything reads the written nodes (the orchestrator does
+so at the start of the relationship step).
+"""
+
+import json
+import logging
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .neo4j_base import Neo4jBase
+
+logger = logging.getLogger(__name__)
+
+# Control markers sent through the queue alongside (label, properties) rows
+_DRAIN = object()
+_STOP = object()
+
+
+class WriteQueue:
+    """
+    Background batch writer for node upserts
+
+    Example:
+        write_queue = WriteQueue(neo4j_writer)
+        for page in api.iter_customer_pages():
+            for customer in page:
+                write_queue.enqueue("Customer", build_row(customer))
+        written, failed = write_queue.drain()
+        write_queue.close()
+
+    enqueue() is thread-safe, so concurrent entity steps can share one queue.
+    """
+
+    def __init__(
+        self,
+        writer: Neo4jBase,
+        max_bytes: int = 10_000_000,
+        max_age: float = 300.0,
+        key: str = "guid",
+        batch_size: int = 1000
+    ):
+        """
+        Args:
+            writer: Neo4jBase instance whose upsert_batch() writes the rows
+            max_bytes: Flush once buffered rows reach this JSON size
+            max_age: Flush once the oldest buffered row is this many seconds old
+            key: Merge key property (passed to upsert_batch)
+            batch_size: Rows per write transaction
+        """
+        self.writer = writer
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.key = key
+        self.batch_size = batch_size
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._pending: Dict[str, List[Dict[str, Any]]] = {}
+        self._pending_bytes = 0
+        self._oldest: Optional[float] = None
+        self.written = 0
+        self.failed = 0
+
+        self._thread = threading.Thread(target=self._run, name="neo4j-write-queue", daemon=True)
+        self._thread.start()
+
+    def enqueue(self, label: str, properties: Dict[str, Any]):
+        """Queue one node upsert (properties must contain the merge key)"""
+        self._queue.put((label, properties))
+
+    def drain(self) -> Tuple[int, int]:
+        """
+        Block until every row enqueued so far is written
+
+        If the background thread has stopped (after close()), the remaining
+        rows are written on the calling thread instead of waiting forever.
+
+        Returns:
+            Tuple of (rows written, rows failed) since the queue was created
+        """
+        if self._thread.is_alive():
+            done = threading.Event()
+            self._queue.put((_DRAIN, done))
+            while not done.wait(timeout=1.0):
+                if not self._thread.is_alive():  # stopped by a concurrent close()
+                    break
+        if not self._thread.is_alive():
+            self._write_remaining()
+        return self.written, self.failed
+
+    def close(self):
+        """Write remaining rows and stop the background thread"""
+        if self._thread.is_alive():
+            self._queue.put((_STOP, None))
+            self._thread.join()
+
+    # =========================================================================
+    # Background Thread
+    # =========================================================================
+
+    def _run(self):
+        while True:
+            timeout = None
+            if self._oldest is not None:
+                timeout = max(0.0, self._oldest + self.max_age - time.monotonic())
+            try:
+                label, item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                label, item = None, None  # max_age reached with no new rows
+
+            # Never let one bad row end the thread: drain() callers wait on it
+            try:
+                if label is None or label is _DRAIN or label is _STOP:
+                    self._flush()
+                else:
+                    self._buffer(label, item)
+            except Exception as e:
+                logger.error("✗ Write queue error: %s", e)
+
+            if label is _DRAIN:
+                item.set()
+            elif label is _STOP:
+                return
+
+    def _write_remaining(self):
+        """Buffer and write queued rows on the calling thread (worker stopped)"""
+        while True:
+            try:
+                label, item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if label is _DRAIN:
+                item.set()
+            elif label is not _STOP:
+                try:
+                    self._buffer(label, item)
+                except Exception as e:
+                    logger.error("✗ Write queue error: %s", e)
+        self._flush()
+
+    def _buffer(self, label: str, properties: Dict[str, Any]):
+        # Size the row before buffering it: a row json can't encode is dropped and
+        # counted as failed instead of being written and counted with the batch
+        try:
+            size = len(json.dumps(properties, default=str))
+        except (TypeError, ValueError) as e:
+            logger.error("✗ Write queue dropped a %s row: %s", label, e)
+            self.failed += 1
+            return
+        self._pending.setdefault(label, []).append(properties)
+        self._pending_bytes += size
+        if self._oldest is None:
+            self._oldest = time.monotonic()
+        if self._pending_bytes >= self.max_bytes or time.monotonic() - self._oldest >= self.max_age:
+            self._flush()
+
+    def _flush(self):
+        """Upsert all buffered rows, one upsert_batch call per label"""
+        pending, self._pending = self._pending, {}
+        self._pending_bytes = 0
+        self._oldest = None
+        for label, rows in pending.items():
+            try:
+                self.written += self.writer.upsert_batch(label, rows, self.key, self.batch_size)
+            except Exception as e:
+                logger.error("✗ Write queue failed to upsert %d %s nodes: %s", len(rows), label, e)
+                self.failed += len(rows)
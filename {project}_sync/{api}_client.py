@@ -5,23 +5,187 @@ HTTP client for {API_NAME} API with authentication, pagination, and retry logic.
 
 Features:
 - OAuth 2.0 authentication with automatic token refresh
+- Optional on-disk token cache reused across runs (SYNC_TOKEN_CACHE)
+- Optional conditional GETs (ETag / Last-Modified) per endpoint (SYNC_ETAG_CACHE)
 - Token-based pagination support
-- Exponential backoff retry logic
-- Rate limiting handling
+- Concurrent page fetches for page-number/offset pagination
+- Optional in-run memoization of repeated list requests (_make_request(cacheable=True))
+- Exponential backoff retry logic (full jitter, honors Retry-After)
+- Rate limiting handling (optional client-side token bucket)
+- Circuit breaker: fail fast while the API is down instead of retrying every request
 - Request timeout configuration
 
 TODO: Customize for your specific API
 """
 
+import json
+import math
+import os
+import random
+import threading
 import time
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
+from typing import Dict, Iterator, List, Optional, Any, Sequence, Tuple
 import requests
+from requests.adapters import HTTPAdapter
 
-from .config import {API}Config
+from .config import {API}Config, AuthState
+from .http_cache import EtagCache
+
+try:
+    import orjson  # Optional: C-speed decoding of large response pages
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Longest backoff between retries (seconds); the exponent stops growing at
+# 2 ** 8, well past the cap, so a large attempt count cannot overflow the wait
+BACKOFF_CAP = 60.0
+_MAX_BACKOFF_EXPONENT = 8
+
+
+def _backoff(attempt: int, cap: float = BACKOFF_CAP) -> float:
+    """
+    Full-jitter exponential backoff: uniform in [0, min(2 ** attempt, cap)]
+
+    Randomizing the whole interval spreads out clients that failed together,
+    instead of having them all retry at 1, 2, 4, 8s and overload the API again.
+    """
+    return random.uniform(0, min(2 ** min(attempt, _MAX_BACKOFF_EXPONENT), cap))
+
+
+def _decode_json(response: requests.Response) -> Any:
+    """Decode a JSON response body (orjson on the raw bytes when available)"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _whole_body(data: Any) -> Any:
+    """Items extractor for APIs whose response body is the item list itself"""
+    return data
+
+
+def _loads(body: bytes) -> Any:
+    """Decode a stored JSON body (orjson when available)"""
+    return orjson.loads(body) if orjson is not None else json.loads(body)
+
+
+def _retry_after(response: Any, attempt: int) -> float:
+    """
+    Seconds from a numeric Retry-After header, otherwise _backoff(attempt)
+
+    The header is clamped to [0, BACKOFF_CAP]; "inf"/"nan" fall back to the
+    backoff, so a bad header cannot stall a worker thread indefinitely.
+    """
+    try:
+        seconds = float(response.headers["Retry-After"])
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return _backoff(attempt)
+    if not math.isfinite(seconds):
+        return _backoff(attempt)
+    return min(BACKOFF_CAP, max(0.0, seconds))
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket pacing requests to rate per second
+
+    Holds up to capacity tokens (the burst) and refills continuously. Each
+    acquire() takes one token, sleeping until it is available; callers
+    reserve their slot under the lock, so concurrent threads queue up
+    instead of all waking at once.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Args:
+            rate: Tokens added per second (sustained requests/second)
+            capacity: Maximum tokens (requests allowed back-to-back)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until one is available"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            self.tokens -= 1
+            wait_time = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait_time:
+            time.sleep(wait_time)
+
+    def penalize(self):
+        """Push the bucket into debt after a 429 so following requests slow down"""
+        with self._lock:
+            self.tokens = min(-1.0, self.tokens - self.rate)
+
+
+class CircuitOpen(Exception):
+    """Raised instead of sending a request while the circuit breaker is open"""
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker for an unavailable API
+
+    After fail_threshold consecutive failures (5xx or network errors) the
+    circuit opens and before_request() raises CircuitOpen for reset_seconds,
+    so every page thread stops hammering a down API with its own retry loop.
+    Once reset_seconds pass, one request is let through as a probe (the
+    others keep failing fast): success closes the circuit, failure reopens it.
+    """
+
+    def __init__(self, fail_threshold: int = 5, reset_seconds: float = 30.0):
+        """
+        Args:
+            fail_threshold: Consecutive failures that open the circuit
+            reset_seconds: Seconds the circuit stays open before a probe request
+        """
+        self.fail_threshold = fail_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def before_request(self):
+        """Raise CircuitOpen unless a request may be sent now"""
+        with self._lock:
+            if self.opened_at is None:
+                return
+            now = time.monotonic()
+            remaining = self.opened_at + self.reset_seconds - now
+            if remaining > 0:
+                raise CircuitOpen(
+                    f"API circuit open after {self.failures} failures, retry in {remaining:.0f}s"
+                )
+            self.opened_at = now  # Half-open: this request probes, others wait another period
+
+    def record_success(self):
+        """Close the circuit"""
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        """Count a failure, opening the circuit at fail_threshold"""
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.fail_threshold:
+                if self.opened_at is None:
+                    logger.warning(
+                        "API circuit opened after %d consecutive failures", self.failures
+                    )
+                self.opened_at = time.monotonic()
+
 
 class {API}Client:
     """
@@ -32,6 +196,13 @@ class {API}Client:
     TODO: Adjust authentication method for your API (OAuth, API key, JWT, etc.)
     """
 
+    # Keep-alive connections kept per host (at least config.parallel_requests)
+    HTTP_POOL_SIZE = 32
+
+    # Consecutive 5xx/network failures that open the circuit, and seconds it stays open
+    CIRCUIT_FAIL_THRESHOLD = 5
+    CIRCUIT_RESET_SECONDS = 30.0
+
     def __init__(self, config: {API}Config):
         """
         Initialize API client
@@ -40,12 +211,68 @@ class {API}Client:
             config: {API_NAME} API configuration
         """
         self.config = config
+        self.auth = AuthState()
         self.session = requests.Session()
         self.session.headers.update({
+            "User-Agent": "{project}-sync/0.1.0",
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate"  # JSON compresses 5-10x; decoded transparently
+        })
+
+        # Reuse connections across pages and threads instead of a TCP/TLS
+        # handshake per request. The default pool (10) is smaller than
+        # concurrent page fetches need; pool_block=False opens an extra
+        # short-lived connection rather than waiting when it is exhausted.
+        # Idle pooled connections can be dropped by NATs/load balancers; a
+        # request on one fails fast and is retried by _make_single_request.
+        pool_size = max(self.HTTP_POOL_SIZE, config.parallel_requests)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, pool_block=False)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Token requests go through their own session: they never carry the
+        # (possibly expired) Bearer header of the API session, and a token
+        # refresh does not hold one of its pooled connections.
+        self._auth_session = requests.Session()
+        self._auth_session.headers.update({
             "User-Agent": "{project}-sync/0.1.0",
             "Accept": "application/json"
         })
 
+        # Optional client-side pacing (SYNC_RATE_LIMIT); None = unlimited
+        self.rate_limiter = (
+            TokenBucket(config.rate_limit, config.rate_burst) if config.rate_limit > 0 else None
+        )
+
+        # Shared by all threads of this client (parallel page fetches, fetch_all)
+        self.circuit_breaker = CircuitBreaker(
+            self.CIRCUIT_FAIL_THRESHOLD, self.CIRCUIT_RESET_SECONDS
+        )
+
+        # Reuse a still-valid token from a previous run (SYNC_TOKEN_CACHE)
+        self._load_cached_token()
+
+        # Stored bodies + validators for conditional GETs (SYNC_ETAG_CACHE); None = off
+        self.etag_cache = EtagCache(config.etag_cache_path) if config.etag_cache_path else None
+
+        # Memoized _make_request(cacheable=True) results for this client's
+        # lifetime: {(endpoint, sorted params, paginated): items}
+        self._response_cache: Dict[Tuple, List[Dict]] = {}
+
+        # Response-shape accessors, bound once instead of looked up per page.
+        # A page missing the configured key raises KeyError rather than
+        # silently syncing nothing (wrong items_key).
+        self._extract_items = itemgetter(config.items_key) if config.items_key else _whole_body
+        self._next_token_header = config.next_token_header
+
+        # Retryable HTTP statuses -> handler returning the wait before the next
+        # attempt, or None to give up (any status not listed is raised at once)
+        self._status_handlers = {
+            401: self._handle_unauthorized,
+            429: self._handle_rate_limited,
+            **{status: self._handle_server_error for status in range(500, 600)}
+        }
+
     # =========================================================================
     # Authentication
     # =========================================================================
@@ -67,33 +294,106 @@ class {API}Client:
 
         try:
             # TODO: Implement your authentication flow
-            # Example: OAuth 2.0 client credentials
-            response = self.session.post(
+            # Example: OAuth 2.0 client credentials (RFC 6749 token requests are form-encoded)
+            response = self._auth_session.post(
                 f"{self.config.api_url}/oauth/token",
-                json={
+                data={
                     "grant_type": "client_credentials",
                     "client_id": self.config.client_id,
                     "client_secret": self.config.client_secret
                 },
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
                 timeout=self.config.request_timeout
             )
             response.raise_for_status()
 
             data = response.json()
-            self.config.token = data["access_token"]
-
-            # Set authorization header
-            self.session.headers.update({
-                "Authorization": f"Bearer {self.config.token}"
-            })
+            expires_in = data.get("expires_in")
+            self._set_token(data["access_token"], time.time() + expires_in if expires_in else 0.0)
+            self._save_cached_token()
 
             logger.info("✓ Authentication successful")
             return True
 
         except requests.exceptions.RequestException as e:
-            logger.error(f"✗ Authentication failed: {e}")
+            logger.error("✗ Authentication failed: %s", e)
             return False
 
+    def ensure_authenticated(self) -> bool:
+        """
+        Authenticate unless a token loaded from the token cache is still valid
+
+        Returns:
+            bool: True if a usable token is set
+        """
+        if self._token_valid():
+            logger.info("✓ Reusing cached {API_NAME} token")
+            return True
+        return self.authenticate()
+
+    def _set_token(self, token: str, expires_at: float):
+        """Store the token and send it on every API request (not on token requests)"""
+        self.auth.token = token
+        self.auth.expires_at = expires_at
+        self.session.headers.update({
+            "Authorization": f"Bearer {token}"
+        })
+
+    def _token_valid(self, margin: float = 60.0) -> bool:
+        """True if a token is set and known to be valid for at least margin seconds"""
+        return bool(self.auth.token) and self.auth.expires_at > time.time() + margin
+
+    def _token_cache_key(self) -> str:
+        """Identifies the credentials a cached token belongs to"""
+        return f"{self.config.api_url}|{self.config.client_id}"
+
+    def _load_cached_token(self) -> bool:
+        """Load an unexpired token for these credentials from config.token_cache_path"""
+        path = self.config.token_cache_path
+        if not path:
+            return False
+        try:
+            with open(os.path.expanduser(path), encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached["key"] != self._token_cache_key():
+                return False
+            self._set_token(cached["access_token"], float(cached["expires_at"]))
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        if not self._token_valid():
+            self._clear_token()
+            return False
+        return True
+
+    def _save_cached_token(self):
+        """Write the current token to config.token_cache_path (owner-only permissions)"""
+        path = self.config.token_cache_path
+        if not path or not self._token_valid():
+            return
+        path = os.path.expanduser(path)
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({
+                    "key": self._token_cache_key(),
+                    "access_token": self.auth.token,
+                    "expires_at": self.auth.expires_at
+                }, f)
+        except OSError as e:
+            logger.warning("⚠ Could not write token cache %s: %s", path, e)
+
+    def _clear_token(self):
+        """Forget the current token and delete the token cache file"""
+        self.auth.token = None
+        self.auth.expires_at = 0.0
+        self.session.headers.pop("Authorization", None)
+        if self.config.token_cache_path:
+            try:
+                os.unlink(os.path.expanduser(self.config.token_cache_path))
+            except OSError:
+                pass
+
     # =========================================================================
     # Request Methods
     # =========================================================================
@@ -102,12 +402,81 @@ class {API}Client:
         self,
         endpoint: str,
         params: Optional[Dict] = None,
-        paginated: bool = True
+        paginated: bool = True,
+        conditional: bool = False,
+        cacheable: bool = False
     ) -> List[Dict]:
         """
         Make HTTP GET request with automatic pagination
 
-        Handles token-based pagination and collects all pages.
+        Collects all pages into one list. For large endpoints prefer
+        _iter_items / _iter_pages, which hold one page in memory at a time.
+
+        With cacheable=True the result is memoized per endpoint and params for
+        the life of this client, so lookup lists read once per referencing
+        entity cost one fetch per sync run (call clear_cache() between runs
+        in a long-lived process). Across runs, see cache.stale_while_revalidate.
+        Param values must be hashable. Two threads missing at once both fetch.
+
+        Args:
+            endpoint: API endpoint path (e.g., "/customers")
+            params: Query parameters
+            paginated: Whether to automatically paginate
+            conditional: Revalidate pages with ETag / Last-Modified (see _make_single_request)
+            cacheable: Serve repeated calls from the in-memory cache
+
+        Returns:
+            List of items from all pages (a new list; cached items are shared)
+        """
+        if not cacheable:
+            return list(self._iter_items(endpoint, params, paginated, conditional))
+
+        key = (endpoint, tuple(sorted((params or {}).items())), paginated)
+        items = self._response_cache.get(key)
+        if items is None:
+            items = list(self._iter_items(endpoint, params, paginated, conditional))
+            self._response_cache[key] = items
+        return list(items)  # Shallow copy: callers may reorder/extend their list
+
+    def clear_cache(self):
+        """Drop memoized _make_request(cacheable=True) results"""
+        self._response_cache.clear()
+
+    def _iter_items(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        paginated: bool = True,
+        conditional: bool = False
+    ) -> Iterator[Dict]:
+        """
+        Yield items one by one, fetching the next page when the current one is used up
+
+        Args:
+            endpoint: API endpoint path (e.g., "/customers")
+            params: Query parameters
+            paginated: Whether to automatically paginate
+            conditional: Revalidate pages with ETag / Last-Modified
+
+        Yields:
+            Items from all pages, in order
+        """
+        for items in self._iter_pages(endpoint, params, paginated, conditional):
+            yield from items
+
+    def _iter_pages(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        paginated: bool = True,
+        conditional: bool = False
+    ) -> Iterator[List[Dict]]:
+        """
+        Yield one item list per page, fetching each page on demand
+
+        Handles token-based pagination. Memory stays at one page regardless of
+        the endpoint size, and the page lists feed the entity sync_*_pages()
+        loaders directly, so fetching overlaps Neo4j writes.
 
         TODO: Adjust pagination logic for your API:
         - Token-based pagination (NextPageToken header)
@@ -119,37 +488,40 @@ class {API}Client:
             endpoint: API endpoint path (e.g., "/customers")
             params: Query parameters
             paginated: Whether to automatically paginate
+            conditional: Revalidate pages with ETag / Last-Modified
 
-        Returns:
-            List of items from all pages
+        Yields:
+            List of items per page
         """
         url = f"{self.config.api_url}{endpoint}"
-        all_items = []
+        total = 0
         next_page_token = None
         page_num = 1
 
-        params = params or {}
+        # One copy per request: only the page key changes between pages
+        paginated_params = dict(params or {})
 
         while True:
             # TODO: Adjust pagination parameter for your API
-            paginated_params = params.copy()
             if paginated and next_page_token:
                 paginated_params["pageToken"] = next_page_token  # Token-based
                 # OR: paginated_params["offset"] = page_num * self.config.batch_size  # Offset-based
                 # OR: paginated_params["cursor"] = next_page_token  # Cursor-based
                 # OR: paginated_params["page"] = page_num  # Page number-based
 
-            logger.info(f"  Fetching {endpoint} (page {page_num})...")
+            logger.info("  Fetching %s (page %d)...", endpoint, page_num)
 
             # Make single request with retry logic
-            data, next_page_token = self._make_single_request(url, paginated_params)
+            data, next_page_token = self._make_single_request(
+                url, paginated_params, conditional=conditional
+            )
 
-            # Extract items from response
-            # TODO: Adjust for your API response structure
-            items = data.get("items", [])  # Or data.get("results"), or just data if list
-            all_items.extend(items)
+            # Extract items from response ({API}Config.items_key)
+            items = self._extract_items(data)
+            total += len(items)
 
-            logger.info(f"    Got {len(items)} items (total: {len(all_items)})")
+            logger.info("    Got %d items (total: %d)", len(items), total)
+            yield items
 
             # Check if more pages
             if not paginated or not next_page_token:
@@ -157,89 +529,238 @@ class {API}Client:
 
             page_num += 1
 
-        logger.info(f"✓ Fetched {len(all_items)} total items from {endpoint}")
+        logger.info("✓ Fetched %d total items from %s", total, endpoint)
+
+    def _make_request_parallel(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None
+    ) -> List[Dict]:
+        """
+        Make HTTP GET request fetching pages concurrently
+
+        For page-number (or offset) pagination only: page 1 is fetched first
+        to learn the total count, then pages 2..N are fetched by up to
+        config.parallel_requests threads, so wall time is roughly
+        N / parallel_requests round-trips instead of N. Token/cursor
+        pagination is inherently sequential: use _make_request for it.
+        Items are returned in page order.
+
+        TODO: Adjust the page parameters and total-count field for your API
+
+        Args:
+            endpoint: API endpoint path (e.g., "/customers")
+            params: Query parameters
+
+        Returns:
+            List of items from all pages
+        """
+        url = f"{self.config.api_url}{endpoint}"
+        params = params or {}
+        page_size = self.config.batch_size
+
+        def fetch_page(page: int) -> List[Dict]:
+            # TODO: Adjust pagination parameters for your API
+            page_params = {**params, "page": page, "per_page": page_size}
+            # OR: page_params = {**params, "offset": (page - 1) * page_size, "limit": page_size}
+            data, _ = self._make_single_request(url, page_params)
+            return self._extract_items(data)
+
+        logger.info("  Fetching %s (page 1)...", endpoint)
+        data, _ = self._make_single_request(url, {**params, "page": 1, "per_page": page_size})
+        all_items = self._extract_items(data)
+
+        # TODO: Adjust for your API's total count field
+        total = data.get("totalCount", len(all_items))
+        last_page = -(-total // page_size)  # ceil
+
+        if last_page > 1:
+            logger.info(
+                "  Fetching %s pages 2-%d (%d in flight)...",
+                endpoint, last_page, self.config.parallel_requests
+            )
+            with ThreadPoolExecutor(
+                max_workers=self.config.parallel_requests, thread_name_prefix="api-page"
+            ) as pool:
+                for items in pool.map(fetch_page, range(2, last_page + 1)):
+                    all_items.extend(items)
+
+        logger.info("✓ Fetched %d total items from %s", len(all_items), endpoint)
         return all_items
 
+    def fetch_all(
+        self,
+        specs: Sequence[Tuple[str, Optional[Dict]]],
+        max_workers: int = 8
+    ) -> Dict[str, List[Dict]]:
+        """
+        Fetch independent endpoints concurrently, each with full pagination
+
+        Each endpoint's pagination loop runs in its own thread; requests
+        releases the GIL while waiting on the network, so the loops overlap.
+        The session is shared: its pool (HTTP_POOL_SIZE) keeps one keep-alive
+        connection per thread, and the optional rate limiter still paces the
+        combined requests.
+
+        Example:
+            data = client.fetch_all([("/customers", None), ("/users", {"active": "true"})])
+            customers, users = data["/customers"], data["/users"]
+
+        Args:
+            specs: (endpoint, params) pairs with distinct endpoints
+            max_workers: Maximum endpoints fetched at once
+
+        Returns:
+            Dict of endpoint -> list of items
+        """
+        if not specs:
+            return {}
+
+        results = {}
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(specs)), thread_name_prefix="api-fetch"
+        ) as pool:
+            futures = {
+                pool.submit(self._make_request, endpoint, params): endpoint
+                for endpoint, params in specs
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        return results
+
     def _make_single_request(
         self,
         url: str,
-        params: Dict
+        params: Dict,
+        conditional: bool = False
     ) -> Tuple[Dict, Optional[str]]:
         """
         Make single HTTP request with retry logic and exponential backoff
 
         Handles:
+        - 304 Not Modified (conditional requests): Decode the stored body
         - 401 Unauthorized: Re-authenticate and retry
-        - 429 Too Many Requests: Exponential backoff
-        - 5xx Server Errors: Retry with backoff
-        - Network errors: Retry with backoff
+        - 429 Too Many Requests: Wait Retry-After, else jittered exponential backoff
+        - 5xx Server Errors: Retry with backoff (Retry-After honored)
+        - Network errors: Retry with jittered backoff
+        - Circuit open (repeated 5xx/network failures): Raise CircuitOpen without a request
+
+        With conditional=True and an etag_cache, the stored ETag / Last-Modified
+        of the same URL and params are sent, and 200 responses carrying either
+        validator are stored. Opt in only for endpoints whose page parameters
+        are stable between runs: cursor tokens that change every run never hit.
 
         Args:
             url: Full URL to request
             params: Query parameters
+            conditional: Send and store validators for this request
 
         Returns:
             Tuple of (response data, next page token)
         """
+        cache_key = cached = None
+        if conditional and self.etag_cache:
+            cache_key = EtagCache.key(url, params)
+            cached = self.etag_cache.get(cache_key)
+
         for attempt in range(self.config.max_retries):
             try:
+                self.circuit_breaker.before_request()
+                if self.rate_limiter:
+                    self.rate_limiter.acquire()
                 response = self.session.get(
                     url,
                     params=params,
-                    timeout=self.config.request_timeout
+                    headers=cached.validators() if cached else None,
+                    timeout=self.config.request_timeout,
+                    stream=False  # read the body now so the connection returns to the pool
                 )
+                if cached and response.status_code == 304:
+                    self.circuit_breaker.record_success()
+                    return _loads(cached.body), cached.next_token
                 response.raise_for_status()
+                self.circuit_breaker.record_success()
 
-                data = response.json()
+                data = _decode_json(response)
 
-                # Extract next page token
+                # Extract next page token ({API}Config.next_token_header)
                 # TODO: Adjust for your API pagination
-                next_token = response.headers.get("NextPageToken")  # Header-based
+                next_token = response.headers.get(self._next_token_header)  # Header-based
                 # OR: next_token = data.get("nextPageToken")  # Body-based
                 # OR: next_token = data.get("pagination", {}).get("next")
 
+                if cache_key:
+                    etag = response.headers.get("ETag")
+                    last_modified = response.headers.get("Last-Modified")
+                    if etag or last_modified:
+                        self.etag_cache.put(
+                            cache_key, etag, last_modified, response.content, next_token
+                        )
+
                 return data, next_token
 
-            except requests.exceptions.HTTPError as e:
-                if e.response.status_code == 401:
-                    # Unauthorized - re-authenticate
-                    logger.warning("Token expired, re-authenticating...")
-                    if self.authenticate():
-                        continue  # Retry with new token
-                    else:
-                        raise
-
-                elif e.response.status_code == 429:
-                    # Rate limited - exponential backoff
-                    wait_time = 2 ** attempt
-                    logger.warning(f"Rate limited, waiting {wait_time}s...")
-                    time.sleep(wait_time)
-                    continue
-
-                elif 500 <= e.response.status_code < 600:
-                    # Server error - retry with backoff
-                    wait_time = 2 ** attempt
-                    logger.warning(f"Server error {e.response.status_code}, waiting {wait_time}s...")
-                    time.sleep(wait_time)
-                    continue
-
-                else:
-                    # Other HTTP error - don't retry
+            except requests.exceptions.HTTPError:
+                # Only raise_for_status() raises HTTPError, so response is the rejected one
+                handler = self._status_handlers.get(response.status_code)
+                wait_time = handler(response, attempt) if handler else None
+                if wait_time is None:
+                    if response.status_code < 500:
+                        # The API answered: resolve a half-open probe instead of leaving
+                        # the circuit open until the next reset period
+                        self.circuit_breaker.record_success()
                     raise
 
             except requests.exceptions.RequestException as e:
-                # Network error - retry with backoff
-                if attempt < self.config.max_retries - 1:
-                    wait_time = 2 ** attempt
-                    logger.warning(f"Request failed ({e}), waiting {wait_time}s...")
-                    time.sleep(wait_time)
-                    continue
-                else:
+                wait_time = self._handle_network_error(e, attempt)
+                if wait_time is None:
                     raise
 
+            if wait_time:
+                time.sleep(wait_time)
+
         # Max retries exceeded
         raise Exception(f"Max retries ({self.config.max_retries}) exceeded for {url}")
 
+    # =========================================================================
+    # Retry Handlers
+    # =========================================================================
+    # Each returns the seconds to wait before the next attempt, or None to
+    # re-raise the error. _make_single_request does the sleeping.
+
+    def _handle_unauthorized(self, response: requests.Response, attempt: int) -> Optional[float]:
+        """401: drop the (cached) token and re-authenticate; retry at once if that worked"""
+        logger.warning("Token expired, re-authenticating...")
+        self._clear_token()
+        return 0.0 if self.authenticate() else None
+
+    def _handle_rate_limited(self, response: requests.Response, attempt: int) -> Optional[float]:
+        """429: slow the token bucket down; wait Retry-After, else jittered backoff"""
+        if self.rate_limiter:
+            self.rate_limiter.penalize()
+        wait_time = _retry_after(response, attempt)
+        logger.warning("Rate limited, waiting %.1fs...", wait_time)
+        return wait_time
+
+    def _handle_server_error(self, response: requests.Response, attempt: int) -> Optional[float]:
+        """5xx: count toward the circuit breaker; wait Retry-After (503), else jittered backoff"""
+        self.circuit_breaker.record_failure()
+        wait_time = _retry_after(response, attempt)
+        logger.warning("Server error %s, waiting %.1fs...", response.status_code, wait_time)
+        return wait_time
+
+    def _handle_network_error(
+        self,
+        error: requests.exceptions.RequestException,
+        attempt: int
+    ) -> Optional[float]:
+        """Connection error / timeout: jittered backoff, giving up on the last attempt"""
+        self.circuit_breaker.record_failure()
+        if attempt >= self.config.max_retries - 1:
+            return None
+        wait_time = _backoff(attempt)
+        logger.warning("Request failed (%s), waiting %.1fs...", error, wait_time)
+        return wait_time
+
     # =========================================================================
     # Entity-Specific Methods
     # =========================================================================
@@ -247,23 +768,38 @@ class {API}Client:
     #
     # Example patterns:
     #
-    # def get_customers(self) -> List[Dict]:
-    #     """Fetch all customers"""
-    #     return self._make_request("/customers")
+    # def iter_customer_pages(self) -> Iterator[List[Dict]]:
+    #     """Stream customers page by page (for CustomerSync.sync_customers_pages)"""
+    #     return self._iter_pages("/customers")
+    #
+    # def iter_customers(self) -> Iterator[Dict]:
+    #     """Stream all customers, one page in memory at a time"""
+    #     return self._iter_items("/customers")
     #
     # def get_users(self) -> List[Dict]:
-    #     """Fetch all users"""
-    #     return self._make_request("/users")
+    #     """Fetch all users (page-number pagination: pages fetched concurrently)"""
+    #     return self._make_request_parallel("/users")
+    #
+    # def iter_users(self) -> Iterator[Dict]:
+    #     """Stream all users"""
+    #     return self._iter_items("/users")
     #
     # def get_projects(self, customer_id: Optional[str] = None) -> List[Dict]:
-    #     """Fetch projects, optionally filtered by customer"""
+    #     """Fetch projects, optionally filtered by customer (memoized for the run)"""
     #     params = {"customerId": customer_id} if customer_id else {}
-    #     return self._make_request("/projects", params=params)
+    #     return self._make_request("/projects", params=params, cacheable=True)
+    #
+    # Reference data (rarely changes): serve cached, refresh in the background
+    # (from .cache import stale_while_revalidate)
+    # @stale_while_revalidate(ttl=3600, stale_ttl=86400)
+    # def get_categories(self) -> List[Dict]:
+    #     """Fetch categories (unchanged pages come back as 304 with SYNC_ETAG_CACHE)"""
+    #     return self._make_request("/categories", conditional=True)
     #
-    # def get_transactions(self, start_date: str, end_date: str) -> List[Dict]:
-    #     """Fetch transactions within date range"""
+    # def iter_transactions(self, start_date: str, end_date: str) -> Iterator[Dict]:
+    #     """Stream transactions within date range"""
     #     params = {"startDate": start_date, "endDate": end_date}
-    #     return self._make_request("/transactions", params=params)
+    #     return self._iter_items("/transactions", params=params)
     #
     # def get_{entity}(self) -> List[Dict]:
     #     """Fetch {entity} data"""